@@ -16,8 +16,31 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from multi_model_chatbot import MultiModelChatbot
 from longcat_chatbot import LongcatChatbot
+from zai.core.compression import get_compression_stats
+from zai.core.deadline import Deadline
+from zai.core.exceptions import DeadlineExceeded
+from zai.core.hedging import get_hedge_stats
+from zai.core.http_client import DEFAULT_HEADERS
+from zai.core.retry import get_retry_stats
+from zai.core.token_cache import get_token_cache
+from zai.operations.catalog import get_catalog_stats
+from zai.core.transport import get_registry
+from zai.utils.flask_json import CodecJSONProvider
 
 app = Flask(__name__)
+app.json = CodecJSONProvider(app)
+
+# Upstream hosts whose pooled connections are opened at startup and kept warm
+UPSTREAM_HOSTS = ["https://chat.z.ai", "https://longcat.chat", "https://api.gpt-oss.com"]
+
+def start_keepwarm():
+    """Open pooled upstream connections and keep them warm
+    
+    Called from the __main__ block and, under gunicorn, from the post_fork
+    hook in gunicorn.conf.py, so each worker is warm before its first
+    request and importing the module opens no connections.
+    """
+    get_registry().start_keepwarm(UPSTREAM_HOSTS, headers={"user-agent": DEFAULT_HEADERS["user-agent"]})
 
 # Global chatbot instances
 multi_chatbot = None
@@ -69,6 +92,19 @@ def debug_info():
         }
     })
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Upstream connection pool, retry, stream compression, hedging, guest token and model catalog cache metrics"""
+    return jsonify({
+        "pools": get_registry().stats(),
+        "retries": get_retry_stats().to_dict(),
+        "compression": get_compression_stats().to_dict(),
+        "hedging": get_hedge_stats().to_dict(),
+        "auth": get_token_cache().stats.to_dict(),
+        "models": get_catalog_stats(),
+        "timestamp": time.time()
+    })
+
 @app.route('/api/providers', methods=['GET'])
 def list_providers():
     """List available model providers"""
@@ -79,13 +115,15 @@ def list_providers():
             return jsonify({"error": "Multi chatbot not initialized", "status": "initialization_failed"}), 500
     
     try:
+        multi_chatbot.refresh_provider_states()
         providers = {}
         for key, provider in multi_chatbot.providers.items():
             providers[key] = {
                 "name": provider.name,
                 "models": provider.models,
                 "available": provider.available,
-                "error_message": provider.error_message
+                "error_message": provider.error_message,
+                "circuit": provider.breaker.to_dict() if provider.breaker else None
             }
         
         return jsonify({
@@ -142,9 +180,10 @@ def chat_longcat():
         return jsonify({"error": "Message is required"}), 400
     
     message = data['message']
+    deadline = Deadline.from_header(request.headers.get('X-Request-Timeout'))
     
     try:
-        response = longcat_chatbot.send_message(message)
+        response = longcat_chatbot.send_message(message, deadline=deadline)
         
         return jsonify({
             "response": response,
@@ -152,6 +191,8 @@ def chat_longcat():
             "model": "longcat-chat",
             "timestamp": time.time()
         })
+    except DeadlineExceeded as e:
+        return jsonify({"error": f"Longcat error: {str(e)}"}), 504
     except Exception as e:
         return jsonify({"error": f"Longcat error: {str(e)}"}), 500
 
@@ -184,6 +225,7 @@ def home():
         "endpoints": {
             "/health": "Health check",
             "/api/providers": "List available providers",
+            "/api/metrics": "Upstream connection pool, retry, stream compression, hedging, guest token and model catalog cache metrics",
             "/api/chat/multi": "Chat with multi-model chatbot (POST)",
             "/api/chat/longcat": "Chat with Longcat (POST)",
             "/api/chat/longcat/history": "Get Longcat history",
@@ -195,6 +237,7 @@ def home():
 if __name__ == '__main__':
     # Initialize chatbots at startup (but don't block if it fails)
     print("🚀 Starting Multi-Model Chatbot API...")
+    start_keepwarm()
     initialize_chatbots()
     
     # Get port from environment variable (Render sets this)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ZAIClient.batch_chat throughput at rising max_concurrency against
+a local server with a fixed per-request latency, next to the plain
+simple_chat for-loop it replaces
+"""
+
+import argparse
+import time
+
+from benchmark_bootstrap import start_server
+from zai import ZAIClient
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--prompts", type=int, default=128, help="prompts per batch")
+    parser.add_argument("--rtt", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--first-token", type=float, default=0.1, help="seconds until the first streamed event")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32], help="max_concurrency values")
+    args = parser.parse_args()
+
+    server, url = start_server(0.0, args.rtt, args.first_token)
+    client = ZAIClient(token="benchmark-token", base_url=url)
+    prompts = [f"Prompt {i}" for i in range(args.prompts)]
+
+    start = time.perf_counter()
+    for prompt in prompts:
+        client.simple_chat(prompt)
+    loop_rate = args.prompts / (time.perf_counter() - start)
+    print(f"{'for-loop':<18} {loop_rate:8.1f} prompts/s")
+
+    for concurrency in args.concurrency:
+        start = time.perf_counter()
+        results = client.batch_chat(prompts, max_concurrency=concurrency)
+        rate = args.prompts / (time.perf_counter() - start)
+        failed = sum(not result.ok for result in results)
+        print(
+            f"{f'concurrency {concurrency}':<18} {rate:8.1f} prompts/s"
+            f"   ({rate / loop_rate:5.1f}x the loop, {rate / loop_rate / concurrency:4.0%} of linear, {failed} failed)"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: startup-to-first-token of a ZAIClient that gets its guest token,
+model catalog and connections one after the other versus one started with
+bootstrap=True, against a local server that adds latency to every step
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from mock_server import MockHandler, MockServer
+from zai import ZAIClient
+
+MODEL = "glm-4.5v"
+
+
+def start_server(connect, rtt, first_token):
+    """Run a Z.AI-shaped HTTP server in a thread
+
+    Every new connection costs ``connect`` seconds (standing in for DNS,
+    TCP and TLS), every request ``rtt`` seconds, and the completion
+    stream sends its first event after ``first_token`` seconds.
+    """
+
+    class Handler(MockHandler):
+        def setup(self):
+            time.sleep(connect)
+            super().setup()
+
+        def reply(self, body):
+            time.sleep(rtt)
+            super().reply(200, body)
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("content-length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            if self.path.startswith("/api/v1/auths"):
+                self.reply(json.dumps({"token": "guest-token", "name": "Guest"}).encode())
+            else:
+                self.reply(json.dumps({"data": []}).encode())
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("content-length", 0)))
+            if self.path == "/api/v1/chats/new":
+                self.reply(json.dumps({"id": "chat-id"}).encode())
+                return
+            time.sleep(first_token)
+            self.start_chunked()
+            for data in ({"phase": "answer", "delta_content": "Hello"}, {"phase": "answer", "done": True}):
+                self.write_chunk(f"data: {json.dumps({'type': 'chat:completion', 'data': data})}\n\n".encode())
+            self.write_chunk(b"")
+
+    return MockServer(Handler)
+
+
+def serial(url):
+    """Token in the constructor, then the catalog, then the chat"""
+    client = ZAIClient(base_url=url, cache_token=False)
+    client.get_models()
+    return client
+
+
+def bootstrapped(url):
+    """Everything started at once; the chat waits only for the token"""
+    return ZAIClient(base_url=url, cache_token=False, bootstrap=True)
+
+
+def first_token(start_client, args):
+    """Seconds from creating the client to the first streamed chunk"""
+    with start_server(args.connect, args.rtt, args.first_token) as server:
+        start = time.perf_counter()
+        client = start_client(server.url)
+        stream = client.conversation(model=MODEL).stream("Hello")
+        next(stream)
+        elapsed = time.perf_counter() - start
+        stream.close()
+        client.ready.result()
+        return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connect", type=float, default=0.1, help="seconds to open a connection")
+    parser.add_argument("--rtt", type=float, default=0.1, help="seconds per request")
+    parser.add_argument("--first-token", type=float, default=0.2, help="seconds until the first streamed event")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per mode, the median is reported")
+    args = parser.parse_args()
+
+    results = {}
+    for name, start_client in (("serial", serial), ("bootstrap", bootstrapped)):
+        results[name] = statistics.median(first_token(start_client, args) for _ in range(args.repeat))
+        print(f"{name:<10} startup to first token {results[name] * 1000:7.1f}ms")
+
+    saved = results["serial"] - results["bootstrap"]
+    print(f"\nbootstrap saves {saved * 1000:.1f}ms ({results['serial'] / results['bootstrap']:.2f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
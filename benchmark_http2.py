@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTTP/1.1 vs HTTP/2 transports of the zai HTTPClient
+against local TLS test servers streaming Z.AI-style SSE responses
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+
+from zai.core import HTTPClient, HTTP2Transport
+
+
+class ServerStats:
+    """Connections and streams seen by a test server"""
+
+    def __init__(self):
+        self.connections = 0
+        self.streams = 0
+        self.lock = threading.Lock()
+
+    def count(self, name):
+        with self.lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+def sse_events(chunks):
+    """Encoded SSE events shaped like /api/chat/completions output"""
+    for i in range(chunks):
+        data = {"type": "chat:completion", "data": {"delta_content": f"token{i} ", "phase": "answer"}}
+        yield f"data: {json.dumps(data)}\n\n".encode()
+    done = {"type": "chat:completion", "data": {"done": True, "phase": "done"}}
+    yield f"data: {json.dumps(done)}\n\n".encode()
+
+
+def make_certificate(directory):
+    """Create a self-signed certificate for 127.0.0.1"""
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1", "-subj", "/CN=127.0.0.1",
+            "-addext", "subjectAltName=IP:127.0.0.1"
+        ],
+        check=True,
+        capture_output=True
+    )
+    return cert, key
+
+
+def server_context(cert, key, protocols):
+    """TLS context that only offers the given ALPN protocols"""
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    context.set_alpn_protocols(protocols)
+    return context
+
+
+class H2Protocol(asyncio.Protocol):
+    """Minimal h2 server answering every stream with SSE events"""
+
+    def __init__(self, stats, chunks, delay):
+        self.stats = stats
+        self.chunks = chunks
+        self.delay = delay
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.stats.count("connections")
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.flush()
+
+    def flush(self):
+        data = self.conn.data_to_send()
+        if data and not self.transport.is_closing():
+            self.transport.write(data)
+
+    def data_received(self, data):
+        try:
+            events = self.conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self.flush()
+            self.transport.close()
+            return
+
+        for event in events:
+            if isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.ensure_future(self.respond(event.stream_id))
+        self.flush()
+
+    async def respond(self, stream_id):
+        self.stats.count("streams")
+        try:
+            self.conn.send_headers(stream_id, [(":status", "200"), ("content-type", "text/event-stream")])
+            self.flush()
+            for payload in sse_events(self.chunks):
+                await asyncio.sleep(self.delay)
+                self.conn.send_data(stream_id, payload)
+                self.flush()
+            self.conn.end_stream(stream_id)
+            self.flush()
+        except h2.exceptions.StreamClosedError:
+            pass
+
+
+def start_h2_server(cert, key, stats, chunks, delay):
+    """Run the h2 server on a background event loop, return its URL"""
+    loop = asyncio.new_event_loop()
+    context = server_context(cert, key, ["h2"])
+    server = loop.run_until_complete(
+        loop.create_server(lambda: H2Protocol(stats, chunks, delay), "127.0.0.1", 0, ssl=context)
+    )
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    port = server.sockets[0].getsockname()[1]
+    return f"https://127.0.0.1:{port}"
+
+
+def start_h1_server(cert, key, stats, chunks, delay):
+    """Run a keep-alive HTTP/1.1 TLS server in a thread, return its URL"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("content-length", 0)))
+            stats.count("streams")
+            self.send_response(200)
+            self.send_header("content-type", "text/event-stream")
+            self.send_header("transfer-encoding", "chunked")
+            self.end_headers()
+            for payload in sse_events(chunks):
+                time.sleep(delay)
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(payload), payload))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+
+        def get_request(self):
+            sock, addr = super().get_request()
+            stats.count("connections")
+            return sock, addr
+
+    server = Server(("127.0.0.1", 0), Handler)
+    server.socket = server_context(cert, key, ["http/1.1"]).wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"https://127.0.0.1:{server.server_address[1]}"
+
+
+def run(label, url, stats, concurrency, requests_per_worker, cert, transport=None):
+    """Stream completions from many threads and print a summary line"""
+    latencies = []
+    versions = set()
+    lock = threading.Lock()
+    payload = {"stream": True, "messages": [{"role": "user", "content": "hello"}]}
+
+    def worker(_):
+        client = HTTPClient(base_url=url, timeout=30, transport=transport)
+        client.session.trust_env = False
+        client.session.verify = cert
+        for _ in range(requests_per_worker):
+            start = time.perf_counter()
+            response = client.make_request("POST", "/api/chat/completions", payload, stream=True)
+            events = sum(1 for line in response.iter_lines() if line.startswith(b"data: "))
+            response.close()
+            with lock:
+                latencies.append(time.perf_counter() - start)
+                versions.add(getattr(response, "http_version", None) or f"HTTP/{response.raw.version / 10:.1f}")
+            assert events > 0
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    print(
+        f"{label:<26} {','.join(sorted(versions)):<10} wall {wall:6.2f}s  "
+        f"p50 {statistics.median(latencies) * 1000:7.1f}ms  "
+        f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:7.1f}ms  "
+        f"streams {stats.streams:4d}  TLS connections {stats.connections:3d}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=64, help="concurrent streams")
+    parser.add_argument("--requests", type=int, default=3, help="streams per worker")
+    parser.add_argument("--chunks", type=int, default=20, help="SSE events per stream")
+    parser.add_argument("--delay", type=float, default=0.005, help="seconds between SSE events")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        client_context = ssl.create_default_context(cafile=cert)
+
+        print(f"{args.concurrency} workers x {args.requests} streams, {args.chunks} events each\n")
+
+        h1_stats = ServerStats()
+        h1_url = start_h1_server(cert, key, h1_stats, args.chunks, args.delay)
+        run("requests (HTTP/1.1)", h1_url, h1_stats, args.concurrency, args.requests, cert)
+
+        h2_stats = ServerStats()
+        h2_url = start_h2_server(cert, key, h2_stats, args.chunks, args.delay)
+        transport = HTTP2Transport(max_connections=4, verify=client_context)
+        run("HTTP2Transport (h2)", h2_url, h2_stats, args.concurrency, args.requests, cert, transport)
+        transport.close()
+
+        fallback_stats = ServerStats()
+        fallback_url = start_h1_server(cert, key, fallback_stats, args.chunks, args.delay)
+        transport = HTTP2Transport(max_connections=args.concurrency, verify=client_context)
+        run("HTTP2Transport (fallback)", fallback_url, fallback_stats, args.concurrency, args.requests, cert, transport)
+        transport.close()
+
+
+if __name__ == "__main__":
+    main()
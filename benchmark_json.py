@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: stdlib json versus the pluggable JSON codec on a Longcat request
+with 200 history messages and on streamed SSE event payloads
+"""
+
+import argparse
+import json
+import random
+import time
+
+from zai.utils.json_codec import JSONCodec, orjson
+
+SAMPLE_TEXT = (
+    "Sure! Here is a step-by-step explanation with a short example. "
+    "Première étape: définir les entrées — then validate them, 然后返回结果. "
+)
+
+
+def longcat_payload(history):
+    """Longcat chat-completion body as built by LongcatChatbot.send_message"""
+    rng = random.Random(7)
+    messages = []
+    for i in range(history):
+        role = "user" if i % 2 == 0 else "assistant"
+        messages.append({
+            "role": role,
+            "content": SAMPLE_TEXT * rng.randint(1, 12),
+            "chatStatus": "FINISHED",
+            "messageId": rng.randint(10000000, 99999999),
+            "idType": "custom"
+        })
+    messages.append({"role": "user", "content": "And now?", "chatStatus": "FINISHED",
+                     "messageId": 12345678, "idType": "custom"})
+    messages.append({"role": "assistant", "content": "", "chatStatus": "LOADING",
+                     "messageId": 87654321, "idType": "custom"})
+    return {
+        "content": "And now?",
+        "messages": messages,
+        "reasonEnabled": 0,
+        "searchEnabled": 0,
+        "regenerate": 0
+    }
+
+
+def sse_payloads(count):
+    """Data payloads of Longcat and Z.AI stream events, as bytes off the wire"""
+    payloads = []
+    for i in range(count):
+        if i % 2:
+            event = {"choices": [{"delta": {"content": f"tok{i} ", "role": "assistant"}, "index": 0}],
+                     "lastOne": False, "messageId": 87654321}
+        else:
+            event = {"type": "chat:completion", "data": {"delta_content": f"tok{i} ", "phase": "answer"}}
+        payloads.append(json.dumps(event).encode())
+    return payloads
+
+
+def rate(fn, repeat, number):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return number / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--history", type=int, default=200, help="history messages in the Longcat payload")
+    parser.add_argument("--events", type=int, default=10000, help="SSE payloads to decode per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, best is reported")
+    args = parser.parse_args()
+
+    payload = longcat_payload(args.history)
+    events = sse_payloads(args.events)
+    old_body = json.dumps(payload).encode("utf-8")
+
+    codecs = [JSONCodec("json")] + ([JSONCodec("orjson")] if orjson else [])
+    print(f"Longcat payload: {len(payload['messages'])} messages, {len(old_body) / 1024:.0f} KiB as stdlib json")
+    if not orjson:
+        print("orjson not installed, only the stdlib fallback is measured")
+    print()
+
+    baseline_encode = rate(lambda: json.dumps(payload).encode("utf-8"), args.repeat, 200)
+    baseline_decode = rate(lambda: [json.loads(event.decode("utf-8")) for event in events], args.repeat, 5) * len(events)
+    print(f"{'codec':<22} {'encode payload':>16} {'decode events':>16} {'body size':>10}")
+    print(f"{'stdlib json (before)':<22} {baseline_encode:>12,.0f}/s {baseline_decode:>12,.0f}/s {len(old_body):>10,}")
+
+    for codec in codecs:
+        body = codec.dumps(payload)
+        assert codec.loads(body) == payload
+        encode = rate(lambda: codec.dumps(payload), args.repeat, 200)
+        decode = rate(lambda: [codec.loads(event) for event in events], args.repeat, 5) * len(events)
+        print(
+            f"{'codec: ' + codec.backend:<22} {encode:>12,.0f}/s {decode:>12,.0f}/s {len(body):>10,}"
+            f"   ({encode / baseline_encode:.1f}x encode, {decode / baseline_decode:.1f}x decode)"
+        )
+
+
+if __name__ == "__main__":
+    main()
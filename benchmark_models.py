@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark: slotted zai.models dataclasses versus the same dataclasses with a
+per-instance __dict__, on StreamingChunk creation and on parsing a ChatResponse
+with a long message history
+"""
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+
+from zai import models
+from zai.models import ChatResponse, StreamingChunk
+
+SAMPLE_TEXT = "Here is the next part of the answer, with a little more detail. "
+
+
+class DictSlot:
+    """Stands in for a slot descriptor of a lazy field on an unslotted class"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        return obj.__dict__[self.name]
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+def unslotted(cls):
+    """The same dataclass with a per-instance __dict__, as the models were before"""
+    names = {f.name for f in dataclasses.fields(cls)}
+    namespace = {key: value for key, value in vars(cls).items() if not key.startswith("__") and key not in names}
+    fields = []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default=f.default)))
+        elif f.default_factory is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default_factory=f.default_factory)))
+        else:
+            fields.append((f.name, f.type))
+    copy = dataclasses.make_dataclass(cls.__name__, fields, namespace=namespace)
+    for name in names:
+        lazy = vars(cls)[name]
+        if hasattr(lazy, "build"):
+            setattr(copy, name, type(lazy)(DictSlot(name), lazy.build))
+    return copy
+
+
+@contextmanager
+def unslotted_models(*names):
+    """Swap models used by the from_dict constructors for unslotted copies"""
+    originals = {name: getattr(models, name) for name in names}
+    for name, cls in originals.items():
+        setattr(models, name, unslotted(cls))
+    try:
+        yield
+    finally:
+        for name, cls in originals.items():
+            setattr(models, name, cls)
+
+
+def chat_response_data(count):
+    """/api/v1/chats/new response with a history of count messages"""
+    messages = []
+    parent = None
+    for i in range(count):
+        message_id = str(uuid.uuid4())
+        messages.append({
+            "id": message_id,
+            "parentId": parent,
+            "childrenIds": [],
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": SAMPLE_TEXT * (1 + i % 4),
+            "timestamp": 1700000000 + i,
+            "models": ["0727-360B-API"]
+        })
+        parent = message_id
+    return {
+        "id": "chat-id",
+        "user_id": "user-id",
+        "title": "Benchmark",
+        "updated_at": 1700000000,
+        "created_at": 1700000000,
+        "chat": {
+            "id": "chat-id",
+            "title": "Benchmark",
+            "models": ["0727-360B-API"],
+            "history": {"messages": {m["id"]: m for m in messages}, "currentId": parent},
+            "messages": messages
+        }
+    }
+
+
+def read_history(response):
+    """Materialize the lazily parsed chat and its history"""
+    chat = response.chat
+    return response, chat.messages, chat.history
+
+
+def make_chunks(chunk_cls, count):
+    return [
+        chunk_cls(type="chat:completion", phase="answer", delta_content="tok ", message_id="m")
+        for _ in range(count)
+    ]
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def retained(fn):
+    """Bytes still allocated by the objects fn returns"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        size = tracemalloc.get_traced_memory()[0]
+        del result
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def report(name, before_time, after_time, before_bytes, after_bytes, unit, count):
+    print(
+        f"{name:<28} {count / before_time:>12,.0f}{unit} {count / after_time:>12,.0f}{unit}"
+        f" {before_bytes / 2**20:>9.1f} MiB {after_bytes / 2**20:>8.1f} MiB"
+        f"   ({before_time / after_time:.2f}x throughput, {after_bytes / before_bytes:.2f}x memory)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=1000000, help="StreamingChunks created per run")
+    parser.add_argument("--messages", type=int, default=10000, help="messages in the ChatResponse")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best is reported")
+    args = parser.parse_args()
+
+    print(f"{'case':<28} {'__dict__':>14} {'slots':>14} {'mem before':>13} {'mem after':>12}")
+
+    dict_chunk = unslotted(StreamingChunk)
+    report(
+        f"{args.chunks:,} StreamingChunks",
+        best_time(lambda: make_chunks(dict_chunk, args.chunks), args.repeat),
+        best_time(lambda: make_chunks(StreamingChunk, args.chunks), args.repeat),
+        retained(lambda: make_chunks(dict_chunk, args.chunks)),
+        retained(lambda: make_chunks(StreamingChunk, args.chunks)),
+        "/s", args.chunks
+    )
+
+    data = chat_response_data(args.messages)
+    with unslotted_models("Message", "ChatHistory", "MCPFeature", "Chat", "ChatResponse"):
+        dict_response = models.ChatResponse
+        before_time = best_time(lambda: read_history(dict_response.from_dict(data)), args.repeat)
+        before_bytes = retained(lambda: read_history(dict_response.from_dict(data)))
+    report(
+        f"ChatResponse, {args.messages:,} msgs",
+        before_time,
+        best_time(lambda: read_history(ChatResponse.from_dict(data)), args.repeat),
+        before_bytes,
+        retained(lambda: read_history(ChatResponse.from_dict(data))),
+        "/s", 1
+    )
+
+    eager = best_time(lambda: read_history(ChatResponse.from_dict(data)), args.repeat)
+    lazy = best_time(lambda: ChatResponse.from_dict(data).id, args.repeat)
+    print(
+        f"\nChatResponse.from_dict reading only the id: {1 / lazy:,.0f}/s"
+        f" versus {1 / eager:,.0f}/s when the whole history is read ({eager / lazy:,.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Z.AI request bodies built as dicts and encoded per request versus
+the precompiled payload templates, in build time and peak memory per request
+"""
+
+import argparse
+import time
+import tracemalloc
+import types
+import uuid
+
+from zai.models import Chat
+from zai.operations.chat import ChatOperations
+from zai.operations.model import ModelOperations
+from zai.utils.json_codec import dumps, loads
+
+MODEL = "0727-360B-API"
+SAMPLE_TEXT = "Summarize the trade-offs of connection pooling for a chat backend. "
+
+
+def dict_features(enable_thinking):
+    """Features block as the dict builders made it"""
+    return {
+        "image_generation": False,
+        "web_search": False,
+        "auto_web_search": False,
+        "preview_mode": True,
+        "flags": [],
+        "features": [
+            {"type": "mcp", "server": "vibe-coding", "status": "hidden"},
+            {"type": "mcp", "server": "ppt-maker", "status": "hidden"},
+            {"type": "mcp", "server": "image-search", "status": "hidden"}
+        ],
+        "enable_thinking": enable_thinking
+    }
+
+
+def dict_variables():
+    """Template variables as the dict builders made them"""
+    return {
+        "{{USER_NAME}}": "Guest",
+        "{{USER_LOCATION}}": "Unknown",
+        "{{CURRENT_DATETIME}}": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "{{CURRENT_DATE}}": time.strftime("%Y-%m-%d"),
+        "{{CURRENT_TIME}}": time.strftime("%H:%M:%S"),
+        "{{CURRENT_WEEKDAY}}": time.strftime("%A"),
+        "{{CURRENT_TIMEZONE}}": "America/New_York",
+        "{{USER_LANGUAGE}}": "en-US"
+    }
+
+
+def dict_completion(model_ops, chat_id, message):
+    """One-shot completion body, built as a dict and encoded"""
+    return dumps({
+        "stream": True,
+        "model": MODEL,
+        "messages": [{"role": "user", "content": message}],
+        "params": {},
+        "features": dict_features(True),
+        "variables": dict_variables(),
+        "model_item": model_ops.build_model_item(MODEL, None, None, None),
+        "chat_id": chat_id,
+        "id": str(uuid.uuid4())
+    })
+
+
+def dict_chat(chat):
+    """Chat creation body, every message built and encoded twice"""
+    def message_dict(msg):
+        return {
+            "id": msg.id,
+            "parentId": msg.parentId,
+            "childrenIds": msg.childrenIds,
+            "role": msg.role,
+            "content": msg.content,
+            "timestamp": msg.timestamp,
+            "models": msg.models
+        }
+
+    return dumps({
+        "chat": {
+            "id": chat.id,
+            "title": chat.title,
+            "models": chat.models,
+            "params": chat.params,
+            "history": {
+                "messages": {msg.id: message_dict(msg) for msg in chat.messages},
+                "currentId": chat.history.currentId
+            },
+            "messages": [message_dict(msg) for msg in chat.messages],
+            "tags": chat.tags,
+            "flags": chat.flags,
+            "features": [
+                {"type": feat.type, "server": feat.server, "status": feat.status}
+                for feat in chat.features
+            ],
+            "mcp_servers": chat.mcp_servers,
+            "enable_thinking": chat.enable_thinking,
+            "timestamp": chat.timestamp
+        }
+    })
+
+
+def without_volatile(body):
+    """Decoded body with the per-request id and clock fields dropped"""
+    document = loads(body)
+    document.pop("id", None)
+    document.pop("variables", None)
+    return document
+
+
+def rate(fn, repeat, number):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return number / best
+
+
+def allocated(fn, number=200):
+    """Average peak memory a call allocates on top of what was in use"""
+    fn()
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(number):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            fn()
+            total += tracemalloc.get_traced_memory()[1] - base
+        return total / number
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--history", type=int, default=20, help="messages in the chat creation payload")
+    parser.add_argument("--number", type=int, default=2000, help="payloads built per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, best is reported")
+    args = parser.parse_args()
+
+    http_client = types.SimpleNamespace(base_url="https://chat.z.ai", verbose=False)
+    model_ops = ModelOperations(http_client)
+    chat_ops = ChatOperations(http_client, model_ops)
+
+    chat = Chat(title="Benchmark", models=[MODEL])
+    for i in range(args.history):
+        chat.add_message(SAMPLE_TEXT * (1 + i % 5), "user" if i % 2 == 0 else "assistant", [MODEL])
+    chat_id = str(uuid.uuid4())
+
+    cases = [
+        (
+            "completion",
+            lambda: dict_completion(model_ops, chat_id, SAMPLE_TEXT),
+            lambda: chat_ops._build_completion_payload(chat_id, SAMPLE_TEXT, MODEL, True, None, None, None)
+        ),
+        (
+            f"chat, {args.history} messages",
+            lambda: dict_chat(chat),
+            lambda: chat_ops._build_chat_payload(chat)
+        )
+    ]
+
+    print(f"{'payload':<22} {'dict + encode':>16} {'template':>16} {'peak before':>12} {'peak after':>11}")
+    for name, before, after in cases:
+        assert without_volatile(before()) == without_volatile(after()), name
+        before_rate = rate(before, args.repeat, args.number)
+        after_rate = rate(after, args.repeat, args.number)
+        before_bytes = allocated(before)
+        after_bytes = allocated(after)
+        print(
+            f"{name:<22} {before_rate:>14,.0f}/s {after_rate:>14,.0f}/s {before_bytes:>10,.0f} B {after_bytes:>9,.0f} B"
+            f"   ({after_rate / before_rate:.1f}x throughput, {after_bytes / before_bytes:.2f}x peak memory)"
+        )
+
+
+if __name__ == "__main__":
+    main()
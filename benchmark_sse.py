@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: SSE parsing with iter_lines + SSEParser.parse_line
+versus the byte-level SSEDecoder, in events/sec
+"""
+
+import argparse
+import io
+import json
+import time
+
+import requests
+
+from zai.utils.sse_parser import SSEParser, iter_sse_data
+
+
+def build_stream(events, keepalive_every):
+    """Z.AI-shaped SSE body with periodic keep-alive comments"""
+    parts = []
+    for i in range(events):
+        data = {
+            "type": "chat:completion",
+            "data": {"delta_content": f"tok{i} ", "phase": "answer" if i % 5 else "thinking"}
+        }
+        parts.append(f"data: {json.dumps(data)}\n\n")
+        if keepalive_every and i % keepalive_every == 0:
+            parts.append(": keep-alive\n\n")
+    parts.append('data: {"type": "chat:completion", "data": {"done": true, "phase": "done"}}\n\n')
+    return "".join(parts).encode()
+
+
+class EventChunkedRaw:
+    """urllib3-like raw body that yields one chunk per SSE event, like a server flushing per token"""
+
+    def __init__(self, body):
+        self.chunks = [event + b"\n\n" for event in body.split(b"\n\n") if event]
+
+    def stream(self, chunk_size, decode_content=True):
+        return iter(self.chunks)
+
+
+def make_response(body, chunk_size):
+    """Unread streaming requests.Response over an in-memory body"""
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.raw = EventChunkedRaw(body) if chunk_size == "event" else io.BytesIO(body)
+    return response
+
+
+def read_size(chunk_size):
+    return chunk_size if isinstance(chunk_size, int) else 8192
+
+
+def old_path(body, chunk_size, parse_json):
+    parser = SSEParser()
+    count = 0
+    for line in make_response(body, chunk_size).iter_lines(chunk_size=read_size(chunk_size), decode_unicode=True):
+        if line:
+            if parse_json:
+                if parser.parse_line(line):
+                    count += 1
+            else:
+                line = line.strip()
+                if line.startswith("data: ") and line[6:].strip():
+                    count += 1
+    return count
+
+
+def new_path(body, chunk_size, parse_json):
+    parser = SSEParser()
+    count = 0
+    for payload in iter_sse_data(make_response(body, chunk_size), read_size(chunk_size)):
+        if parse_json:
+            if parser.parse_data(payload):
+                count += 1
+        else:
+            count += 1
+    return count
+
+
+def measure(body, chunk_size, parse_json, repeat):
+    """Best events/sec of both paths, runs interleaved to share machine noise"""
+    best = {old_path: float("inf"), new_path: float("inf")}
+    counts = {}
+    for _ in range(repeat):
+        for fn in best:
+            start = time.perf_counter()
+            counts[fn] = fn(body, chunk_size, parse_json)
+            best[fn] = min(best[fn], time.perf_counter() - start)
+    assert counts[old_path] == counts[new_path], counts
+    return counts[old_path] / best[old_path], counts[new_path] / best[new_path]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=50000, help="SSE events per stream")
+    parser.add_argument("--keepalive-every", type=int, default=20, help="keep-alive comment frequency")
+    parser.add_argument("--repeat", type=int, default=7, help="runs per case, best is reported")
+    args = parser.parse_args()
+
+    body = build_stream(args.events, args.keepalive_every)
+    print(f"{args.events} events, {len(body) / 1024:.0f} KiB body\n")
+    print(f"{'chunk':>6}  {'stage':<13} {'iter_lines+SSEParser':>22} {'SSEDecoder':>14} {'speedup':>8}")
+
+    for chunk_size in ("event", 512, 8192):
+        for parse_json in (False, True):
+            old_rate, new_rate = measure(body, chunk_size, parse_json, args.repeat)
+            stage = "framing+json" if parse_json else "framing"
+            print(
+                f"{chunk_size:>6}  {stage:<13} {old_rate:>16,.0f} ev/s {new_rate:>9,.0f} ev/s "
+                f"{new_rate / old_rate:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
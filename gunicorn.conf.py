@@ -0,0 +1,14 @@
+"""
+Gunicorn settings for app.py and simple_app.py
+Starts the upstream keep-warm thread in every worker as soon as it is forked
+"""
+
+import importlib
+
+
+def post_fork(server, worker):
+    """Open the app's pooled upstream connections before the worker takes requests"""
+    module = importlib.import_module(server.cfg.wsgi_app.split(":")[0])
+    start_keepwarm = getattr(module, "start_keepwarm", None)
+    if start_keepwarm:
+        start_keepwarm()
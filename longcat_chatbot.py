@@ -1,15 +1,33 @@
 import requests
 import json
+import os
 import sys
 import time
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from zai.core.compression import accept_encoding, iter_body
+from zai.core.deadline import Deadline
+from zai.core.hedging import Hedger
+from zai.core.transport import create_session
+from zai.utils.json_codec import dumps, loads
+from zai.utils.sse_parser import SSEDecoder
 
 class LongcatChatbot:
-    def __init__(self):
+    def __init__(self, hedge: Optional[bool] = None, stream_compression: Optional[bool] = None):
         self.api_url = "https://longcat.chat/api/v1/chat-completion-oversea"
-        self.session = requests.Session()
+        self.session = create_session(self.api_url)
         self.messages: List[Dict[str, Any]] = []
+        
+        # Duplicate requests whose first byte is slow (LONGCAT_HEDGE=true)
+        if hedge is None:
+            hedge = os.environ.get('LONGCAT_HEDGE', '').lower() in ('1', 'true', 'yes')
+        self.hedger = Hedger("longcat") if hedge else None
+        
+        # Negotiate compressed streams unless LONGCAT_STREAM_COMPRESSION=false
+        if stream_compression is None:
+            stream_compression = os.environ.get('LONGCAT_STREAM_COMPRESSION', 'true').strip().lower() in ('1', 'true', 'yes', 'on')
+        self.stream_compression = stream_compression
         self.setup_headers()
     
     def setup_headers(self):
@@ -46,8 +64,8 @@ class LongcatChatbot:
         """Generate a random message ID"""
         return random.randint(10000000, 99999999)
     
-    def send_message(self, content: str) -> str:
-        """Send a message to the chatbot and return the response"""
+    def send_message(self, content: str, deadline: Optional[Deadline] = None) -> str:
+        """Send a message to the chatbot and return the response, giving up with DeadlineExceeded once the deadline passes"""
         user_message_id = self.generate_message_id()
         assistant_message_id = self.generate_message_id()
         
@@ -80,44 +98,45 @@ class LongcatChatbot:
             "regenerate": 0
         }
         
-        try:
-            response = self.session.post(
+        def post():
+            return self.session.post(
                 self.api_url,
-                data=json.dumps(payload),
-                timeout=30,
+                data=dumps(payload),
+                headers={'Accept-Encoding': accept_encoding(self.stream_compression)},
+                timeout=deadline.cap(30, "Longcat request") if deadline else 30,
                 stream=True
             )
+        
+        try:
+            response = self.hedger.call(post) if self.hedger else post()
             
             if response.status_code == 200:
                 # Handle streaming response
                 full_response = ""
-                for line in response.iter_lines():
-                    if line:
-                        line_text = line.decode('utf-8')
-                        if line_text.startswith('data:'):
-                            try:
-                                # Remove 'data:' prefix and parse JSON
-                                json_str = line_text[5:].strip()
-                                if json_str:
-                                    data = json.loads(json_str)
-                                    
-                                    # Extract delta content from the streaming response
-                                    if ('choices' in data and 
-                                        len(data['choices']) > 0 and 
-                                        'delta' in data['choices'][0] and 
-                                        'content' in data['choices'][0]['delta'] and
-                                        data['choices'][0]['delta']['content'] is not None):
-                                        
-                                        chunk = data['choices'][0]['delta']['content']
-                                        full_response += chunk
-                                        print(chunk, end='', flush=True)
-                                    
-                                    # Check if this is the last message
-                                    if data.get('lastOne', False):
-                                        break
-                                        
-                            except json.JSONDecodeError:
-                                continue
+                chunks = iter_body(response)
+                if deadline:
+                    chunks = deadline.guard(chunks, "Longcat stream", response)
+                for payload in SSEDecoder().iter_data(chunks):
+                    try:
+                        data = loads(payload)
+                        
+                        # Extract delta content from the streaming response
+                        if ('choices' in data and 
+                            len(data['choices']) > 0 and 
+                            'delta' in data['choices'][0] and 
+                            'content' in data['choices'][0]['delta'] and
+                            data['choices'][0]['delta']['content'] is not None):
+                            
+                            chunk = data['choices'][0]['delta']['content']
+                            full_response += chunk
+                            print(chunk, end='', flush=True)
+                        
+                        # Check if this is the last message
+                        if data.get('lastOne', False):
+                            break
+                            
+                    except json.JSONDecodeError:
+                        continue
                 
                 # Update conversation history
                 user_message["chatStatus"] = "FINISHED"
@@ -132,6 +151,8 @@ class LongcatChatbot:
                 return f"Error: HTTP {response.status_code} - {response.text}"
                 
         except requests.exceptions.RequestException as e:
+            if deadline:
+                deadline.check("Longcat request")
             return f"Connection error: {str(e)}"
     
     def clear_history(self):
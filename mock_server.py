@@ -0,0 +1,67 @@
+"""
+Local HTTP server shared by the tests that run against a mock upstream
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Base request handler of the mock servers; tests subclass it with do_GET/do_POST"""
+
+    protocol_version = "HTTP/1.1"
+
+    def read_json(self):
+        """Read and decode the JSON request body"""
+        return json.loads(self.rfile.read(int(self.headers.get("content-length", 0))))
+
+    def reply(self, status, body, content_type="application/json", headers=None):
+        """Send a complete response with a content-length"""
+        self.send_response(status)
+        self.send_header("content-type", content_type)
+        self.send_header("content-length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def start_chunked(self, content_type="text/event-stream"):
+        """Start a chunked response, continued with write_chunk"""
+        self.send_response(200)
+        self.send_header("content-type", content_type)
+        self.send_header("transfer-encoding", "chunked")
+        self.end_headers()
+
+    def write_chunk(self, payload):
+        """Send one chunk of a chunked response right away; an empty payload ends the body"""
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(payload), payload))
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+class MockServer(ThreadingHTTPServer):
+    """Mock server on a free local port, serving from a daemon thread until stop()
+
+    Also a context manager that stops the server on exit.
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, handler):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
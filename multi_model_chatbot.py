@@ -7,11 +7,28 @@ Supports GPT-OSS, Grok3API, Z.AI, and Longcat models
 import requests
 import json
 import uuid
+import os
 import sys
 import time
 import random
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from zai.core.circuit_breaker import CircuitBreaker
+from zai.core.compression import accept_encoding, iter_body
+from zai.core.deadline import Deadline
+from zai.core.exceptions import DeadlineExceeded
+from zai.core.hedging import HedgePolicy, Hedger
+from zai.core.transport import create_session
+from zai.utils.json_codec import dumps, loads
+from zai.utils.sse_parser import SSEDecoder
+
+def env_flag(name: str, default: bool = True) -> bool:
+    """Read an on/off switch from the environment"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
 
 @dataclass
 class ModelProvider:
@@ -20,6 +37,7 @@ class ModelProvider:
     models: List[str]
     available: bool = False
     error_message: Optional[str] = None
+    breaker: Optional[CircuitBreaker] = field(default=None, repr=False)
 
 class MultiModelChatbot:
     def __init__(self):
@@ -29,13 +47,19 @@ class MultiModelChatbot:
         
         # GPT-OSS configuration
         self.gpt_oss_base_url = "https://api.gpt-oss.com"
-        self.gpt_oss_session = requests.Session()
+        self.gpt_oss_session = create_session(self.gpt_oss_base_url)
         self.thread_id: Optional[str] = None
+        self.gpt_oss_compression = env_flag('GPT_OSS_STREAM_COMPRESSION')
         
         # Longcat configuration
         self.longcat_api_url = "https://longcat.chat/api/v1/chat-completion-oversea"
-        self.longcat_session = requests.Session()
+        self.longcat_session = create_session(self.longcat_api_url)
         self.longcat_messages: List[Dict[str, Any]] = []
+        self.longcat_compression = env_flag('LONGCAT_STREAM_COMPRESSION')
+        self.longcat_hedger = Hedger("longcat") if env_flag('LONGCAT_HEDGE', False) else None
+        
+        # Z.AI conversation, kept across turns until the model changes or a new one is started
+        self.zai_conversation = None
         
         # Initialize providers
         self._initialize_providers()
@@ -91,7 +115,16 @@ class MultiModelChatbot:
             # Import zai modules from the downloaded files
             sys.path.insert(0, '/tmp/model_tests')
             from zai.client import ZAIClient
-            self.zai_client = ZAIClient(auto_auth=True)
+            self.zai_client = ZAIClient(
+                auto_auth=True,
+                http2=os.environ.get('ZAI_HTTP2', '').lower() in ('1', 'true', 'yes'),
+                stream_compression=env_flag('ZAI_STREAM_COMPRESSION'),
+                hedge_policy=HedgePolicy.from_env() if env_flag('ZAI_HEDGE', False) else None,
+                hedge_completions=env_flag('ZAI_HEDGE_COMPLETIONS', False),
+                token_pool_size=int(os.environ.get('ZAI_TOKEN_POOL_SIZE', 0)),
+                chat_pool_size=int(os.environ.get('ZAI_CHAT_POOL_SIZE', 0)),
+                bootstrap=env_flag('ZAI_BOOTSTRAP', False)
+            )
             self.providers['zai'] = ModelProvider(
                 name="Z.AI",
                 models=["glm-4.5v", "0727-360B-API"],
@@ -122,6 +155,14 @@ class MultiModelChatbot:
                 error_message=str(e)
             )
             
+        # Guard every working provider with a circuit breaker
+        for provider_key, provider in self.providers.items():
+            if provider.available:
+                provider.breaker = CircuitBreaker(
+                    provider_key,
+                    on_state_change=lambda breaker, old, new, p=provider: self._on_breaker_change(p, breaker, new)
+                )
+            
         # Set default provider to the first available one
         for provider_key, provider in self.providers.items():
             if provider.available:
@@ -129,8 +170,29 @@ class MultiModelChatbot:
                 self.current_model = provider.models[0]
                 break
     
+    def _on_breaker_change(self, provider: ModelProvider, breaker: CircuitBreaker, state: str):
+        """Mirror circuit breaker state into the provider's availability"""
+        if state == CircuitBreaker.OPEN:
+            provider.available = False
+            provider.error_message = (
+                f"circuit open after {breaker.error_rate():.0%} errors, "
+                f"retrying in {breaker.retry_in():.0f}s"
+            )
+        else:
+            provider.available = True
+            provider.error_message = None
+    
+    def refresh_provider_states(self) -> Dict[str, str]:
+        """Let open circuit breakers move to half-open once their cool-down passed"""
+        return {
+            key: provider.breaker.state
+            for key, provider in self.providers.items()
+            if provider.breaker
+        }
+    
     def list_providers(self):
         """List all available providers and their models"""
+        self.refresh_provider_states()
         print("\n📋 Available Model Providers:")
         print("=" * 50)
         
@@ -153,6 +215,7 @@ class MultiModelChatbot:
             print(f"❌ Provider '{provider_key}' not found")
             return False
             
+        self.refresh_provider_states()
         provider = self.providers[provider_key]
         if not provider.available:
             print(f"❌ Provider '{provider.name}' is not available: {provider.error_message}")
@@ -207,8 +270,8 @@ class MultiModelChatbot:
         self.thread_id = thread_id
         return thread_id
     
-    def send_message_gpt_oss(self, message: str) -> None:
-        """Send message via GPT-OSS API"""
+    def send_message_gpt_oss(self, message: str, deadline: Optional[Deadline] = None) -> bool:
+        """Send message via GPT-OSS API, returning whether the provider answered"""
         if not self.thread_id:
             self.create_thread()
         
@@ -228,24 +291,34 @@ class MultiModelChatbot:
         try:
             response = self.gpt_oss_session.post(
                 f"{self.gpt_oss_base_url}/chatkit",
-                json=payload,
+                data=dumps(payload),
+                headers={'Accept-Encoding': accept_encoding(self.gpt_oss_compression)},
                 stream=True,
-                timeout=30
+                timeout=deadline.cap(30, "GPT-OSS request") if deadline else 30
             )
             response.raise_for_status()
-            self._process_gpt_oss_stream(response)
+            self._process_gpt_oss_stream(response, deadline)
+            return True
+        except DeadlineExceeded:
+            raise
         except requests.exceptions.RequestException as e:
+            if deadline:
+                deadline.check("GPT-OSS request")
             print(f"\n❌ Error communicating with GPT-OSS API: {e}")
         except Exception as e:
             print(f"\n❌ Unexpected error: {e}")
+        return False
     
-    def send_message_grok(self, message: str) -> None:
-        """Send message via Grok3API"""
+    def send_message_grok(self, message: str, deadline: Optional[Deadline] = None) -> bool:
+        """Send message via Grok3API, returning whether the provider answered"""
         if not self.grok_client:
             print("❌ Grok client not available")
-            return
+            return False
             
         try:
+            # Grok3API has no timeout control, so the deadline only gates the call
+            if deadline:
+                deadline.check("Grok request")
             print("\n🤖 Grok:", end=" ", flush=True)
             result = self.grok_client.ask(message)
             
@@ -262,42 +335,50 @@ class MultiModelChatbot:
                             print(f"   Saved: {filename}")
                         except Exception as e:
                             print(f"   Failed to save image {i}: {e}")
+                return True
             else:
                 print("No response received")
                 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             print(f"\n❌ Error with Grok API: {e}")
+        return False
     
-    def send_message_zai(self, message: str) -> None:
-        """Send message via Z.AI API"""
+    def send_message_zai(self, message: str, deadline: Optional[Deadline] = None) -> bool:
+        """Send message via Z.AI API, returning whether the provider answered"""
         if not self.zai_client:
             print("❌ Z.AI client not available")
-            return
+            return False
             
         try:
             print("\n🤖 Z.AI:", end=" ", flush=True)
-            response = self.zai_client.simple_chat(
-                message=message,
-                model=self.current_model,
-                enable_thinking=True,
-                temperature=0.7,
-                max_tokens=500
-            )
+            if not self.zai_conversation or self.zai_conversation.model != self.current_model:
+                self.zai_conversation = self.zai_client.conversation(
+                    model=self.current_model,
+                    temperature=0.7,
+                    max_tokens=500
+                )
+            response = self.zai_conversation.send(message, deadline=deadline)
             
             if response.content:
                 print(response.content)
                 
                 if response.thinking:
                     print(f"\n💭 Thinking: {response.thinking}")
+                return True
                     
             else:
                 print("No response received")
                 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             print(f"\n❌ Error with Z.AI API: {e}")
+        return False
     
-    def send_message_longcat(self, message: str) -> None:
-        """Send message via Longcat API"""
+    def send_message_longcat(self, message: str, deadline: Optional[Deadline] = None) -> bool:
+        """Send message via Longcat API, returning whether the provider answered"""
         try:
             user_message_id = self.generate_message_id()
             assistant_message_id = self.generate_message_id()
@@ -333,43 +414,45 @@ class MultiModelChatbot:
             
             print("\n🤖 Longcat:", end=" ", flush=True)
             
-            response = self.longcat_session.post(
-                self.longcat_api_url,
-                data=json.dumps(payload),
-                timeout=30,
-                stream=True
-            )
+            def post():
+                return self.longcat_session.post(
+                    self.longcat_api_url,
+                    data=dumps(payload),
+                    headers={'Accept-Encoding': accept_encoding(self.longcat_compression)},
+                    timeout=deadline.cap(30, "Longcat request") if deadline else 30,
+                    stream=True
+                )
+            
+            # Longcat requests carry the whole history, so a duplicate is harmless
+            response = self.longcat_hedger.call(post) if self.longcat_hedger else post()
             
             if response.status_code == 200:
                 # Handle streaming response
                 full_response = ""
-                for line in response.iter_lines():
-                    if line:
-                        line_text = line.decode('utf-8')
-                        if line_text.startswith('data:'):
-                            try:
-                                # Remove 'data:' prefix and parse JSON
-                                json_str = line_text[5:].strip()
-                                if json_str:
-                                    data = json.loads(json_str)
-                                    
-                                    # Extract delta content from the streaming response
-                                    if ('choices' in data and 
-                                        len(data['choices']) > 0 and 
-                                        'delta' in data['choices'][0] and 
-                                        'content' in data['choices'][0]['delta'] and
-                                        data['choices'][0]['delta']['content'] is not None):
-                                        
-                                        chunk = data['choices'][0]['delta']['content']
-                                        full_response += chunk
-                                        print(chunk, end='', flush=True)
-                                    
-                                    # Check if this is the last message
-                                    if data.get('lastOne', False):
-                                        break
-                                        
-                            except json.JSONDecodeError:
-                                continue
+                chunks = iter_body(response)
+                if deadline:
+                    chunks = deadline.guard(chunks, "Longcat stream", response)
+                for payload in SSEDecoder().iter_data(chunks):
+                    try:
+                        data = loads(payload)
+                        
+                        # Extract delta content from the streaming response
+                        if ('choices' in data and 
+                            len(data['choices']) > 0 and 
+                            'delta' in data['choices'][0] and 
+                            'content' in data['choices'][0]['delta'] and
+                            data['choices'][0]['delta']['content'] is not None):
+                            
+                            chunk = data['choices'][0]['delta']['content']
+                            full_response += chunk
+                            print(chunk, end='', flush=True)
+                        
+                        # Check if this is the last message
+                        if data.get('lastOne', False):
+                            break
+                            
+                    except json.JSONDecodeError:
+                        continue
                 
                 # Update conversation history
                 user_message["chatStatus"] = "FINISHED"
@@ -379,32 +462,34 @@ class MultiModelChatbot:
                 self.longcat_messages.extend([user_message, assistant_message])
                 
                 print()  # Add newline after streaming
+                return True
                 
             else:
                 print(f"Error: HTTP {response.status_code} - {response.text}")
                 
+        except DeadlineExceeded:
+            raise
         except requests.exceptions.RequestException as e:
+            if deadline:
+                deadline.check("Longcat request")
             print(f"\n❌ Error with Longcat API: {e}")
         except Exception as e:
             print(f"\n❌ Unexpected error with Longcat: {e}")
+        return False
     
-    def _process_gpt_oss_stream(self, response: requests.Response) -> None:
+    def _process_gpt_oss_stream(self, response: requests.Response, deadline: Optional[Deadline] = None) -> None:
         """Process GPT-OSS streaming response"""
         assistant_response = ""
         reasoning_shown = False
         
         print("\n🤖 GPT-OSS:", end=" ", flush=True)
         
-        for line in response.iter_lines(decode_unicode=True):
-            if not line or not line.startswith('data: '):
-                continue
-            
+        chunks = iter_body(response)
+        if deadline:
+            chunks = deadline.guard(chunks, "GPT-OSS stream", response)
+        for payload in SSEDecoder().iter_data(chunks):
             try:
-                data_str = line[6:]
-                if data_str.strip() == '':
-                    continue
-                    
-                data = json.loads(data_str)
+                data = loads(payload)
                 
                 if data.get('type') == 'thread.item_updated':
                     update = data.get('update', {})
@@ -437,29 +522,52 @@ class MultiModelChatbot:
         
         print("\n")
     
-    def send_message(self, message: str) -> None:
-        """Send message using current provider"""
+    def send_message(self, message: str, deadline: Optional[Deadline] = None) -> None:
+        """Send message using current provider, within the deadline if one is given
+        
+        Running out of time is reported on its own and does not count as a
+        provider failure for the circuit breaker; a half-open probe slot
+        taken for the call is given back instead.
+        """
         if not self.current_provider:
             print("❌ No provider selected")
             return
             
         provider = self.providers[self.current_provider]
+        breaker = provider.breaker
+        if breaker and not breaker.allow_request():
+            print(f"❌ Current provider {provider.name} is failing fast: {provider.error_message}")
+            return
+        
         if not provider.available:
+            if breaker:
+                breaker.cancel_probe()
             print(f"❌ Current provider {provider.name} is not available")
             return
         
-        print(f"Using {provider.name} - {self.current_model}")
-        
-        if self.current_provider == 'gpt-oss':
-            self.send_message_gpt_oss(message)
-        elif self.current_provider == 'grok':
-            self.send_message_grok(message)
-        elif self.current_provider == 'zai':
-            self.send_message_zai(message)
-        elif self.current_provider == 'longcat':
-            self.send_message_longcat(message)
-        else:
-            print(f"❌ Unknown provider: {self.current_provider}")
+        success = None
+        try:
+            print(f"Using {provider.name} - {self.current_model}")
+            if self.current_provider == 'gpt-oss':
+                success = self.send_message_gpt_oss(message, deadline)
+            elif self.current_provider == 'grok':
+                success = self.send_message_grok(message, deadline)
+            elif self.current_provider == 'zai':
+                success = self.send_message_zai(message, deadline)
+            elif self.current_provider == 'longcat':
+                success = self.send_message_longcat(message, deadline)
+            else:
+                print(f"❌ Unknown provider: {self.current_provider}")
+        except DeadlineExceeded as e:
+            print(f"\n⏱️ {provider.name} ran out of time: {e}")
+        finally:
+            if breaker:
+                if success is None:
+                    breaker.cancel_probe()
+                elif success:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
     
     def run(self) -> None:
         """Main chat loop"""
@@ -506,6 +614,9 @@ class MultiModelChatbot:
                     elif self.current_provider == 'longcat':
                         self.longcat_messages = []
                         print(f"\n📝 Started new conversation (cleared Longcat history)")
+                    elif self.current_provider == 'zai':
+                        self.zai_conversation = None
+                        print(f"\n📝 Started new conversation (new Z.AI chat)")
                     else:
                         print(f"\n📝 New conversation (provider: {self.providers[self.current_provider].name})")
                     continue
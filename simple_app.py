@@ -7,16 +7,31 @@ from flask import Flask, request, jsonify
 import json
 import os
 import time
-import requests
 import random
 
+from zai.core.compression import accept_encoding, iter_body
+from zai.core.deadline import Deadline
+from zai.core.exceptions import DeadlineExceeded
+from zai.core.http_client import DEFAULT_HEADERS
+from zai.core.transport import create_session, get_registry
+from zai.utils.json_codec import dumps, loads
+from zai.utils.flask_json import CodecJSONProvider
+from zai.utils.sse_parser import SSEDecoder
+
 app = Flask(__name__)
+app.json = CodecJSONProvider(app)
+
+def start_keepwarm():
+    """Open pooled connections to Longcat and keep them warm (see gunicorn.conf.py)"""
+    get_registry().start_keepwarm(["https://longcat.chat"], headers={"user-agent": DEFAULT_HEADERS["user-agent"]})
 
 class SimpleLongcatChatbot:
     def __init__(self):
         self.api_url = "https://longcat.chat/api/v1/chat-completion-oversea"
-        self.session = requests.Session()
+        self.session = create_session(self.api_url)
         self.messages = []
+        # Negotiate compressed streams unless LONGCAT_STREAM_COMPRESSION=false
+        self.stream_compression = os.environ.get('LONGCAT_STREAM_COMPRESSION', 'true').strip().lower() in ('1', 'true', 'yes', 'on')
         self.setup_headers()
     
     def setup_headers(self):
@@ -51,8 +66,8 @@ class SimpleLongcatChatbot:
     def generate_message_id(self):
         return random.randint(10000000, 99999999)
     
-    def send_message(self, content):
-        """Send a message to the chatbot and return the response"""
+    def send_message(self, content, deadline=None):
+        """Send a message to the chatbot and return the response, giving up with DeadlineExceeded once the deadline passes"""
         user_message_id = self.generate_message_id()
         assistant_message_id = self.generate_message_id()
         
@@ -85,36 +100,35 @@ class SimpleLongcatChatbot:
         try:
             response = self.session.post(
                 self.api_url,
-                data=json.dumps(payload),
-                timeout=30,
+                data=dumps(payload),
+                headers={'Accept-Encoding': accept_encoding(self.stream_compression)},
+                timeout=deadline.cap(30, "Longcat request") if deadline else 30,
                 stream=True
             )
             
             if response.status_code == 200:
                 full_response = ""
-                for line in response.iter_lines():
-                    if line:
-                        line_text = line.decode('utf-8')
-                        if line_text.startswith('data:'):
-                            try:
-                                json_str = line_text[5:].strip()
-                                if json_str:
-                                    data = json.loads(json_str)
-                                    
-                                    if ('choices' in data and 
-                                        len(data['choices']) > 0 and 
-                                        'delta' in data['choices'][0] and 
-                                        'content' in data['choices'][0]['delta'] and
-                                        data['choices'][0]['delta']['content'] is not None):
-                                        
-                                        chunk = data['choices'][0]['delta']['content']
-                                        full_response += chunk
-                                    
-                                    if data.get('lastOne', False):
-                                        break
-                                        
-                            except json.JSONDecodeError:
-                                continue
+                chunks = iter_body(response)
+                if deadline:
+                    chunks = deadline.guard(chunks, "Longcat stream", response)
+                for payload in SSEDecoder().iter_data(chunks):
+                    try:
+                        data = loads(payload)
+                        
+                        if ('choices' in data and 
+                            len(data['choices']) > 0 and 
+                            'delta' in data['choices'][0] and 
+                            'content' in data['choices'][0]['delta'] and
+                            data['choices'][0]['delta']['content'] is not None):
+                            
+                            chunk = data['choices'][0]['delta']['content']
+                            full_response += chunk
+                        
+                        if data.get('lastOne', False):
+                            break
+                            
+                    except json.JSONDecodeError:
+                        continue
                 
                 user_message["chatStatus"] = "FINISHED"
                 assistant_message["content"] = full_response
@@ -127,7 +141,11 @@ class SimpleLongcatChatbot:
             else:
                 return f"Error: HTTP {response.status_code} - {response.text}"
                 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
+            if deadline:
+                deadline.check("Longcat request")
             return f"Connection error: {str(e)}"
 
 # Global chatbot instance
@@ -141,6 +159,13 @@ def health_check():
         "timestamp": time.time()
     })
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return jsonify({
+        "pools": get_registry().stats(),
+        "timestamp": time.time()
+    })
+
 @app.route('/', methods=['GET'])
 def home():
     return jsonify({
@@ -148,6 +173,7 @@ def home():
         "version": "1.0.0",
         "endpoints": {
             "/health": "Health check",
+            "/metrics": "Upstream connection pool metrics",
             "/chat": "Chat with Longcat (POST)",
             "/history": "Get chat history",
             "/clear": "Clear chat history (POST)"
@@ -161,15 +187,18 @@ def chat():
         return jsonify({"error": "Message is required"}), 400
     
     message = data['message']
+    deadline = Deadline.from_header(request.headers.get('X-Request-Timeout'))
     
     try:
-        response = chatbot.send_message(message)
+        response = chatbot.send_message(message, deadline=deadline)
         return jsonify({
             "response": response,
             "provider": "longcat",
             "model": "longcat-chat",
             "timestamp": time.time()
         })
+    except DeadlineExceeded as e:
+        return jsonify({"error": str(e)}), 504
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -188,4 +217,5 @@ def clear_history():
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     print(f"🚀 Simple Longcat API starting on port {port}")
+    start_keepwarm()
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
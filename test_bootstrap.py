@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for starting a ZAIClient in the background against a local mock server,
+including recovery when the startup authentication fails
+"""
+
+import json
+
+from mock_server import MockHandler, MockServer
+from zai import ZAIClient
+from zai.core.exceptions import ZAIError
+
+MODEL = "glm-4.5v"
+
+
+def start_server():
+    """Run a mock Z.AI server whose auth endpoint fails while ``auth_down`` is set"""
+    state = {"auth_down": True, "auth_calls": 0, "unauthorized": 0}
+
+    class Handler(MockHandler):
+        def do_GET(self):
+            if self.path.startswith("/api/v1/auths"):
+                state["auth_calls"] += 1
+                if state["auth_down"]:
+                    self.reply(500, b'{"detail": "down"}')
+                else:
+                    self.reply(200, json.dumps({"token": "guest-token", "name": "Guest"}).encode())
+            else:
+                self.reply(200, json.dumps({"data": []}).encode())
+
+        def do_POST(self):
+            body = self.read_json()
+            if self.headers.get("authorization") != "Bearer guest-token":
+                state["unauthorized"] += 1
+                self.reply(401, b'{"detail": "no token"}')
+            elif self.path == "/api/v1/chats/new":
+                self.reply(200, json.dumps({"id": "chat-1"}).encode())
+            else:
+                message = body["messages"][-1]["content"]
+                event = {"type": "chat:completion", "data": {"phase": "answer", "delta_content": message, "done": True}}
+                self.reply(200, f"data: {json.dumps(event)}\n\n".encode(), "text/event-stream")
+
+    return MockServer(Handler), state
+
+
+def test_failed_startup_auth_is_retried():
+    """A client whose background authentication failed gets a token on its next request"""
+    server, state = start_server()
+    with server:
+        client = ZAIClient(base_url=server.url, cache_token=False, bootstrap=True)
+        try:
+            client.ready.result(10)
+        except ZAIError:
+            pass
+        else:
+            raise AssertionError("bootstrap succeeded while the auth endpoint was down")
+        assert client.bootstrap.steps["auth"].exception() is not None
+
+        try:
+            client.simple_chat("while down", model=MODEL, enable_thinking=False)
+        except ZAIError:
+            pass
+        else:
+            raise AssertionError("chat succeeded without a token")
+
+        state["auth_down"] = False
+        assert client.simple_chat("hello", model=MODEL, enable_thinking=False).content == "hello"
+        assert client.token == "guest-token"
+        calls = state["auth_calls"]
+        assert client.simple_chat("again", model=MODEL, enable_thinking=False).content == "again"
+        assert state["auth_calls"] == calls
+        assert state["unauthorized"] == 0
+
+
+def main():
+    print("🧪 ZAIClient bootstrap")
+    print("=" * 50)
+    test_failed_startup_auth_is_retried()
+    print("✓ A failed background authentication is retried by the next request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the Z.AI chat pool: expiry and refill of ready chats, and what a
+pooled simple_chat sends to a local mock server
+"""
+
+import itertools
+import json
+import time
+import uuid
+
+from mock_server import MockHandler, MockServer
+from zai import ZAIClient
+from zai.operations.chat_pool import ChatPool
+
+MODEL = "glm-4.5v"
+TITLE = "Simple Chat"
+
+
+def wait_for_refill(pool, enable_thinking):
+    """Wait until the background refill of a pool key is done"""
+    refiller = pool._refillers.get((MODEL, TITLE, enable_thinking))
+    if refiller is not None:
+        refiller.join(5)
+
+
+def test_expired_chats_are_dropped_and_refilled():
+    """Chats past the ttl are never handed out and the pool fills back up"""
+    ids = itertools.count()
+    created = []
+
+    def create(model, title, enable_thinking):
+        created.append((model, title, enable_thinking))
+        return f"chat-{next(ids)}"
+
+    pool = ChatPool(create, size=2, ttl=0.2)
+    assert pool.fill(MODEL, TITLE, False) == 2
+    assert pool.acquire(MODEL, TITLE, False) == "chat-0"
+    wait_for_refill(pool, False)
+    assert pool.to_dict()["ready"] == {f"{MODEL}/{TITLE}/plain": 2}
+
+    time.sleep(0.3)
+    assert pool.acquire(MODEL, TITLE, False) is None
+    stats = pool.to_dict()
+    assert stats["expired"] == 2 and stats["hits"] == 1 and stats["misses"] == 1
+
+    wait_for_refill(pool, False)
+    assert pool.acquire(MODEL, TITLE, False) == "chat-3"
+    assert set(created) == {(MODEL, TITLE, False)}
+
+
+def test_thinking_modes_have_separate_pools():
+    """A chat created without thinking is never handed to a call with thinking"""
+    pool = ChatPool(lambda model, title, enable_thinking: f"{enable_thinking}-{uuid.uuid4().hex}", size=1)
+    pool.fill(MODEL, TITLE, False)
+    assert pool.acquire(MODEL, TITLE, True) is None
+    assert pool.acquire(MODEL, TITLE, False).startswith("False-")
+    wait_for_refill(pool, True)
+    assert pool.acquire(MODEL, TITLE, True).startswith("True-")
+
+
+def start_server():
+    """Run a mock Z.AI server that records created chats and completions, return it and the records"""
+    chats = {}
+    completions = []
+
+    class Handler(MockHandler):
+        def do_GET(self):
+            if self.path.startswith("/api/v1/auths"):
+                self.reply(200, json.dumps({"token": "guest-token", "name": "Guest"}).encode())
+            else:
+                self.reply(200, json.dumps({"data": []}).encode())
+
+        def do_POST(self):
+            body = self.read_json()
+            if self.path == "/api/v1/chats/new":
+                chat_id = uuid.uuid4().hex
+                chats[chat_id] = body["chat"]
+                self.reply(200, json.dumps({"id": chat_id}).encode())
+                return
+            completions.append(body)
+            message = body["messages"][-1]["content"]
+            event = {"type": "chat:completion", "data": {"phase": "answer", "delta_content": message, "done": True}}
+            self.reply(200, f"data: {json.dumps(event)}\n\n".encode(), "text/event-stream")
+
+    return MockServer(Handler), chats, completions
+
+
+def test_pooled_simple_chat():
+    """A pooled chat has the caller's thinking mode, an empty history and gets the message in the completion"""
+    server, chats, completions = start_server()
+    with server:
+        client = ZAIClient(base_url=server.url, cache_token=False, chat_pool_size=1)
+        pool = client.chat_ops.chat_pool
+
+        assert client.simple_chat("first", model=MODEL, enable_thinking=False).content == "first"
+        inline = chats[completions[-1]["chat_id"]]
+        assert [message["content"] for message in inline["messages"]] == ["first"]
+
+        wait_for_refill(pool, False)
+        assert client.simple_chat("second", model=MODEL, enable_thinking=False).content == "second"
+        pooled = chats[completions[-1]["chat_id"]]
+        assert pool.to_dict()["hits"] == 1
+        assert pooled["enable_thinking"] is False
+        assert pooled["messages"] == [] and pooled["history"]["messages"] == {}
+        assert {key: value for key, value in pooled.items() if key not in ("messages", "history", "timestamp")} == \
+            {key: value for key, value in inline.items() if key not in ("messages", "history", "timestamp")}
+        assert completions[-1]["messages"] == [{"role": "user", "content": "second"}]
+
+        assert client.simple_chat("third", model=MODEL, enable_thinking=True).content == "third"
+        assert chats[completions[-1]["chat_id"]]["enable_thinking"] is True
+        assert pool.to_dict()["misses"] == 2
+        wait_for_refill(pool, False)
+        wait_for_refill(pool, True)
+
+
+def main():
+    print("🧪 Z.AI chat pool")
+    print("=" * 50)
+    test_expired_chats_are_dropped_and_refilled()
+    print("✓ Expired chats are dropped and the pool refills in the background")
+    test_thinking_modes_have_separate_pools()
+    print("✓ Each thinking mode has its own pool")
+    test_pooled_simple_chat()
+    print("✓ A pooled simple_chat completes in an empty chat with the caller's thinking mode")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the provider circuit breaker and for how MultiModelChatbot reports
+call outcomes to it
+"""
+
+import time
+
+from multi_model_chatbot import ModelProvider, MultiModelChatbot
+from zai.core.circuit_breaker import CircuitBreaker
+from zai.core.exceptions import DeadlineExceeded
+
+OPEN_SECONDS = 0.05
+
+
+def open_breaker():
+    """A breaker that opened after failures and is due to probe"""
+    breaker = CircuitBreaker("test", min_requests=2, open_seconds=OPEN_SECONDS)
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    time.sleep(OPEN_SECONDS * 2)
+    return breaker
+
+
+def test_opens_probes_and_closes():
+    """Failures open the breaker, one probe is let through, and its success closes it"""
+    breaker = open_breaker()
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens():
+    """A failed probe opens the breaker again"""
+    breaker = open_breaker()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_cancelled_probe_frees_the_slot():
+    """A probe given back without an outcome lets the next call probe"""
+    breaker = open_breaker()
+    assert breaker.allow_request()
+    breaker.cancel_probe()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def chatbot_with(breaker, send):
+    """A MultiModelChatbot whose only provider is guarded by breaker and answered by send"""
+    chatbot = MultiModelChatbot.__new__(MultiModelChatbot)
+    chatbot.providers = {"longcat": ModelProvider(name="Longcat", models=["longcat"], available=True, breaker=breaker)}
+    chatbot.current_provider = "longcat"
+    chatbot.current_model = "longcat"
+    chatbot.send_message_longcat = send
+    return chatbot
+
+
+def test_deadline_does_not_strand_the_probe():
+    """A probe that runs out of time neither counts as a failure nor keeps the breaker half-open"""
+    calls = []
+
+    def out_of_time(message, deadline):
+        calls.append(message)
+        raise DeadlineExceeded("Longcat stream ran out of time")
+
+    breaker = open_breaker()
+    chatbot = chatbot_with(breaker, out_of_time)
+    for i in range(3):
+        chatbot.send_message(f"message {i}")
+    assert calls == ["message 0", "message 1", "message 2"]
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    chatbot.send_message_longcat = lambda message, deadline: True
+    chatbot.send_message("last")
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_unknown_provider_does_not_strand_the_probe():
+    """A probe taken for a provider without a sender is given back"""
+    breaker = open_breaker()
+    chatbot = chatbot_with(breaker, None)
+    chatbot.providers["unknown"] = chatbot.providers.pop("longcat")
+    chatbot.current_provider = "unknown"
+    chatbot.send_message("hello")
+    assert breaker.allow_request()
+
+
+def main():
+    print("🧪 Provider circuit breaker")
+    print("=" * 50)
+    test_opens_probes_and_closes()
+    test_failed_probe_reopens()
+    print("✓ Failures open the breaker and a probe closes or reopens it")
+    test_cancelled_probe_frees_the_slot()
+    print("✓ A cancelled probe frees the half-open slot")
+    test_deadline_does_not_strand_the_probe()
+    test_unknown_provider_does_not_strand_the_probe()
+    print("✓ Calls that end without an outcome give their probe back")
+
+
+if __name__ == "__main__":
+    main()
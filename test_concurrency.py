@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Stress test for sharing one ZAIClient between threads, against a local mock
+Z.AI server that checks every request for another thread's state
+"""
+
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from mock_server import MockHandler, MockServer
+from zai import ZAIClient
+from zai.operations.chat import FE_VERSION
+
+THREADS = 32
+PROMPTS_PER_THREAD = 8
+REVOKE_EVERY = 150
+
+
+class MockZAI:
+    """Mock Z.AI API that records requests carrying the wrong per-request state
+
+    Every chat remembers the message it was created with, and its
+    completion must arrive with the same message, the same chat in the
+    referer, the current bearer token and the x-fe-version header. A chat
+    created empty, as the chat pool does, may be completed with any
+    message but only once. Every
+    response sets a cookie, and the token is revoked every REVOKE_EVERY
+    requests so clients refresh it while other threads are mid-request.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.chats = {}
+        self.tokens = 0
+        self.valid_token = None
+        self.requests = 0
+        self.revocations = 0
+        self.problems = []
+
+    def issue_token(self):
+        with self.lock:
+            self.tokens += 1
+            self.valid_token = f"token-{self.tokens}"
+            return self.valid_token
+
+    def authorize(self, headers):
+        """Check the per-request headers, return False if the token is stale"""
+        if headers.get("x-fe-version") != FE_VERSION:
+            self.problem(f"x-fe-version was {headers.get('x-fe-version')!r}")
+        with self.lock:
+            self.requests += 1
+            if headers.get("authorization") != f"Bearer {self.valid_token}":
+                return False
+            if self.requests % REVOKE_EVERY == 0:
+                self.revocations += 1
+                self.valid_token = None
+        return True
+
+    def problem(self, text):
+        with self.lock:
+            self.problems.append(text)
+
+    def start(self):
+        mock = self
+
+        class Handler(MockHandler):
+            def reply(self, status, body, content_type="application/json"):
+                super().reply(status, body, content_type, {"set-cookie": f"visit={uuid.uuid4().hex}; Path=/"})
+
+            def do_GET(self):
+                if self.path.startswith("/api/v1/auths"):
+                    self.reply(200, json.dumps({"token": mock.issue_token(), "name": "Guest"}).encode())
+                else:
+                    self.reply(200, json.dumps({"data": []}).encode())
+
+            def do_POST(self):
+                body = self.read_json()
+                if not mock.authorize(self.headers):
+                    self.reply(401, b'{"detail": "token revoked"}')
+                elif self.path == "/api/v1/chats/new":
+                    chat_id = uuid.uuid4().hex
+                    messages = body["chat"]["messages"]
+                    with mock.lock:
+                        mock.chats[chat_id] = messages[0]["content"] if messages else None
+                    self.reply(200, json.dumps({"id": chat_id}).encode())
+                else:
+                    self.complete(body)
+
+            def complete(self, body):
+                chat_id = body["chat_id"]
+                message = body["messages"][-1]["content"]
+                with mock.lock:
+                    known = chat_id in mock.chats
+                    created_with = mock.chats.pop(chat_id, None)
+                if not known:
+                    mock.problem(f"chat {chat_id} was completed twice or never created")
+                elif created_with is not None and created_with != message:
+                    mock.problem(f"chat {chat_id} was created with {created_with!r} but completed with {message!r}")
+                if self.headers.get("referer") != f"{mock.server.url}/c/{chat_id}":
+                    mock.problem(f"completion of chat {chat_id} had referer {self.headers.get('referer')!r}")
+                event = {"type": "chat:completion", "data": {"phase": "answer", "delta_content": message, "done": True}}
+                self.reply(200, f"data: {json.dumps(event)}\n\n".encode(), "text/event-stream")
+
+        self.server = MockServer(Handler)
+        return self.server.url
+
+    def stop(self):
+        self.server.stop()
+
+
+def run_shared_client():
+    """Chat from many threads on one client, return the chats made and token revocations"""
+    mock = MockZAI()
+    url = mock.start()
+    try:
+        client = ZAIClient(base_url=url, cache_token=False)
+
+        def worker(thread):
+            answers = []
+            for i in range(PROMPTS_PER_THREAD):
+                prompt = f"thread {thread} prompt {i}"
+                answers.append((prompt, client.simple_chat(prompt, enable_thinking=False).content))
+            return answers
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = [answer for answers in executor.map(worker, range(THREADS)) for answer in answers]
+
+        crossed = [(prompt, content) for prompt, content in results if prompt != content]
+        assert not crossed, f"{len(crossed)} answers belong to another thread, e.g. {crossed[0]}"
+        assert not mock.problems, f"{len(mock.problems)} requests carried another thread's state, e.g. {mock.problems[0]}"
+        assert mock.revocations > 0, "the token was never revoked during the run"
+        assert len(results) == THREADS * PROMPTS_PER_THREAD
+        return len(results), mock.revocations
+    finally:
+        mock.stop()
+
+
+def test_shared_client():
+    """Many threads on one client get their own answers and send only their own state"""
+    run_shared_client()
+
+
+def main():
+    print("🧪 Sharing one ZAIClient between threads")
+    print("=" * 50)
+    count, revocations = run_shared_client()
+    print(f"✓ {count} chats from {THREADS} threads, each answered with its own prompt")
+    print(f"✓ No request carried another thread's chat, referer, token or headers")
+    print(f"✓ Recovered from {revocations} token revocations mid-run")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for deadlines on streamed responses against a local mock server that
+stalls in the middle of a stream
+"""
+
+import time
+
+from mock_server import MockHandler, MockServer
+from zai.core.deadline import Deadline
+from zai.core.exceptions import DeadlineExceeded
+from zai.core.http_client import HTTPClient
+
+DEADLINE = 1.0
+STALL = 5.0
+CHUNKS = 8
+
+
+def start_server():
+    """Run a server whose /stall stream sends CHUNKS chunks over most of DEADLINE and then stops, and whose /quick stream ends after one"""
+
+    class Handler(MockHandler):
+        def do_GET(self):
+            self.start_chunked()
+            for i in range(CHUNKS if self.path == "/stall" else 1):
+                self.write_chunk(b"data: %d\n\n" % i)
+                if self.path == "/stall":
+                    time.sleep(DEADLINE * 0.8 / CHUNKS)
+            if self.path == "/stall":
+                time.sleep(STALL)
+            self.write_chunk(b"")
+
+    return MockServer(Handler)
+
+
+def read(url, path):
+    """Read a stream with a DEADLINE deadline and a long read timeout, return the chunks, error and seconds taken"""
+    client = HTTPClient(url, timeout=STALL * 2)
+    deadline = Deadline(DEADLINE)
+    start = time.monotonic()
+    chunks = []
+    try:
+        response = client.make_request("GET", path, stream=True, deadline=deadline, auth=False)
+        for chunk in client.iter_stream(response, deadline=deadline):
+            chunks.append(chunk)
+    except DeadlineExceeded as e:
+        return chunks, e, time.monotonic() - start
+    return chunks, None, time.monotonic() - start
+
+
+def test_stalled_stream_ends_at_the_deadline():
+    """A stream that stalls late is aborted when the deadline passes, not a read timeout after its last chunk"""
+    with start_server() as server:
+        chunks, error, seconds = read(server.url, "/stall")
+        assert b"".join(chunks) == b"".join(b"data: %d\n\n" % i for i in range(CHUNKS))
+        assert isinstance(error, DeadlineExceeded), error
+        assert seconds < DEADLINE * 1.3, f"the stream ended {seconds:.2f}s after it started"
+
+
+def test_stream_within_the_deadline_is_untouched():
+    """A stream that ends in time is read in full"""
+    with start_server() as server:
+        chunks, error, _ = read(server.url, "/quick")
+        assert error is None, error
+        assert chunks == [b"data: 0\n\n"]
+
+
+def main():
+    print("🧪 Stream deadlines")
+    print("=" * 50)
+    test_stalled_stream_ends_at_the_deadline()
+    print("✓ A stalled stream is aborted at its deadline")
+    test_stream_within_the_deadline_is_untouched()
+    print("✓ A stream within its deadline is read in full")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached Z.AI model catalog against a local mock server: stale
+lists served while one background refresh runs, and 304 revalidation
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from mock_server import MockHandler, MockServer
+from zai.core.http_client import HTTPClient
+from zai.operations.catalog import FRESH, STALE, ModelCatalog
+from zai.operations.model import ModelOperations
+
+THREADS = 16
+TTL = 60.0
+STALE_TTL = 60.0
+
+
+def catalog_entry(model_id):
+    """A minimal /api/v1/models entry"""
+    return {
+        "id": model_id,
+        "name": model_id.upper(),
+        "owned_by": "openai",
+        "openai": {"id": model_id},
+        "urlIdx": 1,
+        "info": {"id": model_id, "user_id": "server-user", "name": model_id.upper(), "meta": {}}
+    }
+
+
+class MockModels:
+    """Mock /api/v1/models endpoint with an ETag per catalog version
+
+    A request carrying the current ETag in If-None-Match gets a 304.
+    While ``gate`` is cleared, requests wait before answering, so a
+    test can see who waits for a refresh and who does not.
+    """
+
+    def __init__(self):
+        self.models = [catalog_entry("glm-4.5v"), catalog_entry("0727-360B-API")]
+        self.version = 1
+        self.requests = []
+        self.lock = threading.Lock()
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def start(self):
+        mock = self
+
+        class Handler(MockHandler):
+            def do_GET(self):
+                mock.gate.wait(10)
+                with mock.lock:
+                    mock.requests.append(self.headers.get("if-none-match"))
+                    version = mock.version
+                etag = f'"v{version}"'
+                if self.headers.get("if-none-match") == etag:
+                    self.reply(304, b"", headers={"etag": etag})
+                else:
+                    self.reply(200, json.dumps({"data": mock.models[:version]}).encode(), headers={"etag": etag})
+
+        self.server = MockServer(Handler)
+        return self.server.url
+
+    def stop(self):
+        self.gate.set()
+        self.server.stop()
+
+
+def model_ops(url):
+    """Model operations over a catalog of their own"""
+    catalog = ModelCatalog(ttl=TTL, stale_ttl=STALE_TTL)
+    return ModelOperations(HTTPClient(url, timeout=10), catalog=catalog), catalog
+
+
+def wait_for_background_refresh():
+    """Wait until the background catalog refresh threads are done"""
+    for thread in threading.enumerate():
+        if thread.name == "zai-model-catalog":
+            thread.join(10)
+
+
+def test_stale_list_is_served_during_one_refresh():
+    """Lookups on a stale catalog answer at once and share one background refresh"""
+    mock = MockModels()
+    url = mock.start()
+    try:
+        ops, catalog = model_ops(url)
+        assert len(ops.get_models()) == 1
+        assert mock.requests == [None]
+
+        catalog.fetched_at -= TTL + 1
+        assert catalog.state() == STALE
+        mock.version = 2
+        mock.gate.clear()
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            counts = list(executor.map(lambda _: len(ops.get_models()), range(THREADS)))
+        assert counts == [1] * THREADS
+        assert mock.requests == [None], "a lookup waited for the refresh"
+
+        mock.gate.set()
+        wait_for_background_refresh()
+        assert mock.requests == [None, '"v1"']
+        assert catalog.state() == FRESH
+        assert len(ops.get_models()) == 2 and catalog.etag == '"v2"'
+        stats = catalog.to_dict()
+        assert (stats["misses"], stats["stale_hits"], stats["hits"], stats["refreshes"]) == (1, THREADS, 1, 2)
+    finally:
+        mock.stop()
+
+
+def test_not_modified_renews_the_list():
+    """A 304 keeps the cached models and makes them fresh again"""
+    mock = MockModels()
+    url = mock.start()
+    try:
+        ops, catalog = model_ops(url)
+        models = ops.get_models()
+        fetched_at = catalog.fetched_at
+
+        catalog.fetched_at -= TTL + STALE_TTL + 1
+        assert ops.get_models() == models
+        assert mock.requests == [None, '"v1"']
+        assert catalog.fetched_at > fetched_at
+        assert catalog.state() == FRESH and catalog.etag == '"v1"'
+        stats = catalog.to_dict()
+        assert (stats["misses"], stats["refreshes"], stats["not_modified"]) == (2, 1, 1)
+    finally:
+        mock.stop()
+
+
+def main():
+    print("🧪 Z.AI model catalog cache")
+    print("=" * 50)
+    test_stale_list_is_served_during_one_refresh()
+    print(f"✓ {THREADS} lookups on a stale catalog answered at once with one background refresh")
+    test_not_modified_renews_the_list()
+    print("✓ A 304 keeps the cached models and renews their age")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for precompiled JSON templates and for the model config behind the
+Z.AI completion payloads
+"""
+
+import json
+
+from zai.core.http_client import HTTPClient
+from zai.models import Model
+from zai.operations.catalog import ModelCatalog
+from zai.operations.model import MODEL_CONFIGS, ModelOperations
+from zai.operations.payloads import CompletionTemplates
+from zai.operations.streaming import StreamingOperations
+from zai.utils.json_template import JSONTemplate, Slot
+
+MODEL = "glm-4.5v"
+
+
+def test_template_renders_like_dumps():
+    """A rendered template decodes to the document with every slot filled in"""
+    template = JSONTemplate({
+        "text": Slot("text"),
+        "nested": {"list": [1, Slot("number"), {"again": Slot("text")}], "constant": "ü \"quoted\""},
+        "encoded": Slot("encoded")
+    })
+    values = {"text": "line\nbreak \"and\" ü", "number": 2.5, "encoded": b'{"already":[true,null]}'}
+    rendered = template.render(values)
+    assert json.loads(rendered) == {
+        "text": values["text"],
+        "nested": {"list": [1, 2.5, {"again": values["text"]}], "constant": "ü \"quoted\""},
+        "encoded": {"already": [True, None]}
+    }
+    assert template.slots == ["text", "number", "text", "encoded"]
+
+
+def test_template_without_slots_and_top_level_slot():
+    """A template is a single fragment without slots, and a slot may be the whole document"""
+    assert JSONTemplate({"a": [1, 2]}).render({}) == json.dumps({"a": [1, 2]}, separators=(",", ":")).encode()
+    assert json.loads(JSONTemplate(Slot("all")).render({"all": {"x": "y"}})) == {"x": "y"}
+
+
+def test_template_missing_value_raises():
+    """Rendering without a value for a slot fails instead of leaving a hole"""
+    try:
+        JSONTemplate({"a": Slot("a")}).render({})
+    except KeyError:
+        return
+    raise AssertionError("render accepted a missing slot value")
+
+
+def catalog_entry():
+    """A /api/v1/models entry of MODEL with settings that differ from the built-in ones"""
+    return {
+        "id": MODEL,
+        "name": "GLM-4.5V (server)",
+        "owned_by": "openai",
+        "openai": {"id": MODEL},
+        "urlIdx": 1,
+        "info": {
+            "id": MODEL,
+            "user_id": "server-user",
+            "name": "GLM-4.5V (server)",
+            "params": {"temperature": 0.7, "top_p": 0.9, "max_tokens": 4096},
+            "meta": {"description": "From the server", "capabilities": {"vision": True, "think": True}}
+        }
+    }
+
+
+def templates_for(entry):
+    """Completion templates over a catalog holding only the given entry"""
+    catalog = ModelCatalog()
+    catalog.update([Model.from_dict(entry)])
+    model_ops = ModelOperations(HTTPClient("http://127.0.0.1:9", timeout=1), catalog=catalog)
+    return model_ops, CompletionTemplates(model_ops)
+
+
+def render_item(templates):
+    """Render a completion payload for MODEL and return its model_item"""
+    payload = templates.render(MODEL, "chat-id", "request-id", [{"role": "user", "content": "Hi"}], False, b"{}")
+    return json.loads(payload)["model_item"]
+
+
+def streamed_item(model_ops):
+    """The model_item stream_completion sends for MODEL"""
+    return StreamingOperations(model_ops.http_client)._get_model_item(MODEL, model_ops)
+
+
+def test_unknown_keys_are_skipped():
+    """A catalog entry with a capability and a param this client does not know is still used"""
+    entry = catalog_entry()
+    entry["info"]["meta"]["capabilities"]["brand_new_capability"] = True
+    entry["info"]["params"]["new_param"] = 1
+    model_ops, templates = templates_for(entry)
+
+    config = model_ops.model_config(MODEL)
+    assert (config["temperature"], config["top_p"], config["description"]) == (0.7, 0.9, "From the server")
+    assert "brand_new_capability" not in config["capabilities"] and config["capabilities"]["vision"]
+    assert render_item(templates)["info"]["params"]["temperature"] == 0.7
+    assert streamed_item(model_ops)["info"]["params"] == {"temperature": 0.7, "top_p": 0.9, "max_tokens": 4096}
+
+
+def test_unparseable_entry_falls_back():
+    """An entry whose params and capabilities are not objects falls back to the built-in settings"""
+    entry = catalog_entry()
+    entry["info"]["params"] = ["temperature"]
+    entry["info"]["meta"]["capabilities"] = ["vision"]
+    model_ops, templates = templates_for(entry)
+
+    assert model_ops.model_config(MODEL) == MODEL_CONFIGS[MODEL]
+    item = render_item(templates)
+    assert item["info"]["params"]["temperature"] == MODEL_CONFIGS[MODEL]["temperature"]
+    assert item["info"]["meta"]["capabilities"] == MODEL_CONFIGS[MODEL]["capabilities"]
+    assert streamed_item(model_ops) == {"id": MODEL, "name": MODEL}
+
+
+def test_omitted_params_keep_built_in_values():
+    """Params the server leaves out come from the built-in config, the ones it sends win"""
+    entry = catalog_entry()
+    entry["info"].pop("params")
+    model_ops, templates = templates_for(entry)
+    params = render_item(templates)["info"]["params"]
+    assert (params["temperature"], params["top_p"]) == (MODEL_CONFIGS[MODEL]["temperature"], MODEL_CONFIGS[MODEL]["top_p"])
+
+    entry["info"]["params"] = {"top_p": 0.5}
+    model_ops, templates = templates_for(entry)
+    params = render_item(templates)["info"]["params"]
+    assert (params["temperature"], params["top_p"]) == (MODEL_CONFIGS[MODEL]["temperature"], 0.5)
+
+
+def main():
+    print("🧪 Payload templates and model config")
+    print("=" * 50)
+    test_template_renders_like_dumps()
+    test_template_without_slots_and_top_level_slot()
+    test_template_missing_value_raises()
+    print("✓ JSONTemplate.render matches a full encode")
+    test_unknown_keys_are_skipped()
+    print("✓ Unknown capabilities and params are skipped")
+    test_unparseable_entry_falls_back()
+    print("✓ An entry that cannot be parsed falls back to the built-in model config")
+    test_omitted_params_keep_built_in_values()
+    print("✓ Omitted sampling params keep their built-in values")
+
+
+if __name__ == "__main__":
+    main()
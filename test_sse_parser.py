@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the SSE event parser across line endings and chunk boundaries, and
+for resuming dropped Z.AI streams against a local mock server
+"""
+
+import json
+
+from mock_server import MockHandler, MockServer
+from zai.core.exceptions import ZAIError
+from zai.core.http_client import HTTPClient
+from zai.operations.streaming import StreamingOperations
+from zai.utils.sse_parser import SSEEventParser
+
+STREAM = "\ufeffid: 1\nevent: chat\ndata: {\"a\": 1}\n\n: keep-alive\n\ndata: first\ndata: second\n\nretry: 250\nid: 2\ndata: last\n\n"
+EXPECTED = [
+    (b'{"a": 1}', "chat", "1"),
+    (b"first\nsecond", "message", "1"),
+    (b"last", "message", "2"),
+]
+
+
+def parse(chunks):
+    """Feed chunks to a new parser, return the events and the parser"""
+    parser = SSEEventParser()
+    events = list(parser.iter_events(chunks))
+    return [(event.data, event.event, event.id) for event in events], parser
+
+
+def test_line_endings_split_at_every_byte():
+    """CR, LF and CRLF streams parse the same wherever the chunks are split"""
+    for ending in ("\n", "\r", "\r\n"):
+        body = STREAM.replace("\n", ending).encode()
+        for split in range(len(body) + 1):
+            events, parser = parse([body[:split], body[split:]])
+            assert events == EXPECTED, (ending, split, events)
+            assert parser.retry == 250
+        events, _ = parse([body[i:i + 1] for i in range(len(body))])
+        assert events == EXPECTED, (ending, "byte by byte", events)
+
+
+def test_crlf_split_between_cr_and_lf():
+    """An LF arriving in the chunk after its CR does not end another line"""
+    parser = SSEEventParser()
+    assert parser.feed(b"data: a\r") == []
+    assert parser.feed(b"\n") == []
+    events = parser.feed(b"\r\n")
+    assert [event.data for event in events] == [b"a"]
+
+
+def test_bare_cr_dispatches_without_more_input():
+    """A blank line ended by a bare CR dispatches the event right away"""
+    events = SSEEventParser().feed(b"data: a\r\r")
+    assert [event.data for event in events] == [b"a"]
+
+
+def test_flush_dispatches_the_last_event():
+    """An event cut short by the end of the body comes out of flush()"""
+    parser = SSEEventParser()
+    assert [event.data for event in parser.feed(b"data: a\n\ndata: b")] == [b"a"]
+    assert [event.data for event in parser.flush()] == [b"b"]
+    assert parser.flush() == []
+
+    parser = SSEEventParser()
+    assert parser.feed(b"data: c\n") == []
+    assert [event.data for event in parser.flush()] == [b"c"]
+
+
+def test_long_line_over_many_chunks():
+    """A line split over many chunks is only parsed once it is complete"""
+    parser = SSEEventParser()
+    payload = b"x" * 100000
+    body = b"data: " + payload + b"\n\n"
+    events = []
+    for i in range(0, len(body), 7):
+        events.extend(parser.feed(body[i:i + 7]))
+    assert [event.data for event in events] == [payload]
+
+
+def start_server(honour_last_event_id):
+    """Run a completion server whose first stream drops after two events, return it and the requests it saw"""
+    requests_seen = []
+
+    def event(event_id, content, done=False):
+        data = {"type": "chat:completion", "data": {"phase": "answer", "delta_content": content, "done": done}}
+        return f"retry: 10\nid: {event_id}\ndata: {json.dumps(data)}\n\n".encode()
+
+    class Handler(MockHandler):
+        def do_POST(self):
+            self.read_json()
+            last_event_id = self.headers.get("last-event-id")
+            requests_seen.append(last_event_id)
+            self.start_chunked()
+            if last_event_id and honour_last_event_id:
+                events = [event(3, "!", done=True)]
+            else:
+                events = [event(1, "Hel"), event(2, "lo")]
+            for payload in events:
+                self.write_chunk(payload)
+            if last_event_id and honour_last_event_id:
+                self.write_chunk(b"")
+            else:
+                self.close_connection = True
+
+    return MockServer(Handler), requests_seen
+
+
+def stream(url):
+    """Stream one completion, return the content and the error it ended with"""
+    streaming_ops = StreamingOperations(HTTPClient(url, timeout=10))
+    content = []
+    try:
+        for chunk in streaming_ops.stream_payload(b"{}"):
+            content.append(chunk.delta_content)
+    except ZAIError as e:
+        return "".join(content), e
+    return "".join(content), None
+
+
+def test_resume_continues_the_stream():
+    """A server that honours Last-Event-ID sends the rest of the answer"""
+    server, requests_seen = start_server(honour_last_event_id=True)
+    with server:
+        content, error = stream(server.url)
+        assert error is None, error
+        assert content == "Hello!"
+        assert requests_seen == [None, "2"]
+
+
+def test_resume_ignored_is_not_appended():
+    """A server that starts the answer over fails the stream instead of repeating it"""
+    server, requests_seen = start_server(honour_last_event_id=False)
+    with server:
+        content, error = stream(server.url)
+        assert isinstance(error, ZAIError), error
+        assert content == "Hello"
+        assert requests_seen == [None, "2"]
+
+
+def main():
+    print("🧪 SSE event parser")
+    print("=" * 50)
+    test_line_endings_split_at_every_byte()
+    print("✓ CR, LF and CRLF streams parse the same at every chunk split")
+    test_crlf_split_between_cr_and_lf()
+    test_bare_cr_dispatches_without_more_input()
+    test_flush_dispatches_the_last_event()
+    print("✓ Split CRLF, bare CR and flush() dispatch each event once")
+    test_long_line_over_many_chunks()
+    print("✓ A long line split over many chunks parses once complete")
+    test_resume_continues_the_stream()
+    print("✓ A dropped stream resumes after Last-Event-ID")
+    test_resume_ignored_is_not_appended()
+    print("✓ A restarted stream raises instead of repeating the answer")
+
+
+if __name__ == "__main__":
+    main()
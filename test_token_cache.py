@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the guest token cache: one fetch per key at a time, fetches of
+different keys in parallel, and an event loop that keeps running while the
+async auth manager waits on the cache
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from zai.core.async_auth import AsyncAuthManager
+from zai.core.token_cache import TokenCache
+
+FETCH_SECONDS = 0.3
+
+
+def new_cache(directory):
+    """A token cache in its own directory"""
+    return TokenCache(path=f"{directory}/tokens.json")
+
+
+def slow_fetch(fetches, key):
+    """A fetch for key that takes FETCH_SECONDS and counts its calls"""
+    def fetch():
+        fetches.append(key)
+        time.sleep(FETCH_SECONDS)
+        return {"token": f"token-{key}-{len(fetches)}"}
+    return fetch
+
+
+def test_one_fetch_per_key():
+    """Concurrent misses on one key make a single fetch and share its token"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = new_cache(directory)
+        fetches = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(lambda _: cache.get_or_fetch("base", slow_fetch(fetches, "base"))["token"], range(8)))
+        assert fetches == ["base"]
+        assert set(tokens) == {"token-base-1"}
+        assert cache.stats.to_dict()["fetches"] == 1
+
+
+def test_keys_fetch_in_parallel():
+    """A slow fetch for one key does not hold up the fetch for another"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = new_cache(directory)
+        fetches = []
+        keys = ["base", "base#1", "base#2", "base#3"]
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            list(executor.map(lambda key: cache.get_or_fetch(key, slow_fetch(fetches, key)), keys))
+        elapsed = time.monotonic() - start
+        assert sorted(fetches) == sorted(keys)
+        assert elapsed < FETCH_SECONDS * 2, f"fetches of {len(keys)} keys took {elapsed:.2f}s"
+        for key in keys:
+            assert cache.get(key) is not None
+
+
+def test_async_lookup_does_not_block_the_loop():
+    """The async auth manager reads the cache without stalling the event loop"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = new_cache(directory)
+        cache.put("http://mock", {"token": "cached"})
+        manager = AsyncAuthManager(SimpleNamespace(base_url="http://mock"), cache)
+
+        async def run():
+            ticks = 0
+            holder = threading.Thread(target=lambda: (cache._lock.acquire(), time.sleep(FETCH_SECONDS), cache._lock.release()))
+            holder.start()
+            await asyncio.sleep(0.01)
+            lookup = asyncio.ensure_future(manager.get_guest_token())
+            while not lookup.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            holder.join()
+            return await lookup, ticks
+
+        token, ticks = asyncio.run(run())
+        assert token == "cached"
+        assert ticks >= 5, f"the event loop ran only {ticks} times while the cache was locked"
+
+
+def main():
+    print("🧪 Guest token cache")
+    print("=" * 50)
+    test_one_fetch_per_key()
+    print("✓ Concurrent misses on one key make one fetch")
+    test_keys_fetch_in_parallel()
+    print("✓ Fetches for different keys run in parallel")
+    test_async_lookup_does_not_block_the_loop()
+    print("✓ The async auth manager does not block the event loop on the cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Generate the Z.AI model catalog snapshot from the live /api/v1/models
+"""
+
+import argparse
+
+from zai.client import ZAIClient
+from zai.operations.catalog import SNAPSHOT_PATH, write_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="https://chat.z.ai", help="Z.AI host to fetch the catalog from")
+    parser.add_argument("--output", default=SNAPSHOT_PATH, help="Snapshot file to write")
+    args = parser.parse_args()
+
+    client = ZAIClient(base_url=args.base_url)
+    client.model_ops.refresh_models()
+    if client.model_ops.catalog.source != "server":
+        parser.error("the catalog was not fetched from the server, not writing a snapshot")
+    models = client.get_models()
+    write_snapshot(models, client.http_client.base_url, args.output)
+
+    print(f"Wrote {len(models)} models to {args.output}")
+    for model in models:
+        print(f"  {model.id}: {model.name}")
+
+
+if __name__ == "__main__":
+    main()
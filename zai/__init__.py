@@ -4,7 +4,9 @@ A Python client for the Z.AI API.
 """
 
 from .client import ZAIClient
-from .core import ZAIError
+from .async_client import AsyncZAIClient
+from .core import Deadline, DeadlineExceeded, ZAIError
+from .operations import BatchResult, Conversation
 from .models import (
     Chat,
     ChatCompletionResponse,
@@ -25,7 +27,12 @@ __author__ = "Z.AI SDK Team"
 
 __all__ = [
     "ZAIClient",
+    "AsyncZAIClient",
+    "Conversation",
+    "BatchResult",
     "ZAIError",
+    "Deadline",
+    "DeadlineExceeded",
     "Model",
     "ModelCapabilities",
     "ModelParams",
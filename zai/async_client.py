@@ -0,0 +1,275 @@
+"""Async Z.AI API Client."""
+
+import asyncio
+from typing import AsyncGenerator, Dict, List, Optional
+
+from .core import AsyncAuthManager, AsyncHTTPClient, get_token_cache
+from .models import ChatCompletionResponse, ChatResponse, MCPFeature, Model, StreamingChunk
+from .operations import AsyncChatOperations, AsyncModelOperations
+
+
+class AsyncZAIClient:
+    """Asyncio Z.AI API Client.
+    
+    Mirrors ZAIClient on a non-blocking transport so one event loop can
+    hold many concurrent completion streams. Use it as an async context
+    manager, or call ``await client.authenticate()`` and
+    ``await client.aclose()`` yourself.
+    """
+    
+    def __init__(
+        self,
+        token: str = None,
+        base_url: str = "https://chat.z.ai",
+        timeout: int = 180,
+        auto_auth: bool = True,
+        verbose: bool = False,
+        max_connections: int = 100,
+        stream_compression: bool = True,
+        cache_token: bool = True
+    ):
+        """
+        Initialize async Z.AI client.
+        
+        No network I/O happens here; the guest token is fetched on first
+        use (or by authenticate()) when auto_auth is enabled.
+        
+        Args:
+            token (str): Bearer token for authentication (optional if auto_auth=True).
+            base_url (str): Base URL for Z.AI API.
+            timeout (int): Request timeout in seconds.
+            auto_auth (bool): Automatically get guest token if no token provided.
+            verbose (bool): Enable verbose output for debugging.
+            max_connections (int): Maximum concurrent connections to the API host.
+            stream_compression (bool): Negotiate gzip/deflate/br for completion streams.
+            cache_token (bool): Share guest tokens with other clients and processes through the token cache.
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.verbose = verbose
+        self.auto_auth = auto_auth
+        
+        self.http_client = AsyncHTTPClient(
+            base_url,
+            timeout,
+            verbose=verbose,
+            max_connections=max_connections,
+            stream_compression=stream_compression
+        )
+        self.auth_manager = AsyncAuthManager(self.http_client, get_token_cache() if cache_token else None)
+        self.model_ops = AsyncModelOperations(self.http_client)
+        
+        if token:
+            self.auth_manager.set_token(token)
+        
+        self.chat_ops = AsyncChatOperations(
+            self.http_client,
+            self.model_ops,
+            self.auth_manager.get_auth_data()
+        )
+        self._auth_lock: Optional[asyncio.Lock] = None
+    
+    async def __aenter__(self) -> "AsyncZAIClient":
+        await self.authenticate()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    @property
+    def token(self) -> Optional[str]:
+        """
+        Get current authentication token.
+        
+        Returns:
+            Optional[str]: Current token if set.
+        """
+        return self.auth_manager.token
+    
+    @property
+    def auth_data(self) -> Optional[Dict]:
+        """
+        Get authentication data.
+        
+        Returns:
+            Optional[Dict]: Authentication data if available.
+        """
+        return self.auth_manager.get_auth_data()
+    
+    async def authenticate(self) -> Optional[str]:
+        """
+        Fetch a guest token if none is set and auto_auth is enabled.
+        
+        Concurrent callers share a single token request.
+        
+        Returns:
+            Optional[str]: Current token if set.
+        """
+        if self.auth_manager.token or not self.auto_auth:
+            return self.auth_manager.token
+        
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        
+        async with self._auth_lock:
+            if not self.auth_manager.token:
+                token = await self.auth_manager.get_guest_token()
+                self.auth_manager.set_token(token)
+                self.chat_ops.auth_data = self.auth_manager.get_auth_data()
+        
+        return self.auth_manager.token
+    
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.http_client.aclose()
+    
+    async def get_models(self) -> List[Model]:
+        """
+        Get available models.
+        
+        Returns:
+            List[Model]: List of available Model objects.
+        """
+        await self.authenticate()
+        return await self.model_ops.get_models()
+    
+    async def get_model_by_id(self, model_id: str) -> Optional[Model]:
+        """
+        Get a specific model by ID.
+        
+        Args:
+            model_id (str): The model ID to search for.
+        
+        Returns:
+            Optional[Model]: Model object if found, None otherwise.
+        """
+        await self.authenticate()
+        return await self.model_ops.get_model_by_id(model_id)
+    
+    async def create_chat(
+        self,
+        title: str = "New Chat",
+        models: List[str] = None,
+        initial_message: Optional[str] = None,
+        enable_thinking: bool = True,
+        features: List[MCPFeature] = None
+    ) -> ChatResponse:
+        """
+        Create a new chat.
+        
+        Args:
+            title (str): Chat title.
+            models (List[str]): List of model IDs to use.
+            initial_message (Optional[str]): Optional initial message.
+            enable_thinking (bool): Enable thinking mode.
+            features (List[MCPFeature]): MCP features configuration.
+        
+        Returns:
+            ChatResponse: ChatResponse object.
+        """
+        await self.authenticate()
+        return await self.chat_ops.create_chat(
+            title=title,
+            models=models,
+            initial_message=initial_message,
+            enable_thinking=enable_thinking,
+            features=features
+        )
+    
+    async def stream_completion(
+        self,
+        chat_id: str,
+        messages: List[Dict[str, str]],
+        model: str = "0727-360B-API",
+        enable_thinking: bool = True,
+        features: Optional[Dict] = None,
+        variables: Optional[Dict[str, str]] = None
+    ) -> AsyncGenerator[StreamingChunk, None]:
+        """
+        Stream chat completion.
+        
+        Args:
+            chat_id (str): Chat ID.
+            messages (List[Dict[str, str]]): List of messages in OpenAI format.
+            model (str): Model ID to use.
+            enable_thinking (bool): Enable thinking phase.
+            features (Optional[Dict]): Features configuration.
+            variables (Optional[Dict[str, str]]): Template variables.
+        
+        Yields:
+            StreamingChunk: StreamingChunk objects.
+        """
+        await self.authenticate()
+        async for chunk in self.chat_ops.streaming_ops.stream_completion(
+            chat_id=chat_id,
+            messages=messages,
+            model=model,
+            enable_thinking=enable_thinking,
+            features=features,
+            variables=variables,
+            model_ops=self.model_ops
+        ):
+            yield chunk
+    
+    async def complete_chat(
+        self,
+        chat_id: str,
+        messages: List[Dict[str, str]],
+        model: str = "0727-360B-API",
+        enable_thinking: bool = True
+    ) -> ChatCompletionResponse:
+        """
+        Complete chat and return full response.
+        
+        Args:
+            chat_id (str): Chat ID.
+            messages (List[Dict[str, str]]): List of messages.
+            model (str): Model ID.
+            enable_thinking (bool): Enable thinking mode.
+        
+        Returns:
+            ChatCompletionResponse: ChatCompletionResponse with complete content.
+        """
+        await self.authenticate()
+        return await self.chat_ops.complete_chat(
+            chat_id=chat_id,
+            messages=messages,
+            model=model,
+            enable_thinking=enable_thinking
+        )
+    
+    async def simple_chat(
+        self,
+        message: str,
+        model: str = "glm-4.5v",
+        enable_thinking: bool = True,
+        chat_title: str = "Simple Chat",
+        temperature: float = None,
+        top_p: float = None,
+        max_tokens: int = None
+    ) -> ChatCompletionResponse:
+        """
+        Simple one-shot chat completion using the actual Z.AI API.
+        
+        Args:
+            message (str): User message.
+            model (str): Model ID (e.g., 'glm-4.5v', '0727-360B-API').
+            enable_thinking (bool): Enable thinking mode.
+            chat_title (str): Chat title.
+            temperature (float): Controls randomness (0.0-2.0, default varies by model).
+            top_p (float): Controls diversity (0.0-1.0, default varies by model).
+            max_tokens (int): Maximum response length (default varies by model).
+        
+        Returns:
+            ChatCompletionResponse: ChatCompletionResponse with AI response.
+        """
+        await self.authenticate()
+        return await self.chat_ops.simple_chat(
+            message=message,
+            model=model,
+            enable_thinking=enable_thinking,
+            chat_title=chat_title,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens
+        )
\ No newline at end of file
@@ -1,10 +1,24 @@
 """Z.AI API Client."""
 
-from typing import Dict, Generator, List, Optional
+from concurrent.futures import Future
+from typing import Dict, Generator, Iterable, Iterator, List, Optional, Union
 
-from .core import AuthManager, HTTPClient, ZAIError
+from .core import (
+    AuthManager,
+    Bootstrap,
+    Deadline,
+    HedgePolicy,
+    Hedger,
+    HTTPClient,
+    RetryPolicy,
+    ZAIError,
+    get_registry,
+    get_token_cache
+)
+from .core.http_client import DEFAULT_HEADERS
 from .models import ChatCompletionResponse, ChatResponse, MCPFeature, Model, StreamingChunk
-from .operations import ChatOperations, ModelOperations
+from .custom_models import get_preset
+from .operations import BatchResult, ChatOperations, Conversation, ModelOperations, iter_batch
 
 
 class ZAIClient:
@@ -16,7 +30,16 @@ class ZAIClient:
         base_url: str = "https://chat.z.ai",
         timeout: int = 180,
         auto_auth: bool = True,
-        verbose: bool = False
+        verbose: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        http2: bool = False,
+        stream_compression: bool = True,
+        hedge_policy: Optional[HedgePolicy] = None,
+        hedge_completions: bool = False,
+        cache_token: bool = True,
+        token_pool_size: int = 0,
+        chat_pool_size: int = 0,
+        bootstrap: bool = False
     ):
         """
         Initialize Z.AI client.
@@ -27,26 +50,114 @@ class ZAIClient:
             timeout (int): Request timeout in seconds.
             auto_auth (bool): Automatically get guest token if no token provided.
             verbose (bool): Enable verbose output for debugging.
+            retry_policy (Optional[RetryPolicy]): Retry policy for idempotent requests.
+            http2 (bool): Multiplex requests over a shared HTTP/2 connection (needs httpx[http2]).
+            stream_compression (bool): Negotiate gzip/deflate/br for completion streams.
+            hedge_policy (Optional[HedgePolicy]): Hedge slow model catalog requests with this policy.
+            hedge_completions (bool): Also hedge simple_chat completion requests; each hedge makes the upstream generate the answer twice and can leave a duplicate assistant message in the chat.
+            cache_token (bool): Share guest tokens with other clients and processes through the token cache.
+            token_pool_size (int): Spread requests over this many guest tokens (pooling is off below 2).
+            chat_pool_size (int): Keep this many chats per model created ahead for simple_chat (off at 0).
+            bootstrap (bool): Get the guest token and warm connections concurrently in the background, then load the model catalog (see ready).
         """
         self.base_url = base_url
         self.timeout = timeout
         self.verbose = verbose
         
-        self.http_client = HTTPClient(base_url, timeout, verbose=verbose)
-        self.auth_manager = AuthManager(self.http_client)
+        self.http_client = HTTPClient(
+            base_url,
+            timeout,
+            verbose=verbose,
+            retry_policy=retry_policy,
+            http2=http2,
+            stream_compression=stream_compression,
+            hedger=Hedger(base_url, hedge_policy) if hedge_policy else None
+        )
+        self.auth_manager = AuthManager(self.http_client, get_token_cache() if cache_token else None)
         self.model_ops = ModelOperations(self.http_client)
         
-        if not token and auto_auth:
-            token = self.auth_manager.get_guest_token()
+        self.bootstrap: Optional[Bootstrap] = None
         
-        if token:
-            self.auth_manager.set_token(token)
+        guest = not token and auto_auth
+        if bootstrap:
+            if token:
+                self.auth_manager.set_token(token)
+            self.chat_ops = ChatOperations(self.http_client, self.model_ops)
+            self._start_bootstrap(guest, token_pool_size, http2)
+        else:
+            if guest:
+                token = self.auth_manager.get_guest_token()
+            
+            if token:
+                self.auth_manager.set_token(token)
+            
+            if guest and token_pool_size > 1:
+                self.auth_manager.start_token_pool(token_pool_size)
+            
+            self.chat_ops = ChatOperations(
+                self.http_client,
+                self.model_ops,
+                self.auth_manager.get_auth_data()
+            )
         
-        self.chat_ops = ChatOperations(
-            self.http_client,
-            self.model_ops,
-            self.auth_manager.get_auth_data()
-        )
+        self.chat_ops.hedge_completions = hedge_completions
+        if chat_pool_size > 0:
+            self.chat_ops.start_chat_pool(chat_pool_size)
+    
+    def _start_bootstrap(self, guest: bool, token_pool_size: int, http2: bool):
+        """
+        Start the startup steps concurrently.
+        
+        Authenticated requests wait for the guest token only, so the first
+        chat does not wait for the model catalog or the warm-up. The
+        catalog request is authenticated as well, so it starts once the
+        token is set. If getting the token fails, the next authenticated
+        request tries again inline.
+        
+        Args:
+            guest (bool): Get a guest token.
+            token_pool_size (int): Guest tokens to pool (pooling is off below 2).
+            http2 (bool): The client uses HTTP/2, which the connection warm-up does not cover.
+        """
+        self.bootstrap = Bootstrap()
+        if guest:
+            self.http_client.auth_ready = self.bootstrap.step(
+                "auth", lambda: self._authenticate(token_pool_size)
+            )
+            self.http_client.reauthenticate = lambda: self._authenticate(token_pool_size)
+        if not http2:
+            self.bootstrap.step(
+                "connections",
+                lambda: get_registry().prewarm(self.base_url, headers={"user-agent": DEFAULT_HEADERS["user-agent"]})
+            )
+        self.bootstrap.step("models", self.model_ops.get_models)
+        self.bootstrap.seal()
+    
+    def _authenticate(self, token_pool_size: int):
+        """
+        Get and set a guest token.
+        
+        Args:
+            token_pool_size (int): Guest tokens to pool (pooling is off below 2).
+        """
+        self.auth_manager.set_token(self.auth_manager.get_guest_token())
+        if token_pool_size > 1:
+            self.auth_manager.start_token_pool(token_pool_size)
+        self.chat_ops.auth_data = self.auth_manager.get_auth_data()
+    
+    @property
+    def ready(self) -> Future:
+        """
+        Get the readiness of the client.
+        
+        Returns:
+            Future: Seconds until each bootstrap step finished, or the first step's error (done at once without bootstrap).
+        """
+        if self.bootstrap:
+            return self.bootstrap.ready
+        future = Future()
+        future.set_result({})
+        return future
     
     @property
     def token(self) -> Optional[str]:
@@ -105,7 +216,8 @@ class ZAIClient:
         models: List[str] = None,
         initial_message: Optional[str] = None,
         enable_thinking: bool = True,
-        features: List[MCPFeature] = None
+        features: List[MCPFeature] = None,
+        deadline: Union[Deadline, float, None] = None
     ) -> ChatResponse:
         """
         Create a new chat.
@@ -116,6 +228,7 @@ class ZAIClient:
             initial_message (Optional[str]): Optional initial message.
             enable_thinking (bool): Enable thinking mode.
             features (List[MCPFeature]): MCP features configuration.
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole call.
         
         Returns:
             ChatResponse: ChatResponse object.
@@ -125,7 +238,8 @@ class ZAIClient:
             models=models,
             initial_message=initial_message,
             enable_thinking=enable_thinking,
-            features=features
+            features=features,
+            deadline=deadline
         )
     
     def stream_completion(
@@ -135,7 +249,8 @@ class ZAIClient:
         model: str = "0727-360B-API",
         enable_thinking: bool = True,
         features: Optional[Dict] = None,
-        variables: Optional[Dict[str, str]] = None
+        variables: Optional[Dict[str, str]] = None,
+        deadline: Union[Deadline, float, None] = None
     ) -> Generator[StreamingChunk, None, None]:
         """
         Stream chat completion.
@@ -147,6 +262,7 @@ class ZAIClient:
             enable_thinking (bool): Enable thinking phase.
             features (Optional[Dict]): Features configuration.
             variables (Optional[Dict[str, str]]): Template variables.
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole call.
         
         Yields:
             StreamingChunk: StreamingChunk objects.
@@ -158,7 +274,8 @@ class ZAIClient:
             enable_thinking=enable_thinking,
             features=features,
             variables=variables,
-            model_ops=self.model_ops
+            model_ops=self.model_ops,
+            deadline=deadline
         )
     
     def complete_chat(
@@ -166,7 +283,8 @@ class ZAIClient:
         chat_id: str,
         messages: List[Dict[str, str]],
         model: str = "0727-360B-API",
-        enable_thinking: bool = True
+        enable_thinking: bool = True,
+        deadline: Union[Deadline, float, None] = None
     ) -> ChatCompletionResponse:
         """
         Complete chat and return full response.
@@ -176,6 +294,7 @@ class ZAIClient:
             messages (List[Dict[str, str]]): List of messages.
             model (str): Model ID.
             enable_thinking (bool): Enable thinking mode.
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole call.
         
         Returns:
             ChatCompletionResponse: ChatCompletionResponse with complete content.
@@ -184,7 +303,8 @@ class ZAIClient:
             chat_id=chat_id,
             messages=messages,
             model=model,
-            enable_thinking=enable_thinking
+            enable_thinking=enable_thinking,
+            deadline=deadline
         )
     
     def simple_chat(
@@ -195,7 +315,8 @@ class ZAIClient:
         chat_title: str = "Simple Chat",
         temperature: float = None,
         top_p: float = None,
-        max_tokens: int = None
+        max_tokens: int = None,
+        deadline: Union[Deadline, float, None] = None
     ) -> ChatCompletionResponse:
         """
         Simple one-shot chat completion using the actual Z.AI API.
@@ -208,6 +329,7 @@ class ZAIClient:
             temperature (float): Controls randomness (0.0-2.0, default varies by model).
             top_p (float): Controls diversity (0.0-1.0, default varies by model).
             max_tokens (int): Maximum response length (default varies by model).
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole call.
         
         Returns:
             ChatCompletionResponse: ChatCompletionResponse with AI response.
@@ -219,5 +341,134 @@ class ZAIClient:
             chat_title=chat_title,
             temperature=temperature,
             top_p=top_p,
-            max_tokens=max_tokens
-        )
\ No newline at end of file
+            max_tokens=max_tokens,
+            deadline=deadline
+        )
+    
+    def conversation(
+        self,
+        model: Optional[str] = None,
+        preset: Optional[str] = None,
+        enable_thinking: bool = True,
+        title: str = "Conversation",
+        temperature: float = None,
+        top_p: float = None,
+        max_tokens: int = None
+    ) -> Conversation:
+        """
+        Start a multi-turn conversation on one chat.
+        
+        Args:
+            model (Optional[str]): Model ID (defaults to the preset's model, or 'glm-4.5v').
+            preset (Optional[str]): Name of a preset in zai.custom_models for the sampling params.
+            enable_thinking (bool): Enable thinking mode.
+            title (str): Chat title.
+            temperature (float): Controls randomness, over the preset (default varies by model).
+            top_p (float): Controls diversity, over the preset (default varies by model).
+            max_tokens (int): Maximum response length, over the preset (default varies by model).
+        
+        Returns:
+            Conversation: Conversation whose first message creates the chat.
+        """
+        return Conversation(
+            self.chat_ops,
+            enable_thinking=enable_thinking,
+            title=title,
+            **self._chat_params(model, preset, temperature, top_p, max_tokens)
+        )
+    
+    def batch_chat(
+        self,
+        prompts: Iterable[str],
+        model: Optional[str] = None,
+        preset: Optional[str] = None,
+        max_concurrency: int = 8,
+        enable_thinking: bool = True,
+        deadline: Optional[float] = None
+    ) -> List[BatchResult]:
+        """
+        Answer many prompts with simple_chat, several at a time.
+        
+        The workers share the client's connection pool; keep
+        max_concurrency within its size (UPSTREAM_POOL_MAXSIZE, 32 by
+        default) so every worker keeps a warm connection.
+        
+        Args:
+            prompts (Iterable[str]): Prompts to answer.
+            model (Optional[str]): Model ID (defaults to the preset's model, or 'glm-4.5v').
+            preset (Optional[str]): Name of a preset in zai.custom_models for the sampling params.
+            max_concurrency (int): Most chats running at the same time.
+            enable_thinking (bool): Enable thinking mode.
+            deadline (Optional[float]): Seconds for each prompt.
+        
+        Returns:
+            List[BatchResult]: One result per prompt, in prompt order; failed prompts carry their error.
+        """
+        results = list(self.iter_batch_chat(prompts, model, preset, max_concurrency, enable_thinking, deadline))
+        results.sort(key=lambda result: result.index)
+        return results
+    
+    def iter_batch_chat(
+        self,
+        prompts: Iterable[str],
+        model: Optional[str] = None,
+        preset: Optional[str] = None,
+        max_concurrency: int = 8,
+        enable_thinking: bool = True,
+        deadline: Optional[float] = None
+    ) -> Iterator[BatchResult]:
+        """
+        Answer many prompts with simple_chat, yielding each result as it completes.
+        
+        Args:
+            prompts (Iterable[str]): Prompts to answer, taken as workers free up.
+            model (Optional[str]): Model ID (defaults to the preset's model, or 'glm-4.5v').
+            preset (Optional[str]): Name of a preset in zai.custom_models for the sampling params.
+            max_concurrency (int): Most chats running at the same time.
+            enable_thinking (bool): Enable thinking mode.
+            deadline (Optional[float]): Seconds for each prompt.
+        
+        Yields:
+            BatchResult: One result per prompt, in completion order; its index is the prompt's position.
+        """
+        params = self._chat_params(model, preset)
+        
+        def chat(prompt: str) -> ChatCompletionResponse:
+            return self.chat_ops.simple_chat(
+                message=prompt,
+                enable_thinking=enable_thinking,
+                chat_title="Batch Chat",
+                deadline=deadline,
+                **params
+            )
+        
+        return iter_batch(chat, prompts, max_concurrency)
+    
+    def _chat_params(
+        self,
+        model: Optional[str],
+        preset: Optional[str],
+        temperature: float = None,
+        top_p: float = None,
+        max_tokens: int = None
+    ) -> Dict:
+        """
+        Resolve the model and sampling params from a preset and overrides.
+        
+        Args:
+            model (Optional[str]): Model ID, over the preset's.
+            preset (Optional[str]): Name of a preset in zai.custom_models.
+            temperature (float): Temperature, over the preset's.
+            top_p (float): Top-p, over the preset's.
+            max_tokens (int): Max tokens, over the preset's.
+        
+        Returns:
+            Dict: model, temperature, top_p and max_tokens; unset params are None.
+        """
+        params = get_preset(preset) if preset else {}
+        return {
+            "model": model or params.get("model", "glm-4.5v"),
+            "temperature": temperature if temperature is not None else params.get("temperature"),
+            "top_p": top_p if top_p is not None else params.get("top_p"),
+            "max_tokens": max_tokens if max_tokens is not None else params.get("max_tokens")
+        }
\ No newline at end of file
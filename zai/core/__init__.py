@@ -2,10 +2,43 @@
 
 from .http_client import HTTPClient
 from .auth import AuthManager
-from .exceptions import ZAIError
+from .bootstrap import Bootstrap
+from .async_http_client import AsyncHTTPClient
+from .async_auth import AsyncAuthManager
+from .circuit_breaker import CircuitBreaker
+from .compression import StreamDecompressor, get_compression_stats
+from .deadline import Deadline
+from .exceptions import DeadlineExceeded, ZAIError
+from .hedging import HedgePolicy, Hedger, get_hedge_stats
+from .http2 import HTTP2Transport
+from .retry import RetryBudget, RetryPolicy, get_retry_stats
+from .token_cache import TokenCache, get_token_cache
+from .token_pool import TokenPool
+from .transport import PoolConfig, TransportRegistry, get_registry
 
 __all__ = [
     "HTTPClient",
     "AuthManager",
-    "ZAIError"
+    "AsyncHTTPClient",
+    "AsyncAuthManager",
+    "Bootstrap",
+    "ZAIError",
+    "Deadline",
+    "DeadlineExceeded",
+    "PoolConfig",
+    "TransportRegistry",
+    "get_registry",
+    "HTTP2Transport",
+    "RetryBudget",
+    "RetryPolicy",
+    "get_retry_stats",
+    "CircuitBreaker",
+    "StreamDecompressor",
+    "get_compression_stats",
+    "HedgePolicy",
+    "Hedger",
+    "get_hedge_stats",
+    "TokenCache",
+    "get_token_cache",
+    "TokenPool"
 ]
@@ -0,0 +1,78 @@
+"""Async authentication manager for Z.AI API."""
+
+import asyncio
+from typing import Optional
+
+from .auth import AuthManager
+from .exceptions import ZAIError
+
+
+class AsyncAuthManager(AuthManager):
+    """Manages authentication for the async Z.AI client."""
+    
+    _async_refresh_lock: Optional[asyncio.Lock] = None
+    
+    async def get_guest_token(self) -> str:
+        """
+        Get a guest token, from the token cache when it holds a valid one.
+        
+        Unlike the sync manager, no cache lock is held while the token is
+        fetched, and the cache is read and written on a worker thread, so
+        the event loop never waits on the cache's file locks.
+        
+        Returns:
+            str: Guest token string.
+        """
+        try:
+            key = self.http_client.base_url
+            auth_data = await asyncio.to_thread(self.token_cache.get, key) if self.token_cache else None
+            
+            if auth_data is None:
+                response = await self.http_client.make_request(
+                    "GET",
+                    "/api/v1/auths/",
+                    auth=False
+                )
+                auth_data = self._parse_auth_data(response.content)
+                if self.token_cache:
+                    await asyncio.to_thread(self.token_cache.put, key, auth_data)
+            
+            self.auth_data = auth_data
+            self.token = auth_data["token"]
+            
+            return self.token
+        
+        except Exception as e:
+            raise ZAIError(f"Failed to get guest token: {e}")
+    
+    async def refresh_token(self, rejected_token: str) -> bool:
+        """
+        Replace a guest token the API rejected.
+        
+        Only one coroutine fetches; the others wait for it and then
+        reuse its token. Tokens set by the caller are never replaced.
+        
+        Args:
+            rejected_token (str): Token the failed request was sent with.
+        
+        Returns:
+            bool: True if a different token is now set.
+        """
+        if self._async_refresh_lock is None:
+            self._async_refresh_lock = asyncio.Lock()
+        
+        async with self._async_refresh_lock:
+            if self.token and self.token != rejected_token:
+                return True
+            if not self._is_guest_token(rejected_token):
+                return False
+            
+            if self.token_cache:
+                await asyncio.to_thread(self.token_cache.invalidate, self.http_client.base_url, rejected_token)
+            try:
+                token = await self.get_guest_token()
+            except ZAIError:
+                return False
+            
+            self.set_token(token)
+            return token != rejected_token
\ No newline at end of file
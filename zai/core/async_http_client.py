@@ -0,0 +1,216 @@
+"""Async HTTP Client for Z.AI API."""
+
+from typing import Awaitable, Callable, Dict, Optional, Union
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .compression import accept_encoding, aiter_body, get_compression_stats
+from .exceptions import ZAIError
+from .http_client import AUTH_FAILURE_STATUSES, DEFAULT_HEADERS
+from ..utils.json_template import encode
+
+
+class AsyncHTTPClient:
+    """Asyncio HTTP Client for Z.AI API requests."""
+    
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int,
+        client: Optional["httpx.AsyncClient"] = None,
+        verbose: bool = False,
+        max_connections: int = 100,
+        stream_compression: bool = True
+    ):
+        """
+        Initialize async HTTP client.
+        
+        Args:
+            base_url (str): Base URL for API requests.
+            timeout (int): Request timeout in seconds.
+            client (Optional[httpx.AsyncClient]): Optional client to use.
+            verbose (bool): Enable verbose output.
+            max_connections (int): Maximum concurrent connections to the API host.
+            stream_compression (bool): Negotiate gzip/deflate/br for streamed responses.
+        """
+        if httpx is None and client is None:
+            raise ZAIError("Async client requires the 'httpx' package: pip install httpx")
+        
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.verbose = verbose
+        self.stream_compression = stream_compression
+        self.compression_stats = get_compression_stats().get(self.base_url)
+        self.client = client or self._create_client(max_connections)
+        self.on_auth_failure: Optional[Callable[[str], Awaitable[bool]]] = None
+    
+    def _create_client(self, max_connections: int) -> "httpx.AsyncClient":
+        """
+        Create a new async client with default headers.
+        
+        Args:
+            max_connections (int): Maximum concurrent connections.
+        
+        Returns:
+            httpx.AsyncClient: Configured client object.
+        """
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=DEFAULT_HEADERS,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+    
+    @property
+    def headers(self):
+        """
+        Get client default headers.
+        
+        Returns:
+            httpx.Headers: Headers sent with every request.
+        """
+        return self.client.headers
+    
+    def set_auth_header(self, token: str):
+        """
+        Set authorization header.
+        
+        Args:
+            token (str): Bearer token for authentication.
+        """
+        self.client.headers["authorization"] = f"Bearer {token}"
+    
+    def update_headers(self, headers: Dict[str, str]):
+        """
+        Update client headers.
+        
+        Args:
+            headers (Dict[str, str]): Headers to update.
+        """
+        self.client.headers.update(headers)
+    
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Union[Dict, bytes]] = None,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        auth: bool = True
+    ) -> "httpx.Response":
+        """
+        Make HTTP request to API.
+        
+        Streamed responses are returned unread; read them with aiter_stream
+        and close them with ``await response.aclose()``.
+        
+        A request rejected with 401 or 403 is replayed once after
+        on_auth_failure refreshed the token it was sent with.
+        
+        Args:
+            method (str): HTTP method.
+            endpoint (str): API endpoint.
+            data (Optional[Union[Dict, bytes]]): Request payload, or a body encoded in advance.
+            stream (bool): Whether to stream response.
+            headers (Optional[Dict[str, str]]): Extra headers for this request only.
+            auth (bool): Refresh rejected tokens (off for the auth endpoint itself).
+        
+        Returns:
+            httpx.Response: Response object.
+        """
+        url = f"{self.base_url}{endpoint}"
+        
+        if stream:
+            timeout = httpx.Timeout(60, connect=30)
+            headers = {"accept-encoding": accept_encoding(self.stream_compression), **(headers or {})}
+        else:
+            timeout = httpx.Timeout(self.timeout)
+        
+        auth_replayed = not auth
+        while True:
+            sent_auth = self.client.headers.get("authorization", "")
+            try:
+                request = self.client.build_request(
+                    method,
+                    url,
+                    content=encode(data) if data else None,
+                    headers=headers,
+                    timeout=timeout
+                )
+                response = await self.client.send(request, stream=stream)
+                
+                if self.verbose:
+                    print(f"[DEBUG] Request to {url}")
+                    print(f"[DEBUG] Status: {response.status_code}")
+                    if not stream:
+                        print(f"[DEBUG] Response text: {response.text[:500]}")
+                
+                if response.is_error:
+                    if not auth_replayed and await self._refresh_auth(response, sent_auth):
+                        auth_replayed = True
+                        await response.aclose()
+                        continue
+                    await self._raise_for_status(response)
+                
+                return response
+            
+            except httpx.HTTPError as e:
+                raise ZAIError(f"API request failed: {e}")
+    
+    async def _refresh_auth(self, response: "httpx.Response", sent_auth: str) -> bool:
+        """
+        Decide whether a request rejected for its token is replayed.
+        
+        Args:
+            response (httpx.Response): Error response.
+            sent_auth (str): Authorization header the request was sent with.
+        
+        Returns:
+            bool: True if on_auth_failure set a different token.
+        """
+        if response.status_code not in AUTH_FAILURE_STATUSES or not self.on_auth_failure:
+            return False
+        if not sent_auth.startswith("Bearer "):
+            return False
+        return await self.on_auth_failure(sent_auth[len("Bearer "):])
+    
+    def aiter_stream(self, response: "httpx.Response"):
+        """
+        Iterate over the decompressed body of a streamed response.
+        
+        Args:
+            response (httpx.Response): Response returned by make_request(stream=True).
+        
+        Returns:
+            AsyncIterator[bytes]: Decompressed body chunks.
+        """
+        return aiter_body(response, self.compression_stats)
+    
+    async def _raise_for_status(self, response: "httpx.Response"):
+        """
+        Raise ZAIError for an error response, including its body.
+        
+        Args:
+            response (httpx.Response): Error response.
+        """
+        try:
+            await response.aread()
+            error_detail = response.text
+        except Exception:
+            error_detail = ""
+        finally:
+            await response.aclose()
+        
+        error_msg = f"API request failed: {response.status_code} Error for url: {response.url}"
+        if error_detail:
+            error_msg += f" - Response: {error_detail}"
+        raise ZAIError(error_msg)
+    
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.client.aclose()
\ No newline at end of file
@@ -1,51 +1,162 @@
 """Authentication manager for Z.AI API."""
 
+import threading
 from typing import Dict, Optional
 
 from .exceptions import ZAIError
 from .http_client import HTTPClient
+from .token_cache import TokenCache
+from .token_pool import PooledToken, TokenPool
+from ..utils.json_codec import loads
 
 
 class AuthManager:
     """Manages authentication for Z.AI API."""
     
-    def __init__(self, http_client: HTTPClient):
+    def __init__(self, http_client: HTTPClient, token_cache: Optional[TokenCache] = None):
         """
         Initialize auth manager.
         
         Args:
             http_client (HTTPClient): HTTP client instance.
+            token_cache (Optional[TokenCache]): Cache to reuse guest tokens from.
         """
         self.http_client = http_client
+        self.token_cache = token_cache
         self.token: Optional[str] = None
         self.auth_data: Optional[Dict] = None
+        self.token_pool: Optional[TokenPool] = None
+        self._refresh_lock = threading.Lock()
+        self.http_client.on_auth_failure = self.refresh_token
     
     def get_guest_token(self) -> str:
         """
-        Get a guest token from Z.AI auth endpoint.
+        Get a guest token, from the token cache when it holds a valid one.
         
         Returns:
             str: Guest token string.
         """
         try:
-            response = self.http_client.make_request(
-                "GET",
-                "/api/v1/auths/"
-            )
-            auth_data = response.json()
-            token = auth_data.get("token")
-            
-            if not token:
-                raise ZAIError("No token found in auth response")
+            if self.token_cache:
+                auth_data = self.token_cache.get_or_fetch(self.http_client.base_url, self._fetch_auth_data)
+            else:
+                auth_data = self._fetch_auth_data()
             
             self.auth_data = auth_data
-            self.token = token
+            self.token = auth_data["token"]
             
-            return token
+            return self.token
             
         except Exception as e:
             raise ZAIError(f"Failed to get guest token: {e}")
     
+    def _fetch_auth_data(self) -> Dict:
+        """
+        Request a new guest token from Z.AI auth endpoint.
+        
+        Returns:
+            Dict: Auth response containing the token.
+        """
+        response = self.http_client.make_request(
+            "GET",
+            "/api/v1/auths/",
+            auth=False
+        )
+        return self._parse_auth_data(response.content)
+    
+    def _parse_auth_data(self, content: bytes) -> Dict:
+        """
+        Decode an auth response body.
+        
+        Args:
+            content (bytes): Response body.
+        
+        Returns:
+            Dict: Auth response containing the token.
+        """
+        auth_data = loads(content)
+        if not auth_data.get("token"):
+            raise ZAIError("No token found in auth response")
+        return auth_data
+    
+    def start_token_pool(self, size: int) -> TokenPool:
+        """
+        Authorize each request with one of ``size`` guest tokens.
+        
+        The first token is fetched now and the rest in the background.
+        With a token cache, every slot has its own cache entry, so worker
+        processes share the pooled tokens as well.
+        
+        Args:
+            size (int): Number of guest tokens kept.
+        
+        Returns:
+            TokenPool: The running pool.
+        """
+        self.token_pool = TokenPool(self._fetch_pooled_auth_data, size, on_evict=self._evict_pooled)
+        self.token_pool.fill(1)
+        self.token_pool.refill_async()
+        self.http_client.token_pool = self.token_pool
+        return self.token_pool
+    
+    def _pool_cache_key(self, slot: int) -> str:
+        """Token cache key of a pool slot; slot 0 shares the client's token."""
+        key = self.http_client.base_url
+        return key if slot == 0 else f"{key}#{slot}"
+    
+    def _fetch_pooled_auth_data(self, slot: int) -> Dict:
+        """
+        Get auth data for a token pool slot.
+        
+        Args:
+            slot (int): Slot number.
+        
+        Returns:
+            Dict: Auth response containing the token.
+        """
+        if self.token_cache:
+            return self.token_cache.get_or_fetch(self._pool_cache_key(slot), self._fetch_auth_data)
+        return self._fetch_auth_data()
+    
+    def _evict_pooled(self, pooled: PooledToken):
+        """Drop an evicted pool token from the token cache."""
+        if self.token_cache:
+            self.token_cache.invalidate(self._pool_cache_key(pooled.slot), pooled.token)
+    
+    def _is_guest_token(self, token: str) -> bool:
+        """Check that a token was fetched as a guest token, not set by the caller."""
+        return bool(self.auth_data) and self.auth_data.get("token") == token
+    
+    def refresh_token(self, rejected_token: str) -> bool:
+        """
+        Replace a guest token the API rejected.
+        
+        Only one caller fetches; callers that hit the same rejection wait
+        for it and then reuse its token. Tokens set by the caller are never
+        replaced.
+        
+        Args:
+            rejected_token (str): Token the failed request was sent with.
+        
+        Returns:
+            bool: True if a different token is now set.
+        """
+        with self._refresh_lock:
+            if self.token and self.token != rejected_token:
+                return True
+            if not self._is_guest_token(rejected_token):
+                return False
+            
+            if self.token_cache:
+                self.token_cache.invalidate(self.http_client.base_url, rejected_token)
+            try:
+                token = self.get_guest_token()
+            except ZAIError:
+                return False
+            
+            self.set_token(token)
+            return token != rejected_token
+    
     def set_token(self, token: str):
         """
         Set authentication token.
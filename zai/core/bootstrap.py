@@ -0,0 +1,95 @@
+"""Concurrent startup steps for API clients."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class Bootstrap:
+    """Runs a client's startup steps at the same time.
+    
+    Each step runs on its own daemon thread as soon as the steps it comes
+    after are done, and gets a Future for its result. Once seal() was
+    called, ``ready`` resolves with the seconds from start until each
+    step finished, or fails with the error of the first step that failed.
+    """
+    
+    def __init__(self):
+        """Initialize bootstrap."""
+        self.started_at = time.monotonic()
+        self.steps: Dict[str, Future] = {}
+        self.timings: Dict[str, float] = {}
+        self.ready: Future = Future()
+        self._lock = threading.Lock()
+        self._running = 0
+        self._sealed = False
+        self._error: Optional[BaseException] = None
+    
+    def step(self, name: str, fn: Callable[[], Any], after: Iterable[str] = ()) -> Future:
+        """
+        Start a step.
+        
+        Args:
+            name (str): Step name.
+            fn (Callable[[], Any]): Work of the step.
+            after (Iterable[str]): Steps that must succeed first; if one fails, so does this one.
+        
+        Returns:
+            Future: Result of fn.
+        """
+        future = Future()
+        waits_on = [self.steps[dependency] for dependency in after]
+        with self._lock:
+            self.steps[name] = future
+            self._running += 1
+        
+        def run():
+            try:
+                for dependency in waits_on:
+                    dependency.result()
+                result = fn()
+            except BaseException as e:
+                future.set_exception(e)
+                self._finish(name, e)
+            else:
+                future.set_result(result)
+                self._finish(name, None)
+        
+        threading.Thread(target=run, name=f"zai-bootstrap-{name}", daemon=True).start()
+        return future
+    
+    def seal(self):
+        """Mark that all steps were started, so ready resolves once they finish."""
+        with self._lock:
+            self._sealed = True
+        self._resolve()
+    
+    def _finish(self, name: str, error: Optional[BaseException]):
+        """Record a finished step."""
+        with self._lock:
+            self.timings[name] = time.monotonic() - self.started_at
+            self._running -= 1
+            if error is not None and self._error is None:
+                self._error = error
+        self._resolve()
+    
+    def _resolve(self):
+        """Resolve ready if sealed and no step is running."""
+        with self._lock:
+            if not self._sealed or self._running or self.ready.done():
+                return
+            if self._error is not None:
+                self.ready.set_exception(self._error)
+            else:
+                self.ready.set_result(dict(self.timings))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot the bootstrap.
+        
+        Returns:
+            Dict[str, Any]: Whether it is ready, and seconds from start until each finished step.
+        """
+        with self._lock:
+            return {"ready": self.ready.done(), "steps": dict(self.timings)}
\ No newline at end of file
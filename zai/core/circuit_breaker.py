@@ -0,0 +1,275 @@
+"""Circuit breaker for upstream providers."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker over a rolling error-rate window.
+    
+    While closed, outcomes are counted in time buckets covering
+    ``window_seconds``. Once at least ``min_requests`` calls were seen and
+    the error rate reaches ``failure_threshold`` the breaker opens and
+    rejects calls without touching the network. After ``open_seconds`` it
+    turns half-open and lets ``half_open_probes`` probe calls through:
+    if they all succeed it closes again, any failure re-opens it.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        min_requests: int = 4,
+        window_seconds: float = 60.0,
+        bucket_seconds: float = 5.0,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+        on_state_change: Optional[Callable[["CircuitBreaker", str, str], None]] = None
+    ):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            name (str): Name of the protected provider.
+            failure_threshold (float): Error rate (0-1) that opens the breaker.
+            min_requests (int): Calls needed in the window before it can open.
+            window_seconds (float): Length of the rolling window.
+            bucket_seconds (float): Granularity of the rolling window.
+            open_seconds (float): Time spent open before probing.
+            half_open_probes (int): Successful probes needed to close again.
+            on_state_change (Optional[Callable]): Called as (breaker, old_state, new_state).
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.on_state_change = on_state_change
+        
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._buckets = deque()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """
+        Get the current state, moving from open to half-open when due.
+        
+        Returns:
+            str: One of CLOSED, OPEN, HALF_OPEN.
+        """
+        with self._lock:
+            transition = self._maybe_half_open(time.monotonic())
+            state = self._state
+        self._notify(transition)
+        return state
+    
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may proceed.
+        
+        A True answer must be followed by record_success, record_failure
+        or cancel_probe, or a half-open breaker keeps the probe slot.
+        
+        Returns:
+            bool: False while open or while half-open probes are in flight.
+        """
+        with self._lock:
+            transition = self._maybe_half_open(time.monotonic())
+            
+            if self._state == self.CLOSED:
+                allowed = True
+            elif self._state == self.HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                allowed = True
+            else:
+                self._rejected += 1
+                allowed = False
+        
+        self._notify(transition)
+        return allowed
+    
+    def record_success(self):
+        """Record a successful call."""
+        self._record(True)
+    
+    def record_failure(self):
+        """Record a failed call."""
+        self._record(False)
+    
+    def cancel_probe(self):
+        """
+        Give back a half-open probe slot without recording an outcome.
+        
+        For calls let through by allow_request that ended without telling
+        whether the provider works, e.g. because the caller ran out of
+        time. Does nothing outside half-open.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+    
+    def retry_in(self) -> float:
+        """
+        Get the time left before an open breaker starts probing.
+        
+        Returns:
+            float: Seconds until half-open, 0 when not open.
+        """
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+    
+    def error_rate(self) -> float:
+        """
+        Get the error rate over the rolling window.
+        
+        Returns:
+            float: Failed calls divided by calls, 0 when idle.
+        """
+        with self._lock:
+            total, failures = self._window_counts(time.monotonic())
+        return failures / total if total else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot breaker state for reporting.
+        
+        Returns:
+            Dict[str, Any]: State, window counts and rejected calls.
+        """
+        state = self.state
+        with self._lock:
+            total, failures = self._window_counts(time.monotonic())
+            rejected = self._rejected
+        return {
+            "name": self.name,
+            "state": state,
+            "window_requests": total,
+            "window_failures": failures,
+            "error_rate": round(failures / total, 3) if total else 0.0,
+            "rejected": rejected,
+            "retry_in": round(self.retry_in(), 3)
+        }
+    
+    def _record(self, success: bool):
+        """
+        Apply a call outcome.
+        
+        Args:
+            success (bool): Whether the call succeeded.
+        """
+        now = time.monotonic()
+        transition = None
+        
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if not success:
+                    transition = self._set_state(self.OPEN, now)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_probes:
+                        transition = self._set_state(self.CLOSED, now)
+            elif self._state == self.CLOSED:
+                self._add_outcome(now, success)
+                total, failures = self._window_counts(now)
+                if total >= self.min_requests and failures / total >= self.failure_threshold:
+                    transition = self._set_state(self.OPEN, now)
+        
+        self._notify(transition)
+    
+    def _add_outcome(self, now: float, success: bool):
+        """
+        Count an outcome in the current window bucket.
+        
+        Args:
+            now (float): Monotonic timestamp.
+            success (bool): Whether the call succeeded.
+        """
+        bucket = int(now // self.bucket_seconds)
+        if not self._buckets or self._buckets[-1][0] != bucket:
+            self._buckets.append([bucket, 0, 0])
+        self._buckets[-1][1] += 1
+        if not success:
+            self._buckets[-1][2] += 1
+    
+    def _window_counts(self, now: float):
+        """
+        Drop expired buckets and total the rest.
+        
+        Args:
+            now (float): Monotonic timestamp.
+        
+        Returns:
+            tuple: (calls, failures) within the window.
+        """
+        oldest = int((now - self.window_seconds) // self.bucket_seconds)
+        while self._buckets and self._buckets[0][0] <= oldest:
+            self._buckets.popleft()
+        return (
+            sum(bucket[1] for bucket in self._buckets),
+            sum(bucket[2] for bucket in self._buckets)
+        )
+    
+    def _maybe_half_open(self, now: float) -> Optional[tuple]:
+        """
+        Move an open breaker to half-open once open_seconds elapsed.
+        
+        Args:
+            now (float): Monotonic timestamp.
+        
+        Returns:
+            Optional[tuple]: The transition, if one happened.
+        """
+        if self._state == self.OPEN and now - self._opened_at >= self.open_seconds:
+            return self._set_state(self.HALF_OPEN, now)
+        return None
+    
+    def _set_state(self, new_state: str, now: float) -> Optional[tuple]:
+        """
+        Change state and reset the bookkeeping of the new state.
+        
+        Args:
+            new_state (str): Target state.
+            now (float): Monotonic timestamp.
+        
+        Returns:
+            Optional[tuple]: (old_state, new_state) if the state changed.
+        """
+        old_state = self._state
+        if old_state == new_state:
+            return None
+        
+        self._state = new_state
+        if new_state == self.OPEN:
+            self._opened_at = now
+        elif new_state == self.HALF_OPEN:
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+        elif new_state == self.CLOSED:
+            self._buckets.clear()
+        return (old_state, new_state)
+    
+    def _notify(self, transition: Optional[tuple]):
+        """
+        Fire the state change callback outside the lock.
+        
+        Args:
+            transition (Optional[tuple]): (old_state, new_state) or None.
+        """
+        if transition and self.on_state_change:
+            self.on_state_change(self, *transition)
\ No newline at end of file
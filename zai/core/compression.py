@@ -0,0 +1,402 @@
+"""Incremental decompression and compression counters for streamed responses."""
+
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+def accept_encoding(enabled: bool = True) -> str:
+    """
+    Get the Accept-Encoding value for a streamed request.
+    
+    Args:
+        enabled (bool): Negotiate compression; "identity" when False.
+    
+    Returns:
+        str: Header value, listing br only when a brotli decoder is installed.
+    """
+    if not enabled:
+        return "identity"
+    if brotli is not None:
+        return "gzip, deflate, br"
+    return "gzip, deflate"
+
+
+class StreamDecompressor:
+    """Incremental decoder for one Content-Encoding.
+    
+    Each chunk is decoded as it arrives, so an event stream reaches the
+    SSE parser without the body being buffered. ``deflate`` accepts both
+    the zlib-wrapped and the raw form, and concatenated gzip members are
+    decoded in turn.
+    """
+    
+    def __init__(self, encoding: str):
+        """
+        Initialize decompressor.
+        
+        Args:
+            encoding (str): Content-Encoding value: gzip, deflate or br.
+        """
+        self.encoding = encoding
+        self._first_try = True
+        self._pending = b""
+        
+        if encoding in ("gzip", "x-gzip"):
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._obj = zlib.decompressobj()
+        elif encoding == "br":
+            if brotli is None:
+                raise ValueError("Content-Encoding 'br' requires the 'brotli' package: pip install brotli")
+            self._obj = brotli.Decompressor()
+        else:
+            raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+    
+    @staticmethod
+    def supports(encoding: str) -> bool:
+        """
+        Check whether an encoding can be decoded here.
+        
+        Args:
+            encoding (str): Content-Encoding value.
+        
+        Returns:
+            bool: True for gzip, deflate and (with brotli installed) br.
+        """
+        if encoding == "br":
+            return brotli is not None
+        return encoding in ("gzip", "x-gzip", "deflate")
+    
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decode one chunk.
+        
+        Args:
+            data (bytes): Compressed bytes.
+        
+        Returns:
+            bytes: Decompressed bytes available so far (may be empty).
+        """
+        if not data:
+            return b""
+        
+        if self.encoding == "br":
+            decode = getattr(self._obj, "process", None) or self._obj.decompress
+            return decode(data)
+        
+        if self.encoding == "deflate":
+            return self._inflate(data)
+        
+        output = self._obj.decompress(data)
+        while self._obj.eof and self._obj.unused_data:
+            data = self._obj.unused_data
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            output += self._obj.decompress(data)
+        return output
+    
+    def _inflate(self, data: bytes) -> bytes:
+        """
+        Decode a deflate chunk, switching to raw deflate if the zlib header is missing.
+        
+        Args:
+            data (bytes): Compressed bytes.
+        
+        Returns:
+            bytes: Decompressed bytes available so far.
+        """
+        if not self._first_try:
+            return self._obj.decompress(data)
+        
+        self._pending += data
+        try:
+            output = self._obj.decompress(data)
+        except zlib.error:
+            self._first_try = False
+            self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+            try:
+                return self._obj.decompress(self._pending)
+            finally:
+                self._pending = b""
+        
+        if output:
+            self._first_try = False
+            self._pending = b""
+        return output
+    
+    def flush(self) -> bytes:
+        """
+        Decode whatever the decoder still holds once the body ended.
+        
+        Returns:
+            bytes: Remaining decompressed bytes.
+        """
+        if self.encoding == "br":
+            return b""
+        return self._obj.flush()
+
+
+@dataclass
+class CompressionStats:
+    """Bytes-on-wire and decode-time counters for one upstream host."""
+    
+    host: str
+    streams: int = 0
+    compressed_streams: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    decode_time: float = 0.0
+    encodings: Dict[str, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    
+    def record_stream(self, encoding: Optional[str]):
+        """
+        Record a streamed response starting.
+        
+        Args:
+            encoding (Optional[str]): Content-Encoding being decoded, or None.
+        """
+        with self.lock:
+            self.streams += 1
+            if encoding:
+                self.compressed_streams += 1
+                self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+    
+    def record_chunk(self, wire: int, decoded: int, seconds: float = 0.0):
+        """
+        Record one chunk read off the wire.
+        
+        Args:
+            wire (int): Bytes received.
+            decoded (int): Bytes handed to the parser.
+            seconds (float): CPU seconds spent decompressing.
+        """
+        with self.lock:
+            self.wire_bytes += wire
+            self.decoded_bytes += decoded
+            self.decode_time += seconds
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot the counters.
+        
+        Returns:
+            Dict[str, Any]: Counter values.
+        """
+        with self.lock:
+            return {
+                "host": self.host,
+                "streams": self.streams,
+                "compressed_streams": self.compressed_streams,
+                "encodings": dict(self.encodings),
+                "wire_bytes": self.wire_bytes,
+                "decoded_bytes": self.decoded_bytes,
+                "bytes_saved": self.decoded_bytes - self.wire_bytes,
+                "ratio": round(self.decoded_bytes / self.wire_bytes, 3) if self.wire_bytes else 0.0,
+                "decode_time": round(self.decode_time, 6),
+                "decode_us_per_kib": round(
+                    self.decode_time * 1e6 / (self.decoded_bytes / 1024), 3
+                ) if self.decoded_bytes else 0.0
+            }
+
+
+class CompressionRegistry:
+    """Per-host compression counters."""
+    
+    def __init__(self):
+        """Initialize empty counters."""
+        self._hosts: Dict[str, CompressionStats] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> CompressionStats:
+        """
+        Get the counters for a URL's host, creating them on first use.
+        
+        Args:
+            url (str): Any URL on the upstream host.
+        
+        Returns:
+            CompressionStats: Host counters.
+        """
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            stats = self._hosts.get(key)
+            if stats is None:
+                stats = self._hosts[key] = CompressionStats(host=key)
+            return stats
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot the counters for every host.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Counters keyed by host.
+        """
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {key: stats.to_dict() for key, stats in hosts.items()}
+
+
+_stats = CompressionRegistry()
+
+
+def get_compression_stats() -> CompressionRegistry:
+    """
+    Get the process-wide compression counters.
+    
+    Returns:
+        CompressionRegistry: Shared counters.
+    """
+    return _stats
+
+
+def _content_encoding(headers) -> Optional[str]:
+    """
+    Get the single decodable Content-Encoding of a response.
+    
+    Args:
+        headers: Response headers.
+    
+    Returns:
+        Optional[str]: Encoding to decode here, or None to read the body as is.
+    """
+    encoding = (headers.get("content-encoding") or "").strip().lower()
+    if not encoding or encoding == "identity" or "," in encoding:
+        return None
+    if not StreamDecompressor.supports(encoding):
+        return None
+    return encoding
+
+
+@contextmanager
+def _translate_urllib3_errors():
+    """Map urllib3 read errors onto requests exceptions, as Response.iter_content does."""
+    from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
+    
+    try:
+        yield
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e)
+    except DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e)
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e)
+    except SSLError as e:
+        raise requests.exceptions.SSLError(e)
+
+
+def _iter_raw(response, chunk_size: int) -> Iterator[bytes]:
+    """
+    Iterate over the body exactly as received on the wire.
+    
+    Args:
+        response: Streaming requests.Response or HTTP2Response.
+        chunk_size (int): Size of the raw reads.
+    
+    Yields:
+        bytes: Raw (possibly compressed) body chunks.
+    """
+    if hasattr(response, "iter_raw"):
+        yield from response.iter_raw(chunk_size)
+        return
+    
+    with _translate_urllib3_errors():
+        yield from response.raw.stream(chunk_size, decode_content=False)
+    response._content_consumed = True
+
+
+def iter_body(response, chunk_size: int = 8192, stats: Optional[CompressionStats] = None) -> Iterator[bytes]:
+    """
+    Iterate over the decompressed body of a streaming response.
+    
+    Compressed bodies are read raw and decoded chunk by chunk, recording
+    wire bytes, decoded bytes and decode time; uncompressed bodies are
+    passed through and only counted.
+    
+    Args:
+        response: Streaming requests.Response or HTTP2Response.
+        chunk_size (int): Size of the raw reads.
+        stats (Optional[CompressionStats]): Counters to update (defaults to the response host's).
+    
+    Yields:
+        bytes: Decompressed body chunks.
+    """
+    if stats is None:
+        stats = get_compression_stats().get(response.url)
+    
+    encoding = _content_encoding(response.headers)
+    stats.record_stream(encoding)
+    
+    if encoding is None:
+        for chunk in response.iter_content(chunk_size):
+            stats.record_chunk(len(chunk), len(chunk))
+            yield chunk
+        return
+    
+    decompressor = StreamDecompressor(encoding)
+    for raw in _iter_raw(response, chunk_size):
+        start = time.perf_counter()
+        try:
+            chunk = decompressor.decompress(raw)
+        except zlib.error as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        stats.record_chunk(len(raw), len(chunk), time.perf_counter() - start)
+        if chunk:
+            yield chunk
+    
+    chunk = decompressor.flush()
+    if chunk:
+        stats.record_chunk(0, len(chunk))
+        yield chunk
+
+
+async def aiter_body(response, stats: Optional[CompressionStats] = None) -> AsyncIterator[bytes]:
+    """
+    Iterate over the decompressed body of a streaming httpx response.
+    
+    Args:
+        response (httpx.Response): Open streaming response.
+        stats (Optional[CompressionStats]): Counters to update (defaults to the response host's).
+    
+    Yields:
+        bytes: Decompressed body chunks.
+    """
+    if stats is None:
+        stats = get_compression_stats().get(str(response.url))
+    
+    encoding = _content_encoding(response.headers)
+    stats.record_stream(encoding)
+    
+    if encoding is None:
+        async for chunk in response.aiter_bytes():
+            stats.record_chunk(len(chunk), len(chunk))
+            yield chunk
+        return
+    
+    decompressor = StreamDecompressor(encoding)
+    async for raw in response.aiter_raw():
+        start = time.perf_counter()
+        chunk = decompressor.decompress(raw)
+        stats.record_chunk(len(raw), len(chunk), time.perf_counter() - start)
+        if chunk:
+            yield chunk
+    
+    chunk = decompressor.flush()
+    if chunk:
+        stats.record_chunk(0, len(chunk))
+        yield chunk
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""End-to-end deadlines for multi-request operations."""
+
+import socket
+import threading
+import time
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+import requests
+
+from .exceptions import DeadlineExceeded
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class Deadline:
+    """Time budget shared by every hop of one operation.
+    
+    Created once at the start of a call such as simple_chat and passed
+    down to each request: every hop gets at most the remaining budget as
+    its timeout, retries stop when the budget cannot cover the backoff,
+    and streams are cut as soon as it runs out.
+    """
+    
+    def __init__(self, timeout: float):
+        """
+        Initialize deadline.
+        
+        Args:
+            timeout (float): Seconds from now until the deadline.
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+    
+    @classmethod
+    def coerce(cls, value: Union["Deadline", float, None]) -> Optional["Deadline"]:
+        """
+        Turn a deadline argument into a Deadline.
+        
+        Args:
+            value (Union[Deadline, float, None]): Deadline, seconds from now, or None.
+        
+        Returns:
+            Optional[Deadline]: The deadline, or None when there is none.
+        """
+        if value is None or isinstance(value, Deadline):
+            return value
+        return cls(float(value))
+    
+    @classmethod
+    def from_header(cls, value: Optional[str]) -> Optional["Deadline"]:
+        """
+        Build a deadline from a timeout header such as X-Request-Timeout.
+        
+        Args:
+            value (Optional[str]): Header value in seconds.
+        
+        Returns:
+            Optional[Deadline]: The deadline, or None when the header is missing or not a positive number.
+        """
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            return None
+        if not 0 < seconds < float("inf"):
+            return None
+        return cls(seconds)
+    
+    def remaining(self) -> float:
+        """
+        Get the time left.
+        
+        Returns:
+            float: Seconds until the deadline, never negative.
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    @property
+    def expired(self) -> bool:
+        """
+        Check whether the deadline passed.
+        
+        Returns:
+            bool: True once no time is left.
+        """
+        return time.monotonic() >= self.expires_at
+    
+    def check(self, what: str = "request"):
+        """
+        Raise if the deadline passed.
+        
+        Args:
+            what (str): Operation named in the error.
+        """
+        if self.expired:
+            raise DeadlineExceeded(f"{what} exceeded its {self.timeout:g}s deadline")
+    
+    def cap(self, timeout: Timeout, what: str = "request") -> Timeout:
+        """
+        Limit a request timeout to the remaining budget.
+        
+        Args:
+            timeout (Timeout): Seconds, or (connect, read) tuple.
+            what (str): Operation named in the error when no time is left.
+        
+        Returns:
+            Timeout: Timeout of the same shape, no longer than the time left.
+        """
+        self.check(what)
+        remaining = self.remaining()
+        if isinstance(timeout, tuple):
+            return tuple(min(part, remaining) for part in timeout)
+        return min(timeout, remaining)
+    
+    def guard(self, chunks: Iterable[bytes], what: str = "stream", response: Optional[Any] = None) -> Iterator[bytes]:
+        """
+        Pass stream chunks through until the deadline passes.
+        
+        A read timeout caused by the capped timeout is reported as
+        DeadlineExceeded rather than as a connection error. With the
+        response the chunks are read from, a watchdog aborts it when the
+        deadline passes, so a stream that stalls ends then instead of when
+        its read timeout, capped when the request was sent, runs out.
+        
+        Args:
+            chunks (Iterable[bytes]): Body chunks.
+            what (str): Operation named in the error.
+            response (Optional[Any]): Streaming response to abort at the deadline.
+        
+        Yields:
+            bytes: Chunks received before the deadline.
+        """
+        aborted = threading.Event()
+        watchdog = None
+        if response is not None:
+            def abort():
+                aborted.set()
+                abort_response(response)
+            
+            watchdog = threading.Timer(self.remaining(), abort)
+            watchdog.daemon = True
+            watchdog.start()
+        
+        try:
+            for chunk in chunks:
+                self.check(what)
+                yield chunk
+        except Exception as e:
+            if aborted.is_set() or (isinstance(e, requests.exceptions.RequestException) and self.expired):
+                raise DeadlineExceeded(f"{what} exceeded its {self.timeout:g}s deadline") from e
+            raise
+        finally:
+            if watchdog:
+                watchdog.cancel()
+        
+        if aborted.is_set():
+            raise DeadlineExceeded(f"{what} exceeded its {self.timeout:g}s deadline")
+
+
+def abort_response(response: Any):
+    """
+    Abort a streaming response, possibly while another thread reads it.
+    
+    Closing a response does not wake a read blocked on its socket, so the
+    socket of an HTTP/1.1 response is shut down first. HTTP/2 responses
+    share their connection and are only closed.
+    
+    Args:
+        response (Any): requests.Response or HTTP2Response.
+    """
+    connection = getattr(getattr(response, "raw", None), "_connection", None)
+    sock = getattr(connection, "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    try:
+        response.close()
+    except Exception:
+        pass
\ No newline at end of file
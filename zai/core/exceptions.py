@@ -4,4 +4,10 @@
 class ZAIError(Exception):
     """Base exception for Z.AI API errors."""
     
+    pass
+
+
+class DeadlineExceeded(ZAIError):
+    """Raised when an operation runs past its deadline."""
+    
     pass
\ No newline at end of file
@@ -0,0 +1,327 @@
+"""Hedged requests for upstream calls with a slow tail."""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from .retry import RetryBudget
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgePolicy:
+    """When to send a duplicate of a request that is slow to answer.
+    
+    The hedge fires once the first attempt has waited longer than the
+    ``percentile`` of recently observed time-to-first-byte, clamped to
+    ``min_delay``..``max_delay``. Until ``min_samples`` latencies were seen,
+    ``max_delay`` is used. ``max_ratio`` caps hedges to that fraction of
+    request volume.
+    """
+    
+    percentile: float = 0.95
+    min_delay: float = 0.05
+    max_delay: float = 5.0
+    min_samples: int = 20
+    window: int = 200
+    max_ratio: float = 0.1
+    max_workers: int = 64
+    
+    @classmethod
+    def from_env(cls) -> "HedgePolicy":
+        """
+        Build the default hedge policy from UPSTREAM_HEDGE_* variables.
+        
+        Returns:
+            HedgePolicy: Hedge policy.
+        """
+        return cls(
+            percentile=float(os.environ.get("UPSTREAM_HEDGE_PERCENTILE", cls.percentile)),
+            min_delay=float(os.environ.get("UPSTREAM_HEDGE_MIN_DELAY", cls.min_delay)),
+            max_delay=float(os.environ.get("UPSTREAM_HEDGE_MAX_DELAY", cls.max_delay)),
+            max_ratio=float(os.environ.get("UPSTREAM_HEDGE_MAX_RATIO", cls.max_ratio))
+        )
+
+
+class LatencyTracker:
+    """Rolling window of time-to-first-byte samples."""
+    
+    def __init__(self, window: int = 200):
+        """
+        Initialize tracker.
+        
+        Args:
+            window (int): Number of recent samples kept.
+        """
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float):
+        """
+        Add one latency sample.
+        
+        Args:
+            seconds (float): Time until the response headers arrived.
+        """
+        with self._lock:
+            self._samples.append(seconds)
+    
+    def __len__(self) -> int:
+        return len(self._samples)
+    
+    def percentile(self, fraction: float) -> Optional[float]:
+        """
+        Get a percentile of the recorded samples.
+        
+        Args:
+            fraction (float): Percentile as a fraction, e.g. 0.95.
+        
+        Returns:
+            Optional[float]: Latency in seconds, or None without samples.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(fraction * len(samples)))
+        return samples[index]
+
+
+@dataclass
+class HedgeCounters:
+    """Hedging counters for one upstream call path."""
+    
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    primary_wins: int = 0
+    budget_denied: int = 0
+    losers_closed: int = 0
+    failures: int = 0
+
+
+class HedgeStats:
+    """Per-call-path hedging counters."""
+    
+    def __init__(self):
+        """Initialize empty counters."""
+        self._paths: Dict[str, HedgeCounters] = {}
+        self._delays: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, name: str, event: str):
+        """
+        Increment a counter for a call path.
+        
+        Args:
+            name (str): Call path, e.g. "longcat".
+            event (str): One of the HedgeCounters fields.
+        """
+        with self._lock:
+            counters = self._paths.get(name)
+            if counters is None:
+                counters = self._paths[name] = HedgeCounters()
+            setattr(counters, event, getattr(counters, event) + 1)
+    
+    def record_delay(self, name: str, delay: float):
+        """
+        Remember the hedge delay last used for a call path.
+        
+        Args:
+            name (str): Call path.
+            delay (float): Seconds waited before hedging.
+        """
+        with self._lock:
+            self._delays[name] = delay
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot the counters.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Counters, hedge rate and hedge win rate keyed by call path.
+        """
+        with self._lock:
+            result = {}
+            for name, counters in self._paths.items():
+                stats = dict(counters.__dict__)
+                stats["hedge_rate"] = round(counters.hedged / counters.requests, 4) if counters.requests else 0.0
+                stats["win_rate"] = round(counters.hedge_wins / counters.hedged, 4) if counters.hedged else 0.0
+                stats["delay"] = round(self._delays.get(name, 0.0), 6)
+                result[name] = stats
+            return result
+
+
+_stats = HedgeStats()
+
+
+def get_hedge_stats() -> HedgeStats:
+    """
+    Get the process-wide hedging counters.
+    
+    Returns:
+        HedgeStats: Shared counters.
+    """
+    return _stats
+
+
+def _close_response(response: Any):
+    """Close a response that lost the race, releasing its connection."""
+    close = getattr(response, "close", None)
+    if close:
+        close()
+
+
+class Hedger:
+    """Sends a duplicate request when the first one is slow and keeps the faster.
+    
+    Both attempts run on a worker pool while the caller waits. The first
+    attempt to succeed wins; the other is cancelled if it has not started,
+    or closed as soon as it returns so its connection is not left
+    half-read. A failure only ends the call once every attempt failed.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        policy: Optional[HedgePolicy] = None,
+        budget: Optional[RetryBudget] = None
+    ):
+        """
+        Initialize hedger.
+        
+        Args:
+            name (str): Call path name for the counters.
+            policy (Optional[HedgePolicy]): Hedge policy (defaults to UPSTREAM_HEDGE_* settings).
+            budget (Optional[RetryBudget]): Token bucket bounding extra load (defaults to policy.max_ratio).
+        """
+        self.name = name
+        self.policy = policy or HedgePolicy.from_env()
+        self.budget = budget or RetryBudget(ratio=self.policy.max_ratio, min_per_second=0.0, capacity=5.0)
+        self.latency = LatencyTracker(self.policy.window)
+        self.stats = get_hedge_stats()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.policy.max_workers,
+            thread_name_prefix=f"hedge-{name}"
+        )
+    
+    def get_delay(self) -> float:
+        """
+        Get how long the first attempt may take before a hedge is sent.
+        
+        Returns:
+            float: Seconds.
+        """
+        policy = self.policy
+        delay = self.latency.percentile(policy.percentile)
+        if delay is None or len(self.latency) < policy.min_samples:
+            return policy.max_delay
+        return min(policy.max_delay, max(policy.min_delay, delay))
+    
+    def call(self, send: Callable[[], T], close: Callable[[T], None] = _close_response) -> T:
+        """
+        Run a request, hedging it if it is slow to answer.
+        
+        Args:
+            send (Callable[[], T]): Sends the request and returns once the response headers arrived.
+            close (Callable[[T], None]): Releases a losing response.
+        
+        Returns:
+            T: The response of the attempt that succeeded first.
+        """
+        self.stats.record(self.name, "requests")
+        self.budget.record_request()
+        delay = self.get_delay()
+        self.stats.record_delay(self.name, delay)
+        
+        primary = self._executor.submit(self._timed, send)
+        try:
+            result = primary.result(timeout=delay)
+            self.stats.record(self.name, "primary_wins")
+            return result
+        except FutureTimeout:
+            pass
+        except Exception:
+            self.stats.record(self.name, "failures")
+            raise
+        
+        if not self.budget.try_acquire():
+            self.stats.record(self.name, "budget_denied")
+            return self._settle([primary], primary, close)
+        
+        self.stats.record(self.name, "hedged")
+        hedge = self._executor.submit(self._timed, send)
+        return self._settle([primary, hedge], primary, close)
+    
+    def _settle(self, attempts: list, primary: Future, close: Callable[[Any], None]) -> Any:
+        """
+        Wait for the first successful attempt and dispose of the rest.
+        
+        Args:
+            attempts (list): Futures of the running attempts.
+            primary (Future): The first attempt.
+            close (Callable[[Any], None]): Releases a losing response.
+        
+        Returns:
+            Any: Result of the winning attempt.
+        """
+        pending = set(attempts)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    if error is None or future is primary:
+                        error = future.exception()
+                    continue
+                
+                self.stats.record(self.name, "primary_wins" if future is primary else "hedge_wins")
+                for loser in pending:
+                    if not loser.cancel():
+                        loser.add_done_callback(lambda f: self._close_loser(f, close))
+                for loser in done:
+                    if loser is not future and loser.exception() is None:
+                        self._close_loser(loser, close)
+                return future.result()
+        
+        self.stats.record(self.name, "failures")
+        raise error
+    
+    def _close_loser(self, future: Future, close: Callable[[Any], None]):
+        """
+        Close the response of an attempt that lost the race.
+        
+        Args:
+            future (Future): Finished losing attempt.
+            close (Callable[[Any], None]): Releases a losing response.
+        """
+        if future.cancelled() or future.exception() is not None:
+            return
+        close(future.result())
+        self.stats.record(self.name, "losers_closed")
+    
+    def _timed(self, send: Callable[[], T]) -> T:
+        """
+        Run one attempt and record its time to first byte.
+        
+        Args:
+            send (Callable[[], T]): Sends the request.
+        
+        Returns:
+            T: Attempt result.
+        """
+        start = time.perf_counter()
+        result = send()
+        self.latency.record(time.perf_counter() - start)
+        return result
+    
+    def close(self):
+        """Stop the worker pool once running attempts finish."""
+        self._executor.shutdown(wait=False)
\ No newline at end of file
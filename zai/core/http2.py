@@ -0,0 +1,302 @@
+"""HTTP/2 transport for Z.AI API requests."""
+
+import ssl
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, Dict, Iterator, Optional, Union
+
+import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .exceptions import ZAIError
+
+
+class HTTP2Response:
+    """requests.Response look-alike over an httpx response.
+    
+    Exposes the subset of the requests API used by the SDK so callers
+    do not care which transport produced the response.
+    """
+    
+    def __init__(self, response: "httpx.Response", url: str, elapsed: float, on_close=None):
+        """
+        Initialize response wrapper.
+        
+        Args:
+            response (httpx.Response): Response returned by the transport.
+            url (str): Request URL.
+            elapsed (float): Seconds until the response headers arrived.
+            on_close (Optional[Callable]): Called once when the response is closed.
+        """
+        self._response = response
+        self.url = url
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.reason = response.reason_phrase
+        self.elapsed = timedelta(seconds=elapsed)
+        self.cookies = response.cookies.jar
+        self.http_version = response.http_version
+        self._on_close = on_close
+        self._closed = False
+    
+    @property
+    def content(self) -> bytes:
+        """
+        Read the whole body.
+        
+        Returns:
+            bytes: Decoded response body.
+        """
+        return self._response.read()
+    
+    @property
+    def text(self) -> str:
+        """
+        Read the whole body as text.
+        
+        Returns:
+            str: Response text.
+        """
+        self._response.read()
+        return self._response.text
+    
+    def json(self) -> Any:
+        """
+        Decode the body as JSON.
+        
+        Returns:
+            Any: Decoded JSON value.
+        """
+        self._response.read()
+        return self._response.json()
+    
+    def raise_for_status(self):
+        """Raise requests.HTTPError for 4xx and 5xx responses."""
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+                response=self
+            )
+    
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Iterate over the decoded body as it arrives.
+        
+        httpx would hold data back until chunk_size bytes accumulate,
+        which stalls event streams, so chunks are yielded as received.
+        
+        Args:
+            chunk_size (Optional[int]): Ignored, kept for requests compatibility.
+        
+        Yields:
+            bytes: Body chunks.
+        """
+        try:
+            with _translate_errors():
+                yield from self._response.iter_bytes()
+        finally:
+            self.close()
+    
+    def iter_raw(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Iterate over the body exactly as received on the wire.
+        
+        Args:
+            chunk_size (Optional[int]): Ignored, kept for requests compatibility.
+        
+        Yields:
+            bytes: Raw (possibly compressed) body chunks.
+        """
+        try:
+            with _translate_errors():
+                yield from self._response.iter_raw()
+        finally:
+            self.close()
+    
+    def iter_lines(self, chunk_size: Optional[int] = None, decode_unicode: bool = False) -> Iterator[Union[str, bytes]]:
+        """
+        Iterate over the body line by line.
+        
+        Args:
+            chunk_size (Optional[int]): Ignored, kept for requests compatibility.
+            decode_unicode (bool): Yield str instead of bytes.
+        
+        Yields:
+            Union[str, bytes]: Body lines without line terminators.
+        """
+        try:
+            with _translate_errors():
+                for line in self._response.iter_lines():
+                    yield line if decode_unicode else line.encode("utf-8")
+        finally:
+            self.close()
+    
+    def close(self):
+        """Release the stream back to the connection (also done once the body is consumed)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._response.close()
+        if self._on_close:
+            self._on_close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+
+
+@contextmanager
+def _translate_errors():
+    """Map httpx errors onto the requests exceptions the SDK handles."""
+    try:
+        yield
+    except httpx.ConnectTimeout as e:
+        raise requests.exceptions.ConnectTimeout(str(e)) from e
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.ReadTimeout(str(e)) from e
+    except httpx.TransportError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+    except httpx.HTTPError as e:
+        raise requests.exceptions.RequestException(str(e)) from e
+
+
+class HTTP2Transport:
+    """Multiplexed HTTP/2 connection pool for one upstream host.
+    
+    Works below httpx.Client so that cookies and default headers stay
+    with each HTTPClient while the connections themselves are shared:
+    many concurrent streams ride on one TLS connection.
+    """
+    
+    def __init__(
+        self,
+        max_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        verify: Union[bool, str, ssl.SSLContext] = True
+    ):
+        """
+        Initialize HTTP/2 transport.
+        
+        Servers that do not negotiate h2 over ALPN are spoken to over
+        HTTP/1.1 on the same pool.
+        
+        Args:
+            max_connections (int): Maximum TCP connections to the host.
+            keepalive_expiry (float): Seconds an idle connection is kept.
+            verify (Union[bool, str, ssl.SSLContext]): TLS verification, CA bundle path or SSL context.
+        """
+        if httpx is None:
+            raise ZAIError("HTTP/2 transport requires the 'httpx[http2]' package: pip install 'httpx[http2]'")
+        
+        self._transport = httpx.HTTPTransport(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+        self.max_connections = max_connections
+        self._requests = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes] = None,
+        timeout: Union[float, tuple] = 180,
+        stream: bool = False
+    ) -> HTTP2Response:
+        """
+        Send one request over the shared connection pool.
+        
+        Args:
+            method (str): HTTP method.
+            url (str): Absolute request URL.
+            headers (Dict[str, str]): Request headers.
+            body (Optional[bytes]): Encoded request body.
+            timeout (Union[float, tuple]): Seconds, or (connect, read) like requests.
+            stream (bool): Leave the body unread for streaming.
+        
+        Returns:
+            HTTP2Response: Response wrapper.
+        """
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout_config = httpx.Timeout(read, connect=connect)
+        else:
+            timeout_config = httpx.Timeout(timeout)
+        
+        request = httpx.Request(
+            method,
+            url,
+            headers=headers,
+            content=body,
+            extensions={"timeout": timeout_config.as_dict()}
+        )
+        
+        start = time.perf_counter()
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+        
+        try:
+            with _translate_errors():
+                response = self._transport.handle_request(request)
+        except Exception:
+            self._release()
+            raise
+        
+        response.request = request
+        wrapped = HTTP2Response(response, url, time.perf_counter() - start, on_close=self._release)
+        
+        if not stream:
+            try:
+                with _translate_errors():
+                    response.read()
+            finally:
+                wrapped.close()
+        
+        return wrapped
+    
+    def _release(self):
+        """Count a finished request."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot transport counters.
+        
+        Returns:
+            Dict[str, Any]: Connection and stream counters.
+        """
+        connections = self._transport._pool.connections
+        with self._lock:
+            return {
+                "protocol": "h2",
+                "max_connections": self.max_connections,
+                "connections": len(connections),
+                "http2_connections": sum(
+                    1 for conn in connections if "HTTP/2" in getattr(conn, "info", lambda: "")()
+                ),
+                "requests": self._requests,
+                "in_flight": self._in_flight
+            }
+    
+    def close(self):
+        """Close every connection."""
+        self._transport.close()
\ No newline at end of file
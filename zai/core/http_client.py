@@ -1,11 +1,62 @@
 """HTTP Client for Z.AI API."""
 
-from typing import Dict, Optional
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Callable, Dict, Optional, Union
 from urllib.parse import urljoin
 
 import requests
+from requests.cookies import RequestsCookieJar
 
-from .exceptions import ZAIError
+from .compression import accept_encoding, get_compression_stats, iter_body
+from .deadline import Deadline
+from .exceptions import DeadlineExceeded, ZAIError
+from .hedging import Hedger
+from .http2 import HTTP2Transport
+from .retry import RetryBudget, RetryPolicy, get_retry_budget, get_retry_stats
+from .token_pool import TokenPool
+from .transport import create_session, get_registry
+from ..utils.json_template import encode
+
+
+DEFAULT_HEADERS = {
+    "accept": "*/*",
+    "accept-encoding": "gzip, deflate",
+    "accept-language": "en-US,en;q=0.9",
+    "cache-control": "no-cache",
+    "content-type": "application/json",
+    "pragma": "no-cache",
+    "referer": "https://chat.z.ai/",
+    "sec-ch-ua": '"Not;A=Brand";v="99", "Google Chrome";v="139", "Chromium";v="139"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
+}
+
+# Statuses meaning the bearer token was rejected
+AUTH_FAILURE_STATUSES = frozenset({401, 403})
+
+# Replays of a request whose token was rejected; the second covers a token
+# another thread refreshed to that was revoked again before the replay
+MAX_AUTH_REPLAYS = 2
+
+
+class SharedCookieJar(RequestsCookieJar):
+    """Cookie jar that threads can read while others store cookies.
+    
+    cookielib locks its writes but not iteration, which requests uses to
+    merge the session cookies into every request. Iterating a snapshot
+    taken under the jar's lock keeps a concurrent Set-Cookie from
+    breaking another thread's request.
+    """
+    
+    def __iter__(self):
+        with self._cookies_lock:
+            return iter(list(super().__iter__()))
 
 
 class HTTPClient:
@@ -16,7 +67,13 @@ class HTTPClient:
         base_url: str,
         timeout: int,
         session: Optional[requests.Session] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        http2: bool = False,
+        transport: Optional[HTTP2Transport] = None,
+        stream_compression: bool = True,
+        hedger: Optional[Hedger] = None
     ):
         """
         Initialize HTTP client.
@@ -26,51 +83,70 @@ class HTTPClient:
             timeout (int): Request timeout in seconds.
             session (Optional[requests.Session]): Optional session to use.
             verbose (bool): Enable verbose output.
+            retry_policy (Optional[RetryPolicy]): Backoff policy for idempotent requests.
+            retry_budget (Optional[RetryBudget]): Retry budget (defaults to the per-host shared one).
+            http2 (bool): Send requests over the shared HTTP/2 transport for base_url.
+            transport (Optional[HTTP2Transport]): Explicit HTTP/2 transport to use.
+            stream_compression (bool): Negotiate gzip/deflate/br for streamed responses.
+            hedger (Optional[Hedger]): Hedger for requests made with hedge=True.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.verbose = verbose
         self.session = session or self._create_session()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or get_retry_budget(self.base_url)
+        self.retry_stats = get_retry_stats()
+        self.stream_compression = stream_compression
+        self.compression_stats = get_compression_stats().get(self.base_url)
+        self.hedger = hedger
+        self.on_auth_failure: Optional[Callable[[str], bool]] = None
+        self.auth_token: Optional[str] = None
+        self.token_pool: Optional[TokenPool] = None
+        self.auth_ready: Optional[Future] = None
+        self.reauthenticate: Optional[Callable[[], None]] = None
+        self._auth_ready_lock = threading.Lock()
+        
+        if transport is None and http2:
+            transport = get_registry().http2_transport(self.base_url)
+        self.transport = transport
     
     def _create_session(self) -> requests.Session:
         """
         Create a new session with default headers.
         
+        The session uses the process-wide connection pool for base_url,
+        so every client talking to the same host shares warm connections.
+        Its cookie jar is safe to share between threads.
+        
         Returns:
             requests.Session: Configured session object.
         """
-        session = requests.Session()
-        session.headers.update({
-            "accept": "*/*",
-            "accept-encoding": "gzip, deflate",
-            "accept-language": "en-US,en;q=0.9",
-            "cache-control": "no-cache",
-            "content-type": "application/json",
-            "pragma": "no-cache",
-            "referer": "https://chat.z.ai/",
-            "sec-ch-ua": '"Not;A=Brand";v="99", "Google Chrome";v="139", "Chromium";v="139"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"',
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
-        })
+        session = create_session(self.base_url)
+        session.headers.update(DEFAULT_HEADERS)
+        session.cookies = SharedCookieJar()
         return session
     
     def set_auth_header(self, token: str):
         """
-        Set authorization header.
+        Set the bearer token.
+        
+        The token is added to each request's own headers rather than to
+        the session, so a token refresh never races a request being built.
         
         Args:
             token (str): Bearer token for authentication.
         """
-        self.session.headers["authorization"] = f"Bearer {token}"
+        self.auth_token = token
     
     def update_headers(self, headers: Dict[str, str]):
         """
         Update session headers.
         
+        Session headers are shared by every thread using the client; set
+        them up before sharing it, and pass per-request values to
+        make_request instead.
+        
         Args:
             headers (Dict[str, str]): Headers to update.
         """
@@ -80,68 +156,370 @@ class HTTPClient:
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict] = None,
-        stream: bool = False
+        data: Optional[Union[Dict, bytes]] = None,
+        stream: bool = False,
+        retry: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[Deadline] = None,
+        hedge: bool = False,
+        auth: bool = True
     ) -> requests.Response:
         """
         Make HTTP request to API.
         
+        Idempotent requests are retried on connection errors and retryable
+        statuses according to retry_policy, within the host's retry budget.
+        For streamed requests only the phase before the response headers
+        arrive is retried; the body is never replayed. Streamed requests
+        negotiate compression unless stream_compression is off; read them
+        with iter_stream to decompress incrementally.
+        
+        With a deadline, each attempt's timeout is capped to the time left
+        and no retry is made whose backoff would outlast it.
+        
+        With hedge=True and a hedger configured, an attempt whose response
+        headers are slow to arrive is duplicated and the faster copy kept.
+        The slower copy cannot be cancelled once sent; it is only closed
+        when its headers arrive, so the upstream serves both. Hedge only
+        requests that are safe to send twice.
+        
+        With a token_pool set, every attempt is authorized with a token
+        taken from the pool instead of the session's bearer token, and
+        the pool is told about 401, 403 and 429 responses.
+        
+        A request rejected with 401 or 403 is replayed with another pooled
+        token, or after on_auth_failure refreshed the rejected session
+        token, up to MAX_AUTH_REPLAYS times. Streamed requests are only
+        replayed before any of the body was read.
+        
+        While auth_ready is pending, authenticated requests wait for it,
+        so requests made during a client bootstrap go out with its token.
+        If it failed, the next request gets the token inline with
+        reauthenticate, and concurrent requests wait for that.
+        
         Args:
             method (str): HTTP method.
             endpoint (str): API endpoint.
-            data (Optional[Dict]): Request payload.
+            data (Optional[Union[Dict, bytes]]): Request payload, or a body encoded in advance.
             stream (bool): Whether to stream response.
+            retry (Optional[bool]): Retry transient failures (defaults to True for GET).
+            headers (Optional[Dict[str, str]]): Extra headers for this request only.
+            deadline (Optional[Deadline]): Deadline of the operation this request belongs to.
+            hedge (bool): Hedge slow attempts with the client's hedger.
+            auth (bool): Use the token pool and refresh rejected tokens (off for the auth endpoint itself).
         
         Returns:
             requests.Response: Response object.
+        
+        Raises:
+            DeadlineExceeded: If the deadline passes before a response arrives.
         """
         url = urljoin(self.base_url, endpoint)
         
+        if auth and self.auth_ready is not None:
+            self._wait_for_auth(deadline)
+        
+        if retry is None:
+            retry = method.upper() == "GET"
+        
+        token_pool = self.token_pool if auth else None
+        auth_replays = 0 if auth else MAX_AUTH_REPLAYS
+        
+        stats_key = f"{method.upper()} {endpoint}"
+        self.retry_stats.record(stats_key, "requests")
+        self.retry_budget.record_request()
+        
+        attempt = 0
+        while True:
+            attempt += 1
+            rejected_token = None if token_pool else self._bearer_token()
+            try:
+                if hedge and self.hedger:
+                    response = self.hedger.call(
+                        lambda: self._send(method, url, data, stream, headers, deadline, token_pool, rejected_token)
+                    )
+                else:
+                    response = self._send(method, url, data, stream, headers, deadline, token_pool, rejected_token)
+                if attempt > 1:
+                    self.retry_stats.record(stats_key, "recovered")
+                return response
+                
+            except requests.exceptions.RequestException as e:
+                if deadline and deadline.expired:
+                    raise DeadlineExceeded(f"{stats_key} exceeded its {deadline.timeout:g}s deadline: {e}")
+                
+                if auth_replays < MAX_AUTH_REPLAYS and self._refresh_auth(e, token_pool, rejected_token):
+                    auth_replays += 1
+                    self.retry_stats.record(stats_key, "auth_replays", e)
+                    continue
+                
+                delay = self._get_retry_delay(stats_key, attempt, e) if retry else None
+                if delay is not None and deadline and delay >= deadline.remaining():
+                    delay = None
+                if delay is None:
+                    raise self._to_zai_error(e)
+                
+                if self.verbose:
+                    print(f"[DEBUG] Retrying {stats_key} in {delay:.2f}s after: {e}")
+                time.sleep(delay)
+    
+    def _wait_for_auth(self, deadline: Optional[Deadline] = None):
+        """
+        Wait until auth_ready resolves, authenticating inline if it failed.
+        
+        A failed auth_ready is not final: it is retried with reauthenticate
+        by one request at a time until a token is set, so one failed
+        startup attempt does not fail every later request.
+        
+        Args:
+            deadline (Optional[Deadline]): Deadline of the calling operation.
+        
+        Raises:
+            DeadlineExceeded: If the deadline passes first.
+            ZAIError: If getting the token failed.
+        """
+        ready = self.auth_ready
         try:
+            ready.result(deadline.remaining() if deadline else None)
+            return
+        except FutureTimeout:
+            raise DeadlineExceeded(f"Authentication exceeded the {deadline.timeout:g}s deadline")
+        except Exception:
+            if self.reauthenticate is None:
+                raise
+        
+        with self._auth_ready_lock:
+            if self.auth_ready is ready:
+                self.reauthenticate()
+                self.auth_ready = None
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Union[Dict, bytes]],
+        stream: bool,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[Deadline] = None,
+        token_pool: Optional[TokenPool] = None,
+        bearer: Optional[str] = None
+    ) -> requests.Response:
+        """
+        Send a single request attempt.
+        
+        Args:
+            method (str): HTTP method.
+            url (str): Absolute request URL.
+            data (Optional[Union[Dict, bytes]]): Request payload, or a body encoded in advance.
+            stream (bool): Whether to stream response.
+            headers (Optional[Dict[str, str]]): Extra headers for this request only.
+            deadline (Optional[Deadline]): Deadline capping the timeout.
+            token_pool (Optional[TokenPool]): Pool to take this attempt's bearer token from.
+            bearer (Optional[str]): Bearer token for this attempt when there is no token pool.
+        
+        Returns:
+            requests.Response: Response object.
+        """
+        pooled = None
+        if token_pool:
+            pooled = token_pool.acquire()
+            headers = {**(headers or {}), "authorization": f"Bearer {pooled.token}"}
+        elif bearer:
+            headers = {"authorization": f"Bearer {bearer}", **(headers or {})}
+        
+        if stream:
+            timeout = (30, 60)
+        else:
+            timeout = self.timeout
+        
+        if deadline:
+            timeout = deadline.cap(timeout, f"{method.upper()} {url}")
+        
+        if self.transport:
+            response = self._send_http2(method, url, data, stream, timeout, headers)
+        else:
+            request_headers = None
             if stream:
-                timeout = (30, 60)
-            else:
-                timeout = self.timeout
-            
-            if stream:
-                headers = dict(self.session.headers)
-                headers.pop('accept-encoding', None)
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    json=data if data else None,
-                    timeout=timeout,
-                    stream=stream,
-                    headers=headers
-                )
-            else:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    json=data if data else None,
-                    timeout=timeout,
-                    stream=stream
-                )
-            
-            if self.verbose:
-                print(f"[DEBUG] Request to {url}")
-                print(f"[DEBUG] Status: {response.status_code}")
-                if not stream:
-                    print(f"[DEBUG] Response text: {response.text[:500]}")
-            
-            response.raise_for_status()
+                request_headers = {'accept-encoding': accept_encoding(self.stream_compression)}
+            if headers:
+                request_headers = {**(request_headers or {}), **headers}
             
-            if response.cookies:
-                self.session.cookies.update(response.cookies)
-            
-            return response
-            
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {e}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_detail = e.response.text
-                    error_msg += f" - Response: {error_detail}"
-                except:
-                    pass
-            raise ZAIError(error_msg)
\ No newline at end of file
+            response = self.session.request(
+                method=method,
+                url=url,
+                data=encode(data) if data else None,
+                timeout=timeout,
+                stream=stream,
+                headers=request_headers
+            )
+        
+        if self.verbose:
+            print(f"[DEBUG] Request to {url}")
+            print(f"[DEBUG] Status: {response.status_code}")
+            if not stream:
+                print(f"[DEBUG] Response text: {response.text[:500]}")
+        
+        if pooled:
+            token_pool.report(pooled, response.status_code)
+        
+        response.raise_for_status()
+        
+        if response.cookies:
+            self.session.cookies.update(response.cookies)
+        
+        return response
+    
+    def _send_http2(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Union[Dict, bytes]],
+        stream: bool,
+        timeout,
+        extra_headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Send a request over the HTTP/2 transport.
+        
+        Session headers and cookies are sent per request so the
+        multiplexed connection can be shared by many clients.
+        
+        Args:
+            method (str): HTTP method.
+            url (str): Absolute request URL.
+            data (Optional[Union[Dict, bytes]]): Request payload, or a body encoded in advance.
+            stream (bool): Whether to stream response.
+            timeout: Seconds, or (connect, read) tuple.
+            extra_headers (Optional[Dict[str, str]]): Extra headers for this request only.
+        
+        Returns:
+            HTTP2Response: Response object.
+        """
+        headers = dict(self.session.headers)
+        if stream:
+            headers['accept-encoding'] = accept_encoding(self.stream_compression)
+        if extra_headers:
+            headers.update(extra_headers)
+        
+        cookie_header = "; ".join(f"{cookie.name}={cookie.value}" for cookie in self.session.cookies)
+        if cookie_header:
+            headers["cookie"] = cookie_header
+        
+        return self.transport.request(
+            method,
+            url,
+            headers=headers,
+            body=encode(data) if data else None,
+            timeout=timeout,
+            stream=stream
+        )
+    
+    def iter_stream(self, response, chunk_size: int = 8192, deadline: Optional[Deadline] = None):
+        """
+        Iterate over the decompressed body of a streamed response.
+        
+        Args:
+            response: Response returned by make_request(stream=True).
+            chunk_size (int): Size of the raw reads.
+            deadline (Optional[Deadline]): Stop with DeadlineExceeded once it passes.
+        
+        Returns:
+            Iterator[bytes]: Decompressed body chunks.
+        """
+        chunks = iter_body(response, chunk_size, self.compression_stats)
+        if deadline:
+            return deadline.guard(chunks, f"stream from {response.url}", response)
+        return chunks
+    
+    def _bearer_token(self) -> Optional[str]:
+        """
+        Get the bearer token requests are currently sent with.
+        
+        Returns:
+            Optional[str]: Token, or None if none was set.
+        """
+        return self.auth_token
+    
+    def _refresh_auth(
+        self,
+        error: requests.exceptions.RequestException,
+        token_pool: Optional[TokenPool],
+        rejected_token: Optional[str]
+    ) -> bool:
+        """
+        Decide whether a request rejected for its token is replayed.
+        
+        Args:
+            error (requests.exceptions.RequestException): Error raised by the attempt.
+            token_pool (Optional[TokenPool]): Pool the attempt took its token from.
+            rejected_token (Optional[str]): Bearer token the attempt was sent with.
+        
+        Returns:
+            bool: True if a replay would be sent with a different token.
+        """
+        if getattr(error.response, "status_code", None) not in AUTH_FAILURE_STATUSES:
+            return False
+        
+        if not token_pool:
+            if not (self.on_auth_failure and rejected_token and self.on_auth_failure(rejected_token)):
+                return False
+        
+        error.response.close()
+        return True
+    
+    def _get_retry_delay(
+        self,
+        stats_key: str,
+        attempt: int,
+        error: requests.exceptions.RequestException
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+        
+        Args:
+            stats_key (str): Endpoint key for retry counters.
+            attempt (int): Number of the attempt that failed (1-based).
+            error (requests.exceptions.RequestException): Error raised by the attempt.
+        
+        Returns:
+            Optional[float]: Seconds to wait before retrying, or None to give up.
+        """
+        if not self.retry_policy.is_retryable(error):
+            return None
+        
+        delay = None
+        if attempt < self.retry_policy.max_attempts:
+            delay = self.retry_policy.get_delay(attempt, error)
+        
+        if delay is None:
+            self.retry_stats.record(stats_key, "exhausted", error)
+            return None
+        
+        if not self.retry_budget.try_acquire():
+            self.retry_stats.record(stats_key, "budget_denied", error)
+            return None
+        
+        if error.response is not None:
+            error.response.close()
+        
+        self.retry_stats.record(stats_key, "retries", error)
+        return delay
+    
+    def _to_zai_error(self, e: requests.exceptions.RequestException) -> ZAIError:
+        """
+        Convert a transport error into ZAIError.
+        
+        Args:
+            e (requests.exceptions.RequestException): Transport error.
+        
+        Returns:
+            ZAIError: Error including the response body when available.
+        """
+        error_msg = f"API request failed: {e}"
+        if hasattr(e, 'response') and e.response is not None:
+            try:
+                error_detail = e.response.text
+                error_msg += f" - Response: {error_detail}"
+            except:
+                pass
+        return ZAIError(error_msg)
\ No newline at end of file
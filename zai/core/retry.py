@@ -0,0 +1,238 @@
+"""Retry policy, retry budget and retry counters for Z.AI API requests."""
+
+import email.utils
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter for idempotent requests."""
+    
+    max_attempts: int = 3
+    backoff_base: float = 0.25
+    backoff_max: float = 4.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    retry_after_max: float = 30.0
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Check whether a failed attempt is worth retrying.
+        
+        Args:
+            error (Exception): Error raised by the attempt.
+        
+        Returns:
+            bool: True for connection errors, timeouts and retryable statuses.
+        """
+        if isinstance(error, requests.exceptions.HTTPError):
+            response = error.response
+            return response is not None and response.status_code in self.retry_statuses
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+    
+    def get_delay(self, attempt: int, error: Optional[Exception] = None) -> Optional[float]:
+        """
+        Get the sleep before the next attempt.
+        
+        Args:
+            attempt (int): Number of the attempt that just failed (1-based).
+            error (Optional[Exception]): Error raised by that attempt.
+        
+        Returns:
+            Optional[float]: Seconds to wait, or None when Retry-After asks
+            for longer than retry_after_max.
+        """
+        retry_after = self._retry_after(error)
+        if retry_after is not None:
+            if retry_after > self.retry_after_max:
+                return None
+            return retry_after
+        
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+    
+    def _retry_after(self, error: Optional[Exception]) -> Optional[float]:
+        """
+        Parse the Retry-After header of an error response.
+        
+        Args:
+            error (Optional[Exception]): Error raised by the attempt.
+        
+        Returns:
+            Optional[float]: Seconds requested by the server, if any.
+        """
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+        
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+        
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of request volume.
+    
+    Every request deposits ``ratio`` tokens and every retry withdraws one,
+    so during an upstream brownout retries add at most ``ratio`` extra
+    load. ``min_per_second`` keeps a trickle of retries available for
+    low-traffic clients.
+    """
+    
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, capacity: float = 10.0):
+        """
+        Initialize retry budget.
+        
+        Args:
+            ratio (float): Retry tokens earned per request.
+            min_per_second (float): Retry tokens earned per second regardless of traffic.
+            capacity (float): Maximum banked tokens.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """Add the time-based share of retry tokens."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+    
+    def record_request(self):
+        """Deposit the per-request share of retry tokens."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+    
+    def try_acquire(self) -> bool:
+        """
+        Withdraw one retry token.
+        
+        Returns:
+            bool: True if the retry may proceed.
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+
+@dataclass
+class EndpointRetryStats:
+    """Retry counters for one endpoint."""
+    
+    requests: int = 0
+    retries: int = 0
+    recovered: int = 0
+    exhausted: int = 0
+    budget_denied: int = 0
+    auth_replays: int = 0
+    last_error: Optional[str] = None
+
+
+class RetryStats:
+    """Per-endpoint retry counters."""
+    
+    def __init__(self):
+        """Initialize empty counters."""
+        self._endpoints: Dict[str, EndpointRetryStats] = {}
+        self._lock = threading.Lock()
+    
+    def _get(self, endpoint: str) -> EndpointRetryStats:
+        """
+        Get counters for an endpoint, creating them on first use.
+        
+        Args:
+            endpoint (str): Endpoint key.
+        
+        Returns:
+            EndpointRetryStats: Endpoint counters.
+        """
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = EndpointRetryStats()
+        return stats
+    
+    def record(self, endpoint: str, event: str, error: Optional[Exception] = None):
+        """
+        Increment a counter for an endpoint.
+        
+        Args:
+            endpoint (str): Endpoint key, e.g. "GET /api/v1/models".
+            event (str): One of requests, retries, recovered, exhausted, budget_denied, auth_replays.
+            error (Optional[Exception]): Error that triggered the event.
+        """
+        with self._lock:
+            stats = self._get(endpoint)
+            setattr(stats, event, getattr(stats, event) + 1)
+            if error is not None:
+                stats.last_error = str(error)[:200]
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot the counters.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Counters keyed by endpoint.
+        """
+        with self._lock:
+            return {endpoint: dict(stats.__dict__) for endpoint, stats in self._endpoints.items()}
+
+
+_budgets: Dict[str, RetryBudget] = {}
+_budgets_lock = threading.Lock()
+_stats = RetryStats()
+
+
+def get_retry_budget(url: str) -> RetryBudget:
+    """
+    Get the process-wide retry budget for an upstream host.
+    
+    Args:
+        url (str): Any URL on the upstream host.
+    
+    Returns:
+        RetryBudget: Shared budget.
+    """
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    with _budgets_lock:
+        budget = _budgets.get(key)
+        if budget is None:
+            budget = _budgets[key] = RetryBudget()
+        return budget
+
+
+def get_retry_stats() -> RetryStats:
+    """
+    Get the process-wide retry counters.
+    
+    Returns:
+        RetryStats: Shared counters.
+    """
+    return _stats
\ No newline at end of file
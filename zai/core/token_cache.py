@@ -0,0 +1,323 @@
+"""Guest token cache shared by every process of a user on the host."""
+
+import base64
+import binascii
+import getpass
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from ..utils.json_codec import dumps, loads
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """
+    Read the expiry time from a JWT's exp claim.
+    
+    The signature is not checked; the claim is only used to decide when
+    to fetch a new token.
+    
+    Args:
+        token (str): Bearer token.
+    
+    Returns:
+        Optional[float]: Unix time the token expires at, or None if it is
+        not a JWT or carries no exp claim.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    
+    payload = parts[1]
+    try:
+        claims = loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (binascii.Error, ValueError):
+        return None
+    
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+def default_cache_path() -> str:
+    """
+    Get the default cache file, in a cache directory of the current user.
+    
+    The directory is created readable by the owner only. If it cannot be
+    created, a file named after the user in the temp dir is used instead.
+    
+    Returns:
+        str: Path of the cache file.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    directory = os.path.join(base, "zai")
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    except OSError:
+        return os.path.join(tempfile.gettempdir(), f"zai-guest-token-{getpass.getuser()}.json")
+    return os.path.join(directory, "guest-token.json")
+
+
+@dataclass
+class TokenCacheStats:
+    """Guest token cache counters."""
+    
+    hits: int = 0
+    misses: int = 0
+    fetches: int = 0
+    invalidations: int = 0
+    errors: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot the counters.
+        
+        Returns:
+            Dict[str, Any]: Counters and hit rate.
+        """
+        stats = dict(self.__dict__)
+        lookups = self.hits + self.misses
+        stats["hit_rate"] = round(self.hits / lookups, 4) if lookups else 0.0
+        return stats
+
+
+class TokenCache:
+    """Guest tokens kept in a locked JSON file, keyed by base URL.
+    
+    Tokens are reused until ``skew`` seconds before they expire, taken
+    from the JWT exp claim or, without one, ``ttl`` seconds after they
+    were fetched. Reads and writes hold an exclusive lock on a sidecar
+    ``.lock`` file for as long as they touch the file. A miss also holds
+    a lock of its key while fetching, so worker processes that start
+    together make one auth call per key between them, while fetches for
+    other keys go ahead. The cache and lock files are readable by their
+    owner only.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        skew: float = 60.0
+    ):
+        """
+        Initialize token cache.
+        
+        Args:
+            path (Optional[str]): Cache file (defaults to ZAI_TOKEN_CACHE or default_cache_path()).
+            ttl (Optional[float]): Lifetime in seconds of tokens without an exp claim (defaults to ZAI_TOKEN_TTL or 3600).
+            skew (float): Seconds before expiry at which a token is no longer handed out.
+        """
+        self.path = path or os.environ.get("ZAI_TOKEN_CACHE") or default_cache_path()
+        self.ttl = ttl if ttl is not None else float(os.environ.get("ZAI_TOKEN_TTL", 3600))
+        self.skew = skew
+        self.stats = TokenCacheStats()
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+    
+    def record(self, event: str):
+        """
+        Increment a counter.
+        
+        Args:
+            event (str): One of the TokenCacheStats fields.
+        """
+        with self._stats_lock:
+            setattr(self.stats, event, getattr(self.stats, event) + 1)
+    
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the in-process and cross-process locks of the cache file."""
+        with _file_locked(self._lock, self.path + ".lock"):
+            yield
+    
+    @contextmanager
+    def _key_locked(self, key: str) -> Iterator[None]:
+        """Hold the in-process and cross-process locks of one key."""
+        with self._stats_lock:
+            lock = self._key_locks.setdefault(key, threading.Lock())
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        with _file_locked(lock, f"{self.path}.{digest}.lock"):
+            yield
+    
+    def _read(self) -> Dict[str, Dict]:
+        """Load every cache entry; an unreadable file counts as empty."""
+        try:
+            with open(self.path, "rb") as f:
+                entries = loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            self.record("errors")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+    
+    def _write(self, entries: Dict[str, Dict]):
+        """Replace the cache file atomically, readable by the owner only."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".zai-token-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps(entries))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            self.record("errors")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    
+    def _valid(self, entry: Optional[Dict]) -> Optional[Dict]:
+        """Return an entry's auth data if it has not expired."""
+        if not isinstance(entry, dict) or not isinstance(entry.get("auth_data"), dict):
+            return None
+        if entry.get("expires_at", 0) - self.skew <= time.time():
+            return None
+        return entry["auth_data"]
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Get cached auth data.
+        
+        Args:
+            key (str): Cache key, the API base URL.
+        
+        Returns:
+            Optional[Dict]: Auth data of a token that is still valid, or None.
+        """
+        with self._locked():
+            auth_data = self._valid(self._read().get(key))
+        self.record("misses" if auth_data is None else "hits")
+        return auth_data
+    
+    def put(self, key: str, auth_data: Dict):
+        """
+        Store auth data.
+        
+        Args:
+            key (str): Cache key, the API base URL.
+            auth_data (Dict): Auth response containing the token.
+        """
+        with self._locked():
+            self._put(self._read(), key, auth_data)
+            self.record("fetches")
+    
+    def _put(self, entries: Dict[str, Dict], key: str, auth_data: Dict):
+        """Add an entry to loaded entries and write them back."""
+        expires_at = token_expiry(auth_data["token"]) or time.time() + self.ttl
+        entries[key] = {"auth_data": auth_data, "expires_at": expires_at}
+        self._write(entries)
+    
+    def get_or_fetch(self, key: str, fetch: Callable[[], Dict]) -> Dict:
+        """
+        Get cached auth data, fetching and storing it on a miss.
+        
+        The key's lock is held while fetching, so concurrent callers for
+        the same key, in this or other processes, wait for this fetch and
+        then read its result. The cache file is not locked meanwhile.
+        
+        Args:
+            key (str): Cache key, the API base URL.
+            fetch (Callable[[], Dict]): Fetches fresh auth data.
+        
+        Returns:
+            Dict: Auth data containing a valid token.
+        """
+        with self._locked():
+            auth_data = self._valid(self._read().get(key))
+        if auth_data is not None:
+            self.record("hits")
+            return auth_data
+        
+        with self._key_locked(key):
+            with self._locked():
+                auth_data = self._valid(self._read().get(key))
+            if auth_data is not None:
+                self.record("hits")
+                return auth_data
+            
+            self.record("misses")
+            auth_data = fetch()
+            self.record("fetches")
+            with self._locked():
+                self._put(self._read(), key, auth_data)
+            return auth_data
+    
+    def invalidate(self, key: str, token: Optional[str] = None):
+        """
+        Drop a cached token, e.g. after the API rejected it.
+        
+        Args:
+            key (str): Cache key, the API base URL.
+            token (Optional[str]): Only drop the entry if it still holds this
+                token, so a newer token stored by another process survives.
+        """
+        with self._locked():
+            entries = self._read()
+            entry = entries.get(key)
+            if entry is None:
+                return
+            if token is not None and entry.get("auth_data", {}).get("token") != token:
+                return
+            del entries[key]
+            self._write(entries)
+            self.record("invalidations")
+
+
+@contextmanager
+def _file_locked(lock: threading.Lock, path: str) -> Iterator[None]:
+    """
+    Hold a thread lock and an exclusive lock on a lock file.
+    
+    Args:
+        lock (threading.Lock): In-process lock, taken first.
+        path (str): Lock file, created readable by the owner only.
+    """
+    with lock:
+        with os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o600), "r+b") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+_cache: Optional[TokenCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache:
+    """
+    Get the process-wide guest token cache.
+    
+    Returns:
+        TokenCache: Shared cache backed by ZAI_TOKEN_CACHE.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TokenCache()
+        return _cache
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""Pool of guest tokens handed out per request."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .exceptions import ZAIError
+
+
+# Statuses after which a pooled token is dropped and replaced
+EVICT_STATUSES = frozenset({401, 403, 429})
+
+
+@dataclass
+class PooledToken:
+    """A guest token held in one pool slot."""
+    
+    slot: int
+    auth_data: Dict
+    last_used: float = 0.0
+    uses: int = 0
+    
+    @property
+    def token(self) -> str:
+        """Bearer token string."""
+        return self.auth_data["token"]
+
+
+class TokenPool:
+    """Keeps several guest tokens warm and spreads requests over them.
+    
+    Every request takes the least recently used token, which cycles
+    through the pool round-robin under steady load. A token answered
+    with 401, 403 or 429 is evicted and its slot refilled by a
+    background thread, so throttling of one token does not stall the
+    others. If every slot is empty, acquire() fetches a token inline.
+    """
+    
+    def __init__(
+        self,
+        fetch: Callable[[int], Dict],
+        size: int = 4,
+        on_evict: Optional[Callable[[PooledToken], None]] = None
+    ):
+        """
+        Initialize token pool.
+        
+        Args:
+            fetch (Callable[[int], Dict]): Fetches auth data for a slot number.
+            size (int): Number of tokens kept.
+            on_evict (Optional[Callable[[PooledToken], None]]): Called with each evicted token before its slot is refilled.
+        """
+        self.fetch = fetch
+        self.on_evict = on_evict
+        self.size = max(1, size)
+        self._slots: Dict[int, PooledToken] = {}
+        self._lock = threading.Lock()
+        self._fill_lock = threading.Lock()
+        self._refiller: Optional[threading.Thread] = None
+        self._counters = {"acquired": 0, "evicted": 0, "fetched": 0, "fetch_errors": 0}
+    
+    def fill(self, count: Optional[int] = None) -> int:
+        """
+        Fetch tokens for empty slots now.
+        
+        Args:
+            count (Optional[int]): Slots to fill at most (defaults to all).
+        
+        Returns:
+            int: Tokens in the pool afterwards.
+        """
+        with self._fill_lock:
+            for slot in self._empty_slots()[:count]:
+                self._fill_slot(slot)
+        return len(self._slots)
+    
+    def _empty_slots(self) -> list:
+        """Slot numbers without a token."""
+        with self._lock:
+            return [slot for slot in range(self.size) if slot not in self._slots]
+    
+    def _fill_slot(self, slot: int):
+        """Fetch a token into a slot; failures leave it empty."""
+        try:
+            auth_data = self.fetch(slot)
+        except Exception:
+            with self._lock:
+                self._counters["fetch_errors"] += 1
+            return
+        with self._lock:
+            self._slots[slot] = PooledToken(slot, auth_data)
+            self._counters["fetched"] += 1
+    
+    def refill_async(self):
+        """Refill empty slots on a background thread, unless one is running."""
+        with self._lock:
+            if self._refiller is not None and self._refiller.is_alive():
+                return
+            self._refiller = threading.Thread(target=self.fill, name="zai-token-refill", daemon=True)
+            self._refiller.start()
+    
+    def acquire(self) -> PooledToken:
+        """
+        Take a token for one request.
+        
+        Returns:
+            PooledToken: The least recently used token.
+        
+        Raises:
+            ZAIError: If the pool is empty and no token could be fetched.
+        """
+        while True:
+            with self._lock:
+                if self._slots:
+                    pooled = min(self._slots.values(), key=lambda t: t.last_used)
+                    pooled.last_used = time.monotonic()
+                    pooled.uses += 1
+                    self._counters["acquired"] += 1
+                    return pooled
+            
+            if not self.fill(1):
+                raise ZAIError("No guest token available in the token pool")
+    
+    def report(self, pooled: PooledToken, status: int) -> bool:
+        """
+        Tell the pool how a request made with a token ended.
+        
+        Args:
+            pooled (PooledToken): Token used for the request.
+            status (int): HTTP status of the response.
+        
+        Returns:
+            bool: True if the token was evicted.
+        """
+        if status not in EVICT_STATUSES:
+            return False
+        with self._lock:
+            if self._slots.get(pooled.slot) is not pooled:
+                return False
+            del self._slots[pooled.slot]
+            self._counters["evicted"] += 1
+        if self.on_evict:
+            self.on_evict(pooled)
+        self.refill_async()
+        return True
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot the pool.
+        
+        Returns:
+            Dict[str, Any]: Size, tokens held, per-slot use counts and counters.
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "tokens": len(self._slots),
+                "uses": {str(slot): pooled.uses for slot, pooled in sorted(self._slots.items())},
+                **self._counters
+            }
\ No newline at end of file
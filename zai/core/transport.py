@@ -0,0 +1,628 @@
+"""Process-wide connection pools for upstream API hosts."""
+
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import EmptyPoolError
+from urllib3.poolmanager import PoolManager
+
+from .http2 import HTTP2Transport
+
+
+# Set on threads sending warm-up requests so they stay out of the latency counters
+_warming = threading.local()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """
+    Read a boolean environment variable.
+    
+    Args:
+        name (str): Variable name.
+        default (bool): Value when the variable is unset.
+    
+    Returns:
+        bool: Parsed value.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass
+class PoolConfig:
+    """Connection pool settings for one upstream host."""
+    
+    maxsize: int = 32
+    block: bool = False
+    pool_timeout: Optional[float] = 30.0
+    keepalive: bool = True
+    keepalive_idle: int = 60
+    keepalive_interval: int = 15
+    keepalive_count: int = 4
+    warm_connections: int = 2
+    keepwarm_interval: float = 45.0
+    
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """
+        Build the default pool config from UPSTREAM_POOL_* variables.
+        
+        Returns:
+            PoolConfig: Pool configuration.
+        """
+        return cls(
+            maxsize=int(os.environ.get("UPSTREAM_POOL_MAXSIZE", cls.maxsize)),
+            block=_env_bool("UPSTREAM_POOL_BLOCK", cls.block),
+            pool_timeout=float(os.environ.get("UPSTREAM_POOL_TIMEOUT", cls.pool_timeout)),
+            keepalive=_env_bool("UPSTREAM_POOL_KEEPALIVE", cls.keepalive),
+            keepalive_idle=int(os.environ.get("UPSTREAM_POOL_KEEPALIVE_IDLE", cls.keepalive_idle)),
+            warm_connections=int(os.environ.get("UPSTREAM_POOL_WARM", cls.warm_connections)),
+            keepwarm_interval=float(os.environ.get("UPSTREAM_POOL_KEEPWARM_INTERVAL", cls.keepwarm_interval))
+        )
+    
+    def socket_options(self) -> list:
+        """
+        Socket options for new connections in this pool.
+        
+        Returns:
+            list: urllib3 socket_options list.
+        """
+        options = list(HTTPConnection.default_socket_options)
+        if not self.keepalive:
+            return options
+        
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepalive_idle))
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keepalive_interval))
+        if hasattr(socket, "TCP_KEEPCNT"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.keepalive_count))
+        return options
+
+
+@dataclass
+class PoolStats:
+    """Occupancy and wait-time counters for one upstream host."""
+    
+    host: str
+    maxsize: int
+    in_use: int = 0
+    peak_in_use: int = 0
+    checkouts: int = 0
+    connections_created: int = 0
+    connections_discarded: int = 0
+    waits: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    cold_checkouts: int = 0
+    responses: int = 0
+    ttfb_total: float = 0.0
+    ttfb_max: float = 0.0
+    warm_runs: int = 0
+    warm_pings: int = 0
+    warm_failures: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    
+    WAIT_THRESHOLD = 0.001
+    
+    def record_checkout(self, waited: float, cold: bool = False):
+        """
+        Record a connection leaving the pool.
+        
+        Args:
+            waited (float): Seconds spent waiting for the connection.
+            cold (bool): The connection still has to be opened (DNS, TCP, TLS).
+        """
+        with self.lock:
+            self.checkouts += 1
+            if cold:
+                self.cold_checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+            if waited >= self.WAIT_THRESHOLD:
+                self.waits += 1
+    
+    def record_checkin(self, discarded: bool):
+        """
+        Record a connection returning to the pool.
+        
+        Args:
+            discarded (bool): The pool was full and the connection was closed.
+        """
+        with self.lock:
+            self.in_use = max(0, self.in_use - 1)
+            if discarded:
+                self.connections_discarded += 1
+    
+    def record_new_connection(self):
+        """Record a newly opened connection."""
+        with self.lock:
+            self.connections_created += 1
+    
+    def record_response(self, ttfb: float):
+        """
+        Record the time until a response's headers arrived.
+        
+        Args:
+            ttfb (float): Seconds from sending the request to the response headers.
+        """
+        with self.lock:
+            self.responses += 1
+            self.ttfb_total += ttfb
+            self.ttfb_max = max(self.ttfb_max, ttfb)
+    
+    def record_warm(self, pings: int, failures: int):
+        """
+        Record one pre-warm or keep-warm round.
+        
+        Args:
+            pings (int): Warm-up requests that got a response.
+            failures (int): Warm-up requests that failed.
+        """
+        with self.lock:
+            self.warm_runs += 1
+            self.warm_pings += pings
+            self.warm_failures += failures
+    
+    def to_dict(self, idle: int = 0) -> Dict[str, Any]:
+        """
+        Snapshot the counters.
+        
+        Args:
+            idle (int): Idle connections currently parked in the pool.
+        
+        Returns:
+            Dict[str, Any]: Counter values.
+        """
+        with self.lock:
+            return {
+                "host": self.host,
+                "maxsize": self.maxsize,
+                "in_use": self.in_use,
+                "idle": idle,
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "connections_created": self.connections_created,
+                "connections_discarded": self.connections_discarded,
+                "waits": self.waits,
+                "wait_time_total": round(self.wait_time_total, 6),
+                "wait_time_max": round(self.wait_time_max, 6),
+                "wait_time_avg": round(self.wait_time_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "cold_checkouts": self.cold_checkouts,
+                "responses": self.responses,
+                "ttfb_avg": round(self.ttfb_total / self.responses, 6) if self.responses else 0.0,
+                "ttfb_max": round(self.ttfb_max, 6),
+                "warm_runs": self.warm_runs,
+                "warm_pings": self.warm_pings,
+                "warm_failures": self.warm_failures
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Records checkout wait time and occupancy on a urllib3 pool."""
+    
+    stats: Optional[PoolStats] = None
+    pool_timeout: Optional[float] = None
+    
+    def _get_conn(self, timeout=None):
+        if timeout is None:
+            timeout = self.pool_timeout
+        start = time.perf_counter()
+        conn = super()._get_conn(timeout)
+        if self.stats:
+            cold = getattr(conn, "sock", None) is None and not getattr(_warming, "active", False)
+            self.stats.record_checkout(time.perf_counter() - start, cold=cold)
+        return conn
+    
+    def _put_conn(self, conn):
+        discarded = self.pool is not None and self.pool.full()
+        if self.stats:
+            self.stats.record_checkin(discarded and conn is not None)
+        super()._put_conn(conn)
+    
+    def _new_conn(self):
+        if self.stats:
+            self.stats.record_new_connection()
+        return super()._new_conn()
+    
+    def idle_connections(self) -> int:
+        """
+        Count connections parked in the pool.
+        
+        Returns:
+            int: Idle connection count.
+        """
+        if self.pool is None:
+            return 0
+        return sum(1 for conn in list(self.pool.queue) if conn is not None)
+
+
+class _InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _InstrumentedPoolManager(PoolManager):
+    """PoolManager whose pools report into a shared PoolStats."""
+    
+    def __init__(self, *args, stats: PoolStats, pool_timeout: Optional[float], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+        self.pool_timeout = pool_timeout
+        self.pool_classes_by_scheme = {
+            "http": _InstrumentedHTTPConnectionPool,
+            "https": _InstrumentedHTTPSConnectionPool
+        }
+    
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.stats = self.stats
+        pool.pool_timeout = self.pool_timeout
+        return pool
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter backed by an instrumented, configurable pool."""
+    
+    def __init__(self, config: PoolConfig, stats: PoolStats):
+        """
+        Initialize pooled adapter.
+        
+        Args:
+            config (PoolConfig): Pool configuration.
+            stats (PoolStats): Counters shared by every pool of this adapter.
+        """
+        self.pool_config = config
+        self.stats = stats
+        super().__init__(
+            pool_connections=1,
+            pool_maxsize=config.maxsize,
+            pool_block=config.block
+        )
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _InstrumentedPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            socket_options=self.pool_config.socket_options(),
+            stats=self.stats,
+            pool_timeout=self.pool_config.pool_timeout,
+            **pool_kwargs
+        )
+    
+    def send(self, request, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except EmptyPoolError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        if not getattr(_warming, "active", False):
+            self.stats.record_response(time.perf_counter() - start)
+        return response
+    
+    def idle_connections(self) -> int:
+        """
+        Count idle connections parked in this adapter's pools.
+        
+        Returns:
+            int: Idle connection count.
+        """
+        pools = self.poolmanager.pools
+        idle = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None and hasattr(pool, "idle_connections"):
+                idle += pool.idle_connections()
+        return idle
+
+
+class TransportRegistry:
+    """One shared connection pool per upstream host.
+    
+    Sessions keep their own headers and cookies but mount the adapter
+    registered for their host, so every session talking to the same
+    upstream reuses the same warm connections.
+    """
+    
+    def __init__(self, default_config: Optional[PoolConfig] = None):
+        """
+        Initialize transport registry.
+        
+        Args:
+            default_config (Optional[PoolConfig]): Config for hosts without an override.
+        """
+        self.default_config = default_config or PoolConfig.from_env()
+        self._configs: Dict[str, PoolConfig] = {}
+        self._adapters: Dict[str, PooledAdapter] = {}
+        self._http2: Dict[str, HTTP2Transport] = {}
+        self._lock = threading.Lock()
+        self._keepwarm: Optional[threading.Thread] = None
+        self._keepwarm_stop = threading.Event()
+    
+    @staticmethod
+    def _key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+    
+    def configure(self, url: str, config: Optional[PoolConfig] = None, **overrides) -> PoolConfig:
+        """
+        Set the pool configuration for an upstream host.
+        
+        An existing pool for the host is closed and rebuilt with the new
+        settings; sessions already mounted on it pick up the change.
+        
+        Args:
+            url (str): Any URL on the upstream host.
+            config (Optional[PoolConfig]): Full configuration to use.
+            **overrides: Individual PoolConfig fields to change.
+        
+        Returns:
+            PoolConfig: The effective configuration.
+        """
+        key = self._key(url)
+        with self._lock:
+            base = config or self._configs.get(key) or self.default_config
+            new_config = PoolConfig(**{**base.__dict__, **overrides})
+            self._configs[key] = new_config
+            
+            adapter = self._adapters.get(key)
+            if adapter:
+                adapter.close()
+                adapter.pool_config = new_config
+                adapter.stats.maxsize = new_config.maxsize
+                adapter.init_poolmanager(1, new_config.maxsize, new_config.block)
+        return new_config
+    
+    def adapter_for(self, url: str) -> PooledAdapter:
+        """
+        Get the shared adapter for a URL's host, creating it on first use.
+        
+        Args:
+            url (str): Any URL on the upstream host.
+        
+        Returns:
+            PooledAdapter: Shared adapter.
+        """
+        key = self._key(url)
+        with self._lock:
+            adapter = self._adapters.get(key)
+            if adapter is None:
+                config = self._configs.get(key, self.default_config)
+                adapter = PooledAdapter(config, PoolStats(host=key, maxsize=config.maxsize))
+                self._adapters[key] = adapter
+            return adapter
+    
+    def http2_transport(self, url: str) -> HTTP2Transport:
+        """
+        Get the shared HTTP/2 transport for a URL's host, creating it on first use.
+        
+        Args:
+            url (str): Any URL on the upstream host.
+        
+        Returns:
+            HTTP2Transport: Shared multiplexed transport.
+        """
+        key = self._key(url)
+        with self._lock:
+            transport = self._http2.get(key)
+            if transport is None:
+                config = self._configs.get(key, self.default_config)
+                transport = HTTP2Transport(max_connections=config.maxsize)
+                self._http2[key] = transport
+            return transport
+    
+    def mount(self, session: requests.Session, url: str) -> requests.Session:
+        """
+        Route a session's requests for a host through the shared pool.
+        
+        Args:
+            session (requests.Session): Session to mount on.
+            url (str): Any URL on the upstream host.
+        
+        Returns:
+            requests.Session: The same session.
+        """
+        session.mount(self._key(url) + "/", self.adapter_for(url))
+        return session
+    
+    def create_session(self, url: str) -> requests.Session:
+        """
+        Create a session that uses the shared pool for a host.
+        
+        Args:
+            url (str): Any URL on the upstream host.
+        
+        Returns:
+            requests.Session: New session.
+        """
+        return self.mount(requests.Session(), url)
+    
+    def prewarm(
+        self,
+        url: str,
+        count: Optional[int] = None,
+        path: str = "/",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0
+    ) -> int:
+        """
+        Open warm connections to a host and park them in its pool.
+        
+        Sends ``count`` concurrent HEAD requests through the shared pool
+        and holds every response until all arrived, so each one opens its
+        own connection (DNS, TCP and TLS). They are then released back to
+        the pool, ready for the first real request.
+        
+        Args:
+            url (str): Any URL on the upstream host.
+            count (Optional[int]): Connections to warm (defaults to the host's warm_connections).
+            path (str): Path to send the HEAD requests to.
+            headers (Optional[Dict[str, str]]): Headers for the warm-up requests.
+            timeout (float): Timeout of each warm-up request in seconds.
+        
+        Returns:
+            int: Warm-up requests that got a response.
+        """
+        key = self._key(url)
+        config = self._configs.get(key, self.default_config)
+        count = min(config.warm_connections if count is None else count, config.maxsize)
+        if count <= 0:
+            return 0
+        
+        session = self.create_session(url)
+        if headers:
+            session.headers.update(headers)
+        
+        def ping(_):
+            _warming.active = True
+            try:
+                return session.head(key + path, timeout=timeout, stream=True, allow_redirects=False)
+            except requests.exceptions.RequestException:
+                return None
+            finally:
+                _warming.active = False
+        
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            responses = list(executor.map(ping, range(count)))
+        
+        pings = 0
+        for response in responses:
+            if response is not None:
+                pings += 1
+                response.content
+                response.close()
+        
+        self.adapter_for(url).stats.record_warm(pings, count - pings)
+        return pings
+    
+    def start_keepwarm(
+        self,
+        urls: List[str],
+        interval: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> threading.Thread:
+        """
+        Pre-warm hosts now and keep their connections warm in the background.
+        
+        A daemon thread warms every host right away, then every
+        ``interval`` seconds re-warms hosts that saw no traffic since the
+        last round or lost idle connections, so servers do not close
+        them for idling. Hosts with steady traffic cost nothing.
+        
+        Args:
+            urls (List[str]): One URL per upstream host.
+            interval (Optional[float]): Seconds between rounds (defaults to keepwarm_interval).
+            headers (Optional[Dict[str, str]]): Headers for the warm-up requests.
+        
+        Returns:
+            threading.Thread: The keep-warm thread.
+        """
+        self.stop_keepwarm()
+        interval = interval or self.default_config.keepwarm_interval
+        self._keepwarm_stop = threading.Event()
+        stop = self._keepwarm_stop
+        
+        def run():
+            last_checkouts: Dict[str, int] = {}
+            while True:
+                for url in urls:
+                    adapter = self.adapter_for(url)
+                    config = adapter.pool_config
+                    checkouts = adapter.stats.checkouts
+                    busy = checkouts != last_checkouts.get(url)
+                    if busy and url in last_checkouts and adapter.idle_connections() >= config.warm_connections:
+                        last_checkouts[url] = checkouts
+                        continue
+                    try:
+                        self.prewarm(url, headers=headers)
+                    except Exception:
+                        adapter.stats.record_warm(0, 1)
+                    last_checkouts[url] = adapter.stats.checkouts
+                if stop.wait(interval):
+                    return
+        
+        thread = threading.Thread(target=run, name="upstream-keepwarm", daemon=True)
+        thread.start()
+        self._keepwarm = thread
+        return thread
+    
+    def stop_keepwarm(self):
+        """Stop the keep-warm thread, if running."""
+        self._keepwarm_stop.set()
+        self._keepwarm = None
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot pool counters for every registered host.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Counters keyed by host.
+        """
+        with self._lock:
+            adapters = dict(self._adapters)
+            http2 = dict(self._http2)
+        
+        stats = {
+            key: adapter.stats.to_dict(idle=adapter.idle_connections())
+            for key, adapter in adapters.items()
+        }
+        for key, transport in http2.items():
+            stats.setdefault(key, {"host": key})["http2"] = transport.stats()
+        return stats
+    
+    def close(self):
+        """Close every pooled connection."""
+        self.stop_keepwarm()
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close()
+            for transport in self._http2.values():
+                transport.close()
+
+
+_registry = TransportRegistry()
+
+
+def get_registry() -> TransportRegistry:
+    """
+    Get the process-wide transport registry.
+    
+    Returns:
+        TransportRegistry: Shared registry.
+    """
+    return _registry
+
+
+def create_session(url: str) -> requests.Session:
+    """
+    Create a session that uses the process-wide pool for a host.
+    
+    Args:
+        url (str): Any URL on the upstream host.
+    
+    Returns:
+        requests.Session: New session.
+    """
+    return _registry.create_session(url)
\ No newline at end of file
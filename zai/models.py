@@ -1,12 +1,101 @@
-"""Data models for Z.AI API responses and requests."""
+"""Data models for Z.AI API responses and requests.
+
+The models are slotted dataclasses without a per-instance __dict__, which
+keeps per-token StreamingChunks and long chat histories small. Only
+declared fields can be set on them.
+
+Nested objects of parsed API responses are lazy: from_dict keeps the
+decoded data in the field, and it is turned into model objects the first
+time the field is read.
+"""
 
 import time
 import uuid
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+class _Raw:
+    """Decoded API data waiting in a lazy field."""
+    
+    __slots__ = ("data",)
+    
+    def __init__(self, data: Any):
+        """
+        Initialize raw data.
+        
+        Args:
+            data (Any): Decoded JSON value.
+        """
+        self.data = data
 
 
-@dataclass
+class _LazyField:
+    """Slot whose raw value is materialized on first read."""
+    
+    def __init__(self, slot: Any, build: Callable[[Any, Dict], Any]):
+        """
+        Initialize lazy field.
+        
+        Args:
+            slot (Any): The slot descriptor created by the dataclass.
+            build (Callable[[Any, Any], Any]): Builds the value from the instance and the raw data.
+        """
+        self.slot = slot
+        self.build = build
+    
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if isinstance(value, _Raw):
+            value = self.build(obj, value.data)
+            self.slot.__set__(obj, value)
+        return value
+    
+    def __set__(self, obj: Any, value: Any):
+        self.slot.__set__(obj, value)
+
+
+def _lazy_fields(**builders: Callable[[Any, Any], Any]) -> Callable[[type], type]:
+    """
+    Make slotted dataclass fields lazy.
+    
+    A field set to _Raw data holds it until first read, when the builder
+    turns it into the field's real value. Other values are kept as is.
+    
+    Args:
+        **builders (Callable[[Any, Any], Any]): Builder per field name.
+    
+    Returns:
+        Callable[[type], type]: Class decorator, applied above @dataclass(slots=True).
+    """
+    def decorate(cls: type) -> type:
+        for name, build in builders.items():
+            setattr(cls, name, _LazyField(cls.__dict__[name], build))
+        return cls
+    
+    return decorate
+
+
+def _known_fields(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep the keys of API data that are fields of a dataclass.
+    
+    The server adds params and capabilities over time; keys this client
+    does not know are dropped instead of failing the constructor.
+    
+    Args:
+        cls (type): Dataclass to build.
+        data (Dict[str, Any]): Decoded API object.
+    
+    Returns:
+        Dict[str, Any]: Keyword arguments for cls.
+    """
+    return {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+
+
+@dataclass(slots=True)
 class ModelCapabilities:
     """Model capabilities configuration."""
     
@@ -23,17 +112,21 @@ class ModelCapabilities:
     think: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelParams:
-    """Model parameters configuration."""
+    """Model parameters configuration.
+    
+    Params the server did not send are None, so callers can fall back to
+    their own defaults.
+    """
     
-    temperature: float = 0.6
-    top_p: float = 0.95
-    max_tokens: int = 80000
+    temperature: Optional[float] = None
+    top_p: Optional[float] = None
+    max_tokens: Optional[int] = None
     top_k: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelMeta:
     """Model metadata."""
     
@@ -43,11 +136,38 @@ class ModelMeta:
     mcpServerIds: Optional[List[str]] = None
     suggestion_prompts: Optional[List[Dict[str, Any]]] = None
     tags: List[Dict[str, str]] = field(default_factory=list)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelMeta":
+        """
+        Create ModelMeta from the meta object of a model.
+        
+        Args:
+            data (Dict[str, Any]): Meta dictionary.
+        
+        Returns:
+            ModelMeta: Instance of ModelMeta.
+        """
+        return cls(
+            profile_image_url=data.get("profile_image_url", "/static/favicon.png"),
+            description=data.get("description", ""),
+            capabilities=ModelCapabilities(**_known_fields(ModelCapabilities, data.get("capabilities", {}))),
+            mcpServerIds=data.get("mcpServerIds"),
+            suggestion_prompts=data.get("suggestion_prompts"),
+            tags=data.get("tags", [])
+        )
 
 
-@dataclass
+@_lazy_fields(
+    params=lambda info, data: ModelParams(**_known_fields(ModelParams, data)),
+    meta=lambda info, data: ModelMeta.from_dict(data)
+)
+@dataclass(slots=True)
 class ModelInfo:
-    """Model information."""
+    """Model information.
+    
+    params and meta are built on first access when parsed with from_dict.
+    """
     
     id: str
     user_id: str
@@ -59,11 +179,40 @@ class ModelInfo:
     is_active: bool = True
     updated_at: int = 0
     created_at: int = 0
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelInfo":
+        """
+        Create ModelInfo from the info object of a model.
+        
+        Args:
+            data (Dict[str, Any]): Info dictionary.
+        
+        Returns:
+            ModelInfo: Instance of ModelInfo, with params and meta still raw.
+        """
+        return cls(
+            id=data["id"],
+            user_id=data["user_id"],
+            base_model_id=data.get("base_model_id"),
+            name=data["name"],
+            params=_Raw(data.get("params", {})),
+            meta=_Raw(data["meta"]),
+            access_control=data.get("access_control"),
+            is_active=data.get("is_active", True),
+            updated_at=data.get("updated_at", 0),
+            created_at=data.get("created_at", 0)
+        )
 
 
-@dataclass
+@_lazy_fields(info=lambda model, data: ModelInfo.from_dict(data))
+@dataclass(slots=True)
 class Model:
-    """Z.AI Model representation."""
+    """Z.AI Model representation.
+    
+    info is built on first access when parsed with from_dict, so a
+    catalog lookup by id does not build every model's nested objects.
+    """
     
     id: str
     name: str
@@ -83,52 +232,30 @@ class Model:
             data (Dict[str, Any]): API response dictionary.
         
         Returns:
-            Model: Instance of Model.
+            Model: Instance of Model, with info still raw.
         """
-        info_data = data["info"]
-        
-        capabilities_data = info_data["meta"].get("capabilities", {})
-        capabilities = ModelCapabilities(**capabilities_data)
-        
-        params_data = info_data.get("params", {})
-        params = ModelParams(**params_data)
-        
-        meta_data = info_data["meta"]
-        meta = ModelMeta(
-            profile_image_url=meta_data.get("profile_image_url", "/static/favicon.png"),
-            description=meta_data.get("description", ""),
-            capabilities=capabilities,
-            mcpServerIds=meta_data.get("mcpServerIds"),
-            suggestion_prompts=meta_data.get("suggestion_prompts"),
-            tags=meta_data.get("tags", [])
-        )
-        
-        info = ModelInfo(
-            id=info_data["id"],
-            user_id=info_data["user_id"],
-            base_model_id=info_data.get("base_model_id"),
-            name=info_data["name"],
-            params=params,
-            meta=meta,
-            access_control=info_data.get("access_control"),
-            is_active=info_data.get("is_active", True),
-            updated_at=info_data.get("updated_at", 0),
-            created_at=info_data.get("created_at", 0)
-        )
-        
         return cls(
             id=data["id"],
             name=data["name"],
             owned_by=data["owned_by"],
             openai=data["openai"],
             urlIdx=data["urlIdx"],
-            info=info,
+            info=_Raw(data["info"]),
             actions=data.get("actions", []),
             tags=data.get("tags", [])
         )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the API response shape read by from_dict.
+        
+        Returns:
+            Dict[str, Any]: Model dictionary.
+        """
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Chat message."""
     
@@ -141,7 +268,7 @@ class Message:
     models: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatHistory:
     """Chat history structure."""
     
@@ -149,7 +276,7 @@ class ChatHistory:
     currentId: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPFeature:
     """MCP (Model Control Protocol) feature."""
     
@@ -158,9 +285,31 @@ class MCPFeature:
     status: str
 
 
-@dataclass
+@_lazy_fields(
+    messages=lambda chat, data: [
+        Message(
+            id=msg_data["id"],
+            parentId=msg_data.get("parentId"),
+            childrenIds=msg_data.get("childrenIds", []),
+            role=msg_data["role"],
+            content=msg_data["content"],
+            timestamp=msg_data["timestamp"],
+            models=msg_data.get("models", [])
+        )
+        for msg_data in data
+    ],
+    history=lambda chat, data: ChatHistory(
+        messages={message.id: message for message in chat.messages},
+        currentId=data.get("currentId")
+    )
+)
+@dataclass(slots=True)
 class Chat:
-    """Z.AI Chat representation."""
+    """Z.AI Chat representation.
+    
+    When parsed with from_dict, messages and history are built on first
+    access; history shares the Message objects of messages.
+    """
     
     id: str = ""
     title: str = "New Chat"
@@ -177,7 +326,7 @@ class Chat:
     
     def add_message(self, content: str, role: str = "user", models: List[str] = None) -> Message:
         """
-        Add a message to the chat.
+        Add a message to the chat, as a reply to the current one.
         
         Args:
             content (str): Message content.
@@ -189,24 +338,62 @@ class Chat:
         """
         message_id = str(uuid.uuid4())
         models = models or self.models
+        parent = self.history.messages.get(self.history.currentId)
         
         message = Message(
             id=message_id,
+            parentId=parent.id if parent else None,
             role=role,
             content=content,
             models=models
         )
         
+        if parent:
+            parent.childrenIds.append(message_id)
         self.messages.append(message)
         self.history.messages[message_id] = message
         self.history.currentId = message_id
         
         return message
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Chat":
+        """
+        Create Chat from the chat object of an API response.
+        
+        Args:
+            data (Dict[str, Any]): Chat dictionary.
+        
+        Returns:
+            Chat: Instance of Chat, with messages and history still raw.
+        """
+        return cls(
+            id=data.get("id", ""),
+            title=data.get("title", "New Chat"),
+            models=data.get("models", []),
+            params=data.get("params", {}),
+            history=_Raw(data.get("history", {})),
+            messages=_Raw(data.get("messages", [])),
+            tags=data.get("tags", []),
+            flags=data.get("flags", []),
+            features=[
+                MCPFeature(type=feat_data["type"], server=feat_data["server"], status=feat_data["status"])
+                for feat_data in data.get("features", [])
+            ],
+            mcp_servers=data.get("mcp_servers", []),
+            enable_thinking=data.get("enable_thinking", True),
+            timestamp=data.get("timestamp", int(time.time() * 1000))
+        )
 
 
-@dataclass
+@_lazy_fields(chat=lambda response, data: Chat.from_dict(data))
+@dataclass(slots=True)
 class ChatResponse:
-    """Response from chat creation."""
+    """Response from chat creation.
+    
+    chat is built on first access when parsed with from_dict, so reading
+    only the id does not build the history.
+    """
     
     id: str
     user_id: str
@@ -229,59 +416,13 @@ class ChatResponse:
             data (Dict[str, Any]): API response dictionary.
         
         Returns:
-            ChatResponse: Instance of ChatResponse.
+            ChatResponse: Instance of ChatResponse, with chat still raw.
         """
-        chat_data = data["chat"]
-        
-        messages = []
-        history_messages = {}
-        
-        for msg_data in chat_data.get("messages", []):
-            message = Message(
-                id=msg_data["id"],
-                parentId=msg_data.get("parentId"),
-                childrenIds=msg_data.get("childrenIds", []),
-                role=msg_data["role"],
-                content=msg_data["content"],
-                timestamp=msg_data["timestamp"],
-                models=msg_data.get("models", [])
-            )
-            messages.append(message)
-            history_messages[message.id] = message
-        
-        features = []
-        for feat_data in chat_data.get("features", []):
-            features.append(MCPFeature(
-                type=feat_data["type"],
-                server=feat_data["server"],
-                status=feat_data["status"]
-            ))
-        
-        history = ChatHistory(
-            messages=history_messages,
-            currentId=chat_data.get("history", {}).get("currentId")
-        )
-        
-        chat = Chat(
-            id=chat_data.get("id", ""),
-            title=chat_data.get("title", "New Chat"),
-            models=chat_data.get("models", []),
-            params=chat_data.get("params", {}),
-            history=history,
-            messages=messages,
-            tags=chat_data.get("tags", []),
-            flags=chat_data.get("flags", []),
-            features=features,
-            mcp_servers=chat_data.get("mcp_servers", []),
-            enable_thinking=chat_data.get("enable_thinking", True),
-            timestamp=chat_data.get("timestamp", int(time.time() * 1000))
-        )
-        
         return cls(
             id=data["id"],
             user_id=data["user_id"],
             title=data["title"],
-            chat=chat,
+            chat=_Raw(data["chat"]),
             updated_at=data["updated_at"],
             created_at=data["created_at"],
             share_id=data.get("share_id"),
@@ -292,7 +433,7 @@ class ChatResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamingChunk:
     """Streaming response chunk."""
     
@@ -305,9 +446,10 @@ class StreamingChunk:
     edit_content: Optional[str] = None
     role: Optional[str] = None
     message_id: Optional[str] = None
+    event_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCompletionResponse:
     """Complete chat completion response."""
     
@@ -1,11 +1,27 @@
 """Z.AI Operations Module."""
 
+from .batch import BatchResult, iter_batch
 from .chat import ChatOperations
+from .chat_pool import ChatPool
+from .conversation import Conversation
 from .model import ModelOperations
 from .streaming import StreamingOperations
+from .async_chat import AsyncChatOperations
+from .async_model import AsyncModelOperations
+from .async_streaming import AsyncStreamingOperations
+from .catalog import ModelCatalog, get_catalog_stats
 
 __all__ = [
+    "BatchResult",
     "ChatOperations",
+    "ChatPool",
+    "Conversation",
     "ModelOperations",
-    "StreamingOperations"
+    "StreamingOperations",
+    "AsyncChatOperations",
+    "AsyncModelOperations",
+    "AsyncStreamingOperations",
+    "iter_batch",
+    "ModelCatalog",
+    "get_catalog_stats"
 ]
@@ -0,0 +1,216 @@
+"""Async chat operations for Z.AI API."""
+
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from ..core.exceptions import ZAIError
+from ..models import ChatCompletionResponse, ChatResponse, MCPFeature
+from ..utils.json_codec import loads
+from ..utils.sse_parser import aiter_sse_data
+from .async_streaming import AsyncStreamingOperations
+from .chat import FE_VERSION, ChatOperations
+
+
+class AsyncChatOperations(ChatOperations):
+    """Handles chat-related operations on the async client."""
+    
+    def __init__(self, http_client, model_ops, auth_data: Optional[Dict] = None):
+        """
+        Initialize async chat operations.
+        
+        Args:
+            http_client (AsyncHTTPClient): Async HTTP client instance.
+            model_ops (AsyncModelOperations): Async model operations instance.
+            auth_data (Optional[Dict]): Authentication data.
+        """
+        super().__init__(http_client, model_ops, auth_data)
+        self.streaming_ops = AsyncStreamingOperations(http_client)
+    
+    async def create_chat(
+        self,
+        title: str = "New Chat",
+        models: List[str] = None,
+        initial_message: Optional[str] = None,
+        enable_thinking: bool = True,
+        features: List[MCPFeature] = None
+    ) -> ChatResponse:
+        """
+        Create a new chat.
+        
+        Args:
+            title (str): Chat title.
+            models (List[str]): List of model IDs to use.
+            initial_message (Optional[str]): Optional initial message.
+            enable_thinking (bool): Enable thinking mode.
+            features (List[MCPFeature]): MCP features configuration.
+        
+        Returns:
+            ChatResponse: ChatResponse object.
+        """
+        chat = self._new_chat(title, models, initial_message, enable_thinking, features)
+        payload = self._build_chat_payload(chat)
+        response = await self.http_client.make_request("POST", "/api/v1/chats/new", payload)
+        
+        return ChatResponse.from_dict(loads(response.content))
+    
+    async def complete_chat(
+        self,
+        chat_id: str,
+        messages: List[Dict[str, str]],
+        model: str = "0727-360B-API",
+        enable_thinking: bool = True
+    ) -> ChatCompletionResponse:
+        """
+        Complete chat and return full response.
+        
+        Args:
+            chat_id (str): Chat ID.
+            messages (List[Dict[str, str]]): List of messages.
+            model (str): Model ID.
+            enable_thinking (bool): Enable thinking mode.
+        
+        Returns:
+            ChatCompletionResponse: ChatCompletionResponse with complete content.
+        """
+        state = self._new_chunk_state()
+        
+        async for chunk in self.streaming_ops.stream_completion(
+            chat_id=chat_id,
+            messages=messages,
+            model=model,
+            enable_thinking=enable_thinking,
+            model_ops=self.model_ops
+        ):
+            self._consume_chunk(chunk, state)
+        
+        return self._build_chunk_result(state)
+    
+    async def simple_chat(
+        self,
+        message: str,
+        model: str = "glm-4.5v",
+        enable_thinking: bool = True,
+        chat_title: str = "Simple Chat",
+        temperature: float = None,
+        top_p: float = None,
+        max_tokens: int = None
+    ) -> ChatCompletionResponse:
+        """
+        Simple one-shot chat completion using the actual Z.AI API.
+        
+        Args:
+            message (str): User message.
+            model (str): Model ID (e.g., 'glm-4.5v', '0727-360B-API').
+            enable_thinking (bool): Enable thinking mode.
+            chat_title (str): Chat title.
+            temperature (float): Controls randomness (0.0-2.0, default varies by model).
+            top_p (float): Controls diversity (0.0-1.0, default varies by model).
+            max_tokens (int): Maximum response length (default varies by model).
+        
+        Returns:
+            ChatCompletionResponse: ChatCompletionResponse with AI response.
+        """
+        message_id = str(uuid.uuid4())
+        timestamp = int(time.time())
+        
+        chat_payload = self._build_simple_chat_payload(
+            message_id, message, model, chat_title,
+            enable_thinking, timestamp
+        )
+        
+        try:
+            response = await self.http_client.make_request(
+                "POST",
+                "/api/v1/chats/new",
+                chat_payload,
+                headers={"x-fe-version": FE_VERSION}
+            )
+            actual_chat_id = loads(response.content).get("id")
+            
+            if not actual_chat_id:
+                raise ZAIError("Failed to create chat - no chat ID returned")
+            
+            return await self._complete_simple_chat(
+                actual_chat_id, message, model, enable_thinking,
+                temperature, top_p, max_tokens
+            )
+        
+        except Exception as e:
+            raise ZAIError(f"Simple chat failed: {e}")
+    
+    async def _complete_simple_chat(
+        self,
+        chat_id: str,
+        message: str,
+        model: str,
+        enable_thinking: bool,
+        temperature: float,
+        top_p: float,
+        max_tokens: int
+    ) -> ChatCompletionResponse:
+        """
+        Complete simple chat streaming.
+        
+        The chat referer is sent as a per-request header so concurrent
+        tasks sharing one client never see each other's chat.
+        
+        Args:
+            chat_id (str): Actual chat ID.
+            message (str): User message.
+            model (str): Model ID.
+            enable_thinking (bool): Enable thinking mode.
+            temperature (float): Temperature parameter.
+            top_p (float): Top-p parameter.
+            max_tokens (int): Max tokens parameter.
+        
+        Returns:
+            ChatCompletionResponse: Completed chat response.
+        """
+        completion_payload = self._build_completion_payload(
+            chat_id, message, model, enable_thinking,
+            temperature, top_p, max_tokens
+        )
+        
+        response = await self.http_client.make_request(
+            "POST",
+            "/api/chat/completions",
+            completion_payload,
+            stream=True,
+            headers={
+                "x-fe-version": FE_VERSION,
+                "referer": f"{self.http_client.base_url}/c/{chat_id}"
+            }
+        )
+        
+        try:
+            return await self._parse_stream_response(response)
+        finally:
+            await response.aclose()
+    
+    async def _parse_stream_response(self, stream_response) -> ChatCompletionResponse:
+        """
+        Parse streaming response.
+        
+        Args:
+            stream_response (httpx.Response): Open streaming response.
+        
+        Returns:
+            ChatCompletionResponse: Parsed completion response.
+        """
+        state = self._new_stream_state()
+        
+        try:
+            event_count = 0
+            async for payload in aiter_sse_data(stream_response):
+                event_count += 1
+                if self.verbose and event_count <= 5:
+                    print(f"[DEBUG] Event {event_count}: {payload[:200]}")
+                
+                if self._consume_stream_data(payload, state):
+                    break
+        
+        except Exception as stream_error:
+            self._handle_stream_error(stream_error, state)
+        
+        return self._build_stream_result(state)
\ No newline at end of file
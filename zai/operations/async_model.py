@@ -0,0 +1,84 @@
+"""Async model operations for Z.AI API."""
+
+import asyncio
+from typing import List, Optional
+
+from ..models import Model
+from .catalog import EXPIRED, FRESH
+from .model import ModelOperations
+
+
+class AsyncModelOperations(ModelOperations):
+    """Handles model-related operations on the async client."""
+    
+    _refresh_lock: Optional[asyncio.Lock] = None
+    _refresh_task: Optional[asyncio.Task] = None
+    
+    async def get_models(self) -> List[Model]:
+        """
+        Get available models.
+        
+        Returns:
+            List[Model]: List of available Model objects.
+        """
+        await self._load_catalog()
+        return list(self.catalog.models)
+    
+    async def get_model_by_id(self, model_id: str) -> Optional[Model]:
+        """
+        Get a specific model by ID.
+        
+        Args:
+            model_id (str): The model ID to search for.
+        
+        Returns:
+            Optional[Model]: Model object if found, None otherwise.
+        """
+        await self._load_catalog()
+        return self.catalog.index.get(model_id)
+    
+    async def refresh_models(self):
+        """Revalidate the model catalog with the server."""
+        headers = {"if-none-match": self.catalog.etag} if self.catalog.etag else None
+        response = await self.http_client.make_request("GET", "/api/v1/models", headers=headers)
+        self._store_models(response)
+    
+    async def _load_catalog(self):
+        """
+        Make sure the catalog can be served.
+        
+        Like the sync version, but a stale catalog is revalidated by a
+        task, and coroutines wait on an asyncio lock for a blocking refresh.
+        """
+        catalog = self.catalog
+        state = catalog.state()
+        if state == FRESH:
+            catalog.record("hits")
+            return
+        if state != EXPIRED:
+            catalog.record("stale_hits")
+            if catalog.begin_refresh():
+                self._refresh_task = asyncio.ensure_future(self._refresh_in_background())
+            return
+        
+        catalog.record("misses")
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if catalog.state() != EXPIRED:
+                return
+            try:
+                await self.refresh_models()
+            except Exception:
+                catalog.record("refresh_errors")
+                if catalog.fetched_at is None:
+                    raise
+    
+    async def _refresh_in_background(self):
+        """Revalidate a stale catalog, keeping it on failure."""
+        try:
+            await self.refresh_models()
+        except Exception:
+            self.catalog.record("refresh_errors")
+        finally:
+            self.catalog.end_refresh()
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""Async streaming operations for Z.AI API."""
+
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from ..models import StreamingChunk
+from ..utils.sse_parser import SSEDecoder
+from .streaming import StreamingOperations
+
+
+class AsyncStreamingOperations(StreamingOperations):
+    """Handles streaming operations on the async client."""
+    
+    async def stream_completion(
+        self,
+        chat_id: str,
+        messages: List[Dict[str, str]],
+        model: str = "0727-360B-API",
+        enable_thinking: bool = True,
+        features: Optional[Dict[str, Any]] = None,
+        variables: Optional[Dict[str, str]] = None,
+        model_ops: Optional[Any] = None
+    ) -> AsyncGenerator[StreamingChunk, None]:
+        """
+        Stream chat completion.
+        
+        Args:
+            chat_id (str): Chat ID.
+            messages (List[Dict[str, str]]): List of messages in OpenAI format.
+            model (str): Model ID to use.
+            enable_thinking (bool): Enable thinking phase.
+            features (Optional[Dict[str, Any]]): Features configuration.
+            variables (Optional[Dict[str, str]]): Template variables.
+            model_ops (Optional[Any]): Async model operations instance.
+        
+        Yields:
+            StreamingChunk: StreamingChunk objects.
+        """
+        if features is None:
+            features = self._get_default_features(enable_thinking)
+        
+        if variables is None:
+            variables = self._get_default_variables()
+        
+        model_item = await self._get_model_item(model, model_ops)
+        payload = self._build_payload(chat_id, messages, model, features, variables, model_item)
+        
+        response = await self.http_client.make_request(
+            "POST",
+            "/api/chat/completions",
+            payload,
+            stream=True
+        )
+        
+        try:
+            async for payload in SSEDecoder().aiter_data(self.http_client.aiter_stream(response)):
+                data = self.sse_parser.parse_data(payload)
+                if data:
+                    chunk = self._create_streaming_chunk(data)
+                    yield chunk
+                    if chunk.done:
+                        break
+        finally:
+            await response.aclose()
+    
+    async def _get_model_item(self, model: str, model_ops: Optional[Any]) -> Dict:
+        """
+        Get model item configuration.
+        
+        Args:
+            model (str): Model ID.
+            model_ops (Optional[Any]): Async model operations instance.
+        
+        Returns:
+            Dict: Model item configuration.
+        """
+        if model_ops:
+            return self._model_item_from_model(model, await model_ops.get_model_by_id(model))
+        
+        return {"id": model, "name": model}
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""Batches of one-shot chats run on a bounded worker pool."""
+
+import itertools
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..models import ChatCompletionResponse
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one prompt of a batch."""
+    
+    index: int
+    prompt: str
+    response: Optional[ChatCompletionResponse] = None
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        """
+        Check whether the prompt was answered.
+        
+        Returns:
+            bool: True if there is a response, False if the chat failed.
+        """
+        return self.error is None
+
+
+def iter_batch(
+    chat: Callable[[str], ChatCompletionResponse],
+    prompts: Iterable[str],
+    max_concurrency: int = 8
+) -> Iterator[BatchResult]:
+    """
+    Run chat over prompts with at most max_concurrency in flight.
+    
+    Prompts are taken from the iterable only as workers free up, so a
+    long or lazy iterable is never queued all at once. A failed chat
+    yields a result with its error instead of ending the batch. Closing
+    the iterator early cancels the prompts not started yet.
+    
+    Args:
+        chat (Callable[[str], ChatCompletionResponse]): Answers one prompt.
+        prompts (Iterable[str]): Prompts to answer.
+        max_concurrency (int): Most chats running at the same time.
+    
+    Yields:
+        BatchResult: One result per prompt, in completion order.
+    """
+    numbered = enumerate(prompts)
+    pending: Dict[Future, Tuple[int, str]] = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="zai-batch")
+    
+    def submit(count: int):
+        for index, prompt in itertools.islice(numbered, count):
+            pending[executor.submit(chat, prompt)] = (index, prompt)
+    
+    try:
+        submit(max(1, max_concurrency))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            submit(len(done))
+            for future in done:
+                index, prompt = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    yield BatchResult(index, prompt, response=future.result())
+                else:
+                    yield BatchResult(index, prompt, error=error)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
\ No newline at end of file
@@ -0,0 +1,247 @@
+"""Cached model catalog shared by the clients of one Z.AI host."""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from ..models import Model
+from ..utils.json_codec import dumps, loads
+
+
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "model_catalog.json")
+
+
+def load_snapshot(path: Optional[str] = None) -> Dict[str, List[Model]]:
+    """
+    Load the model catalog snapshot, if one was generated.
+    
+    Args:
+        path (Optional[str]): Snapshot file (defaults to ZAI_MODEL_SNAPSHOT or zai/data/model_catalog.json).
+    
+    Returns:
+        Dict[str, List[Model]]: Models keyed by the host they were taken from;
+        empty if the file is missing, unreadable or of another version.
+    """
+    path = path or os.environ.get("ZAI_MODEL_SNAPSHOT") or SNAPSHOT_PATH
+    try:
+        with open(path, "rb") as f:
+            snapshot = loads(f.read())
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return {}
+        return {snapshot["source"]: [Model.from_dict(model) for model in snapshot["models"]]}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def write_snapshot(models: List[Model], source: str, path: Optional[str] = None):
+    """
+    Write a model catalog snapshot.
+    
+    Only write models fetched from the live /api/v1/models: a snapshot is
+    served as the server catalog until the first refresh.
+    
+    Args:
+        models (List[Model]): Models to store.
+        source (str): Host the models were fetched from, e.g. "https://chat.z.ai".
+        path (Optional[str]): Snapshot file (defaults to zai/data/model_catalog.json).
+    """
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "source": source,
+        "generated_at": int(time.time()),
+        "models": [model.to_dict() for model in models]
+    }
+    path = path or SNAPSHOT_PATH
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(dumps(snapshot))
+
+
+@dataclass
+class CatalogStats:
+    """Model catalog cache counters."""
+    
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    not_modified: int = 0
+    refresh_errors: int = 0
+
+
+class ModelCatalog:
+    """The /api/v1/models list, indexed by model id.
+    
+    The list is served from memory for ``ttl`` seconds. For another
+    ``stale_ttl`` seconds it is still served while one caller revalidates
+    it in the background; after that, callers wait for a refresh. Only
+    one refresh runs at a time, and it sends the last ETag so an
+    unchanged catalog costs a 304.
+    """
+    
+    def __init__(self, ttl: Optional[float] = None, stale_ttl: Optional[float] = None):
+        """
+        Initialize model catalog.
+        
+        Args:
+            ttl (Optional[float]): Seconds the list is fresh (defaults to ZAI_MODEL_CATALOG_TTL or 300).
+            stale_ttl (Optional[float]): Seconds a stale list is served while revalidating (defaults to ZAI_MODEL_CATALOG_STALE or 3600).
+        """
+        self.ttl = ttl if ttl is not None else float(os.environ.get("ZAI_MODEL_CATALOG_TTL", 300))
+        self.stale_ttl = stale_ttl if stale_ttl is not None else float(os.environ.get("ZAI_MODEL_CATALOG_STALE", 3600))
+        self.models: List[Model] = []
+        self.index: Dict[str, Model] = {}
+        self.etag: Optional[str] = None
+        self.fetched_at: Optional[float] = None
+        self.source: Optional[str] = None
+        self.stats = CatalogStats()
+        self.refresh_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._refreshing = False
+    
+    def state(self) -> str:
+        """
+        Get how current the cached list is.
+        
+        Returns:
+            str: FRESH, STALE, or EXPIRED (also when nothing was fetched yet).
+        """
+        if self.fetched_at is None:
+            return EXPIRED
+        age = time.monotonic() - self.fetched_at
+        if age < self.ttl:
+            return FRESH
+        if age < self.ttl + self.stale_ttl:
+            return STALE
+        return EXPIRED
+    
+    def record(self, event: str):
+        """
+        Increment a counter.
+        
+        Args:
+            event (str): One of the CatalogStats fields.
+        """
+        with self._lock:
+            setattr(self.stats, event, getattr(self.stats, event) + 1)
+    
+    def begin_refresh(self) -> bool:
+        """
+        Claim the background revalidation.
+        
+        Returns:
+            bool: True if the caller should refresh; False if one is running.
+        """
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+            return True
+    
+    def end_refresh(self):
+        """Release the background revalidation claim."""
+        with self._lock:
+            self._refreshing = False
+    
+    def update(self, models: List[Model], etag: Optional[str] = None):
+        """
+        Replace the cached list after a full response.
+        
+        Args:
+            models (List[Model]): Parsed models.
+            etag (Optional[str]): ETag of the response, if any.
+        """
+        index = {model.id: model for model in models}
+        with self._lock:
+            self.models = models
+            self.index = index
+            self.etag = etag
+            self.fetched_at = time.monotonic()
+            self.source = "server"
+            self.stats.refreshes += 1
+    
+    def seed(self, models: List[Model]):
+        """
+        Serve models from a snapshot until the first refresh.
+        
+        The seeded list counts as stale, so the first lookup is answered
+        from it at once while the real catalog is fetched in the background.
+        
+        Args:
+            models (List[Model]): Snapshot models.
+        """
+        with self._lock:
+            self.models = models
+            self.index = {model.id: model for model in models}
+            self.fetched_at = time.monotonic() - self.ttl
+            self.source = "snapshot"
+    
+    def touch(self):
+        """Mark the cached list fresh again after a 304 response."""
+        with self._lock:
+            self.fetched_at = time.monotonic()
+            self.stats.not_modified += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot the counters.
+        
+        Returns:
+            Dict[str, Any]: Counters, hit rate, model count and age.
+        """
+        with self._lock:
+            stats = dict(self.stats.__dict__)
+            lookups = self.stats.hits + self.stats.stale_hits + self.stats.misses
+            stats["hit_rate"] = round((self.stats.hits + self.stats.stale_hits) / lookups, 4) if lookups else 0.0
+            stats["models"] = len(self.models)
+            stats["source"] = self.source
+            stats["age"] = round(time.monotonic() - self.fetched_at, 3) if self.fetched_at is not None else None
+            return stats
+
+
+_catalogs: Dict[str, ModelCatalog] = {}
+_catalogs_lock = threading.Lock()
+_snapshot = load_snapshot()
+
+
+def get_model_catalog(url: str) -> ModelCatalog:
+    """
+    Get the process-wide model catalog for a Z.AI host.
+    
+    A new catalog is seeded from the snapshot for that host, if there is one.
+    
+    Args:
+        url (str): Any URL on the host.
+    
+    Returns:
+        ModelCatalog: Shared catalog.
+    """
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = ModelCatalog()
+            if _snapshot.get(key):
+                catalog.seed(_snapshot[key])
+        return catalog
+
+
+def get_catalog_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Snapshot the counters of every model catalog.
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: Counters keyed by host.
+    """
+    with _catalogs_lock:
+        catalogs = dict(_catalogs)
+    return {key: catalog.to_dict() for key, catalog in catalogs.items()}
\ No newline at end of file
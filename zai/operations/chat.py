@@ -2,15 +2,23 @@
 
 import time
 import uuid
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
-from ..core.exceptions import ZAIError
+from ..core.deadline import Deadline
+from ..core.exceptions import DeadlineExceeded, ZAIError
 from ..core.http_client import HTTPClient
 from ..models import Chat, ChatCompletionResponse, ChatResponse, MCPFeature
+from ..utils.json_codec import loads
+from ..utils.sse_parser import SSEDecoder
+from .chat_pool import ChatPool
 from .model import ModelOperations
+from .payloads import DEFAULT_MCP_SERVERS, CompletionTemplates, render_chat, render_simple_chat, render_variables
 from .streaming import StreamingOperations
 
 
+FE_VERSION = "prod-fe-1.0.70"
+
+
 class ChatOperations:
     """Handles chat-related operations."""
     
@@ -33,6 +41,9 @@ class ChatOperations:
         self.auth_data = auth_data
         self.verbose = http_client.verbose
         self.streaming_ops = StreamingOperations(http_client)
+        self.completion_templates = CompletionTemplates(model_ops)
+        self.chat_pool: Optional[ChatPool] = None
+        self.hedge_completions = False
     
     def create_chat(
         self,
@@ -40,7 +51,8 @@ class ChatOperations:
         models: List[str] = None,
         initial_message: Optional[str] = None,
         enable_thinking: bool = True,
-        features: List[MCPFeature] = None
+        features: List[MCPFeature] = None,
+        deadline: Union[Deadline, float, None] = None
     ) -> ChatResponse:
         """
         Create a new chat.
@@ -51,16 +63,45 @@ class ChatOperations:
             initial_message (Optional[str]): Optional initial message.
             enable_thinking (bool): Enable thinking mode.
             features (List[MCPFeature]): MCP features configuration.
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the request.
         
         Returns:
             ChatResponse: ChatResponse object.
         """
+        chat = self._new_chat(title, models, initial_message, enable_thinking, features)
+        payload = self._build_chat_payload(chat)
+        response = self.http_client.make_request(
+            "POST",
+            "/api/v1/chats/new",
+            payload,
+            deadline=Deadline.coerce(deadline)
+        )
+        
+        return ChatResponse.from_dict(loads(response.content))
+    
+    def _new_chat(
+        self,
+        title: str,
+        models: Optional[List[str]],
+        initial_message: Optional[str],
+        enable_thinking: bool,
+        features: Optional[List[MCPFeature]]
+    ) -> Chat:
+        """
+        Build a local Chat object for chat creation.
+        
+        Args:
+            title (str): Chat title.
+            models (Optional[List[str]]): List of model IDs to use.
+            initial_message (Optional[str]): Optional initial message.
+            enable_thinking (bool): Enable thinking mode.
+            features (Optional[List[MCPFeature]]): MCP features configuration.
+        
+        Returns:
+            Chat: Chat object.
+        """
         models = models or ["0727-360B-API"]
-        features = features or [
-            MCPFeature("mcp", "vibe-coding", "hidden"),
-            MCPFeature("mcp", "ppt-maker", "hidden"),
-            MCPFeature("mcp", "image-search", "hidden")
-        ]
+        features = features or [MCPFeature("mcp", server, "hidden") for server in DEFAULT_MCP_SERVERS]
         
         chat = Chat(
             title=title,
@@ -72,12 +113,9 @@ class ChatOperations:
         if initial_message:
             chat.add_message(initial_message, "user", models)
         
-        payload = self._build_chat_payload(chat)
-        response = self.http_client.make_request("POST", "/api/v1/chats/new", payload)
-        
-        return ChatResponse.from_dict(response.json())
+        return chat
     
-    def _build_chat_payload(self, chat: Chat) -> Dict:
+    def _build_chat_payload(self, chat: Chat) -> bytes:
         """
         Build chat creation payload.
         
@@ -85,60 +123,64 @@ class ChatOperations:
             chat (Chat): Chat object.
         
         Returns:
-            Dict: Chat creation payload.
+            bytes: Encoded chat creation payload.
         """
-        return {
-            "chat": {
-                "id": chat.id,
-                "title": chat.title,
-                "models": chat.models,
-                "params": chat.params,
-                "history": {
-                    "messages": {
-                        msg.id: {
-                            "id": msg.id,
-                            "parentId": msg.parentId,
-                            "childrenIds": msg.childrenIds,
-                            "role": msg.role,
-                            "content": msg.content,
-                            "timestamp": msg.timestamp,
-                            "models": msg.models
-                        } for msg in chat.messages
-                    },
-                    "currentId": chat.history.currentId
-                },
-                "messages": [
-                    {
-                        "id": msg.id,
-                        "parentId": msg.parentId,
-                        "childrenIds": msg.childrenIds,
-                        "role": msg.role,
-                        "content": msg.content,
-                        "timestamp": msg.timestamp,
-                        "models": msg.models
-                    } for msg in chat.messages
-                ],
-                "tags": chat.tags,
-                "flags": chat.flags,
-                "features": [
-                    {
-                        "type": feat.type,
-                        "server": feat.server,
-                        "status": feat.status
-                    } for feat in chat.features
-                ],
-                "mcp_servers": chat.mcp_servers,
-                "enable_thinking": chat.enable_thinking,
-                "timestamp": chat.timestamp
-            }
-        }
+        return render_chat(chat)
+    
+    def start_chat_pool(self, size: int, ttl: Optional[float] = None) -> ChatPool:
+        """
+        Let simple_chat take chats created ahead of time.
+        
+        The pool for a model, title and thinking mode fills in the
+        background after their first simple_chat call. Pooled chats are
+        created empty, so their server history lacks the user message
+        that an inline chat is created with.
+        
+        Args:
+            size (int): Chats kept ready per model, title and thinking mode.
+            ttl (Optional[float]): Seconds a ready chat may be used (defaults to ZAI_CHAT_POOL_TTL or 300).
+        
+        Returns:
+            ChatPool: The running pool.
+        """
+        self.chat_pool = ChatPool(self._create_pooled_chat, size, ttl)
+        return self.chat_pool
+    
+    def _create_pooled_chat(self, model: str, title: str, enable_thinking: bool) -> str:
+        """
+        Create an empty chat for the chat pool.
+        
+        The payload has the shape of a one-shot chat, without the message.
+        
+        Args:
+            model (str): Model ID.
+            title (str): Chat title.
+            enable_thinking (bool): Enable thinking mode.
+        
+        Returns:
+            str: Chat ID.
+        
+        Raises:
+            ZAIError: If no chat ID is returned.
+        """
+        response = self.http_client.make_request(
+            "POST",
+            "/api/v1/chats/new",
+            render_simple_chat(None, None, model, title, enable_thinking, int(time.time())),
+            headers={"x-fe-version": FE_VERSION}
+        )
+        chat_id = loads(response.content).get("id")
+        if not chat_id:
+            raise ZAIError("Failed to create chat - no chat ID returned")
+        return chat_id
     
     def complete_chat(
         self,
         chat_id: str,
         messages: List[Dict[str, str]],
         model: str = "0727-360B-API",
-        enable_thinking: bool = True
+        enable_thinking: bool = True,
+        deadline: Union[Deadline, float, None] = None
     ) -> ChatCompletionResponse:
         """
         Complete chat and return full response.
@@ -148,45 +190,80 @@ class ChatOperations:
             messages (List[Dict[str, str]]): List of messages.
             model (str): Model ID.
             enable_thinking (bool): Enable thinking mode.
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole completion.
         
         Returns:
             ChatCompletionResponse: ChatCompletionResponse with complete content.
         """
-        content = ""
-        thinking = ""
-        usage = None
-        message_id = None
-        current_phase = None
+        state = self._new_chunk_state()
         
         for chunk in self.streaming_ops.stream_completion(
             chat_id=chat_id,
             messages=messages,
             model=model,
             enable_thinking=enable_thinking,
-            model_ops=self.model_ops
+            model_ops=self.model_ops,
+            deadline=deadline
         ):
-            if chunk.phase == "thinking":
-                thinking += chunk.delta_content
-                current_phase = "thinking"
-            elif chunk.phase == "answer":
-                content += chunk.delta_content
-                current_phase = "answer"
-            elif chunk.phase == "other" and chunk.edit_content:
-                if current_phase == "thinking":
-                    thinking = chunk.edit_content
-                elif current_phase == "answer":
-                    content += chunk.edit_content
-            
-            if chunk.usage:
-                usage = chunk.usage
-            if chunk.message_id:
-                message_id = chunk.message_id
+            self._consume_chunk(chunk, state)
+        
+        return self._build_chunk_result(state)
+    
+    def _new_chunk_state(self) -> Dict:
+        """
+        Create the accumulator used by complete_chat.
+        
+        Returns:
+            Dict: Empty chunk state.
+        """
+        return {
+            "content": "",
+            "thinking": "",
+            "usage": None,
+            "message_id": None,
+            "current_phase": None
+        }
+    
+    def _consume_chunk(self, chunk, state: Dict):
+        """
+        Apply one streaming chunk to the complete_chat accumulator.
+        
+        Args:
+            chunk (StreamingChunk): Streaming chunk.
+            state (Dict): Chunk state from _new_chunk_state.
+        """
+        if chunk.phase == "thinking":
+            state["thinking"] += chunk.delta_content
+            state["current_phase"] = "thinking"
+        elif chunk.phase == "answer":
+            state["content"] += chunk.delta_content
+            state["current_phase"] = "answer"
+        elif chunk.phase == "other" and chunk.edit_content:
+            if state["current_phase"] == "thinking":
+                state["thinking"] = chunk.edit_content
+            elif state["current_phase"] == "answer":
+                state["content"] += chunk.edit_content
+        
+        if chunk.usage:
+            state["usage"] = chunk.usage
+        if chunk.message_id:
+            state["message_id"] = chunk.message_id
+    
+    def _build_chunk_result(self, state: Dict) -> ChatCompletionResponse:
+        """
+        Build the final response from accumulated chunks.
+        
+        Args:
+            state (Dict): Chunk state.
         
+        Returns:
+            ChatCompletionResponse: ChatCompletionResponse with complete content.
+        """
         return ChatCompletionResponse(
-            content=content.strip(),
-            thinking=thinking.strip(),
-            usage=usage or {},
-            message_id=message_id or "",
+            content=state["content"].strip(),
+            thinking=state["thinking"].strip(),
+            usage=state["usage"] or {},
+            message_id=state["message_id"] or "",
             done=True
         )
     
@@ -198,11 +275,24 @@ class ChatOperations:
         chat_title: str = "Simple Chat",
         temperature: float = None,
         top_p: float = None,
-        max_tokens: int = None
+        max_tokens: int = None,
+        deadline: Union[Deadline, float, None] = None
     ) -> ChatCompletionResponse:
         """
         Simple one-shot chat completion using the actual Z.AI API.
         
+        The deadline covers chat creation and the completion stream
+        together: each request gets the time that is left, and the stream
+        is cut with DeadlineExceeded once it passes. The completion request
+        is hedged only with hedge_completions on and a hedger set: a hedge
+        makes the upstream generate the answer twice and can leave a
+        duplicate assistant message in the chat.
+        
+        With a chat pool started, a ready chat is taken from it and only
+        created here when the pool is empty. A pooled chat was created
+        empty with the same model, title and thinking mode, so the message
+        reaches the server in the completion request only.
+        
         Args:
             message (str): User message.
             model (str): Model ID (e.g., 'glm-4.5v', '0727-360B-API').
@@ -211,59 +301,105 @@ class ChatOperations:
             temperature (float): Controls randomness (0.0-2.0, default varies by model).
             top_p (float): Controls diversity (0.0-1.0, default varies by model).
             max_tokens (int): Maximum response length (default varies by model).
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole call.
         
         Returns:
             ChatCompletionResponse: ChatCompletionResponse with AI response.
         """
-        chat_id = str(uuid.uuid4())
-        message_id = str(uuid.uuid4())
-        timestamp = int(time.time())
-        
-        chat_payload = self._build_simple_chat_payload(
-            chat_id, message_id, message, model, chat_title, 
-            enable_thinking, timestamp
-        )
-        
-        self.http_client.update_headers({"x-fe-version": "prod-fe-1.0.70"})
+        deadline = Deadline.coerce(deadline)
         
         try:
-            response = self.http_client.make_request("POST", "/api/v1/chats/new", chat_payload)
-            chat_data = response.json()
-            actual_chat_id = chat_data.get("id")
-            
-            if not actual_chat_id:
-                raise ZAIError("Failed to create chat - no chat ID returned")
-            
-            current_message_id = None
-            if "chat" in chat_data and "history" in chat_data["chat"]:
-                current_message_id = chat_data["chat"]["history"].get("currentId")
-            
-            if not current_message_id:
-                current_message_id = message_id
+            actual_chat_id = self._open_chat(message, model, chat_title, enable_thinking, deadline)
             
             return self._complete_simple_chat(
                 actual_chat_id, message, model, enable_thinking,
-                temperature, top_p, max_tokens
+                temperature, top_p, max_tokens, deadline
             )
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise ZAIError(f"Simple chat failed: {e}")
     
+    def _open_chat(
+        self,
+        message: str,
+        model: str,
+        chat_title: str,
+        enable_thinking: bool,
+        deadline: Optional[Deadline] = None
+    ) -> str:
+        """
+        Get a chat to complete in, from the chat pool if it has one ready.
+        
+        Args:
+            message (str): First user message.
+            model (str): Model ID.
+            chat_title (str): Chat title.
+            enable_thinking (bool): Enable thinking mode.
+            deadline (Optional[Deadline]): Deadline for the request.
+        
+        Returns:
+            str: Chat ID.
+        """
+        chat_id = self.chat_pool.acquire(model, chat_title, enable_thinking) if self.chat_pool else None
+        return chat_id or self._create_simple_chat(message, model, chat_title, enable_thinking, deadline)
+    
+    def _create_simple_chat(
+        self,
+        message: str,
+        model: str,
+        chat_title: str,
+        enable_thinking: bool,
+        deadline: Optional[Deadline] = None
+    ) -> str:
+        """
+        Create the chat of a one-shot completion.
+        
+        Args:
+            message (str): User message.
+            model (str): Model ID.
+            chat_title (str): Chat title.
+            enable_thinking (bool): Enable thinking mode.
+            deadline (Optional[Deadline]): Deadline for the request.
+        
+        Returns:
+            str: Chat ID.
+        
+        Raises:
+            ZAIError: If no chat ID is returned.
+        """
+        chat_payload = self._build_simple_chat_payload(
+            str(uuid.uuid4()), message, model, chat_title,
+            enable_thinking, int(time.time())
+        )
+        response = self.http_client.make_request(
+            "POST",
+            "/api/v1/chats/new",
+            chat_payload,
+            headers={"x-fe-version": FE_VERSION},
+            deadline=deadline
+        )
+        actual_chat_id = loads(response.content).get("id")
+        
+        if not actual_chat_id:
+            raise ZAIError("Failed to create chat - no chat ID returned")
+        
+        return actual_chat_id
+    
     def _build_simple_chat_payload(
         self,
-        chat_id: str,
         message_id: str,
         message: str,
         model: str,
         chat_title: str,
         enable_thinking: bool,
         timestamp: int
-    ) -> Dict:
+    ) -> bytes:
         """
         Build simple chat creation payload.
         
         Args:
-            chat_id (str): Chat ID.
             message_id (str): Message ID.
             message (str): User message.
             model (str): Model ID.
@@ -272,44 +408,9 @@ class ChatOperations:
             timestamp (int): Timestamp.
         
         Returns:
-            Dict: Simple chat creation payload.
+            bytes: Encoded simple chat creation payload.
         """
-        return {
-            "chat": {
-                "id": "",
-                "title": chat_title,
-                "models": [model],
-                "params": {},
-                "history": {
-                    "messages": {
-                        message_id: {
-                            "id": message_id,
-                            "parentId": None,
-                            "childrenIds": [],
-                            "role": "user",
-                            "content": message,
-                            "timestamp": timestamp,
-                            "models": [model]
-                        }
-                    },
-                    "currentId": message_id
-                },
-                "messages": [{
-                    "id": message_id,
-                    "parentId": None,
-                    "childrenIds": [],
-                    "role": "user",
-                    "content": message,
-                    "timestamp": timestamp,
-                    "models": [model]
-                }],
-                "tags": [],
-                "flags": [],
-                "mcp_servers": [],
-                "enable_thinking": enable_thinking,
-                "timestamp": timestamp * 1000
-            }
-        }
+        return render_simple_chat(message_id, message, model, chat_title, enable_thinking, timestamp)
     
     def _complete_simple_chat(
         self,
@@ -319,11 +420,15 @@ class ChatOperations:
         enable_thinking: bool,
         temperature: float,
         top_p: float,
-        max_tokens: int
+        max_tokens: int,
+        deadline: Optional[Deadline] = None
     ) -> ChatCompletionResponse:
         """
         Complete simple chat streaming.
         
+        The chat referer is sent as a per-request header, so concurrent
+        simple_chat calls on one client never send each other's chat.
+        
         Args:
             chat_id (str): Actual chat ID.
             message (str): User message.
@@ -332,125 +437,186 @@ class ChatOperations:
             temperature (float): Temperature parameter.
             top_p (float): Top-p parameter.
             max_tokens (int): Max tokens parameter.
+            deadline (Optional[Deadline]): Deadline for the completion stream.
         
         Returns:
             ChatCompletionResponse: Completed chat response.
         """
-        completion_payload = {
-            "stream": True,
-            "model": model,
-            "messages": [{"role": "user", "content": message}],
-            "params": {},
-            "features": {
-                "image_generation": False,
-                "web_search": False,
-                "auto_web_search": False,
-                "preview_mode": True,
-                "flags": [],
-                "features": [
-                    {"type": "mcp", "server": "vibe-coding", "status": "hidden"},
-                    {"type": "mcp", "server": "ppt-maker", "status": "hidden"},
-                    {"type": "mcp", "server": "image-search", "status": "hidden"}
-                ],
-                "enable_thinking": enable_thinking
-            },
-            "variables": self._get_variables(),
-            "model_item": self.model_ops.build_model_item(model, temperature, top_p, max_tokens),
-            "chat_id": chat_id,
-            "id": str(uuid.uuid4())
-        }
+        completion_payload = self._build_completion_payload(
+            chat_id, message, model, enable_thinking,
+            temperature, top_p, max_tokens
+        )
         
-        original_referer = self.http_client.session.headers.get("referer")
-        self.http_client.session.headers["referer"] = f"https://chat.z.ai/c/{chat_id}"
+        return self._parse_stream_response(
+            self.http_client.make_request(
+                "POST",
+                "/api/chat/completions",
+                completion_payload,
+                stream=True,
+                retry=True,
+                headers={
+                    "x-fe-version": FE_VERSION,
+                    "referer": f"{self.http_client.base_url}/c/{chat_id}"
+                },
+                deadline=deadline,
+                hedge=self.hedge_completions
+            ),
+            deadline
+        )
+    
+    def _build_completion_payload(
+        self,
+        chat_id: str,
+        message: str,
+        model: str,
+        enable_thinking: bool,
+        temperature: float,
+        top_p: float,
+        max_tokens: int
+    ) -> bytes:
+        """
+        Build simple chat completion payload.
         
-        try:
-            return self._parse_stream_response(
-                self.http_client.make_request("POST", "/api/chat/completions", completion_payload, stream=True)
-            )
-        finally:
-            if original_referer:
-                self.http_client.session.headers["referer"] = original_referer
+        Everything but the per-request values comes from the model's
+        precompiled template.
+        
+        Args:
+            chat_id (str): Actual chat ID.
+            message (str): User message.
+            model (str): Model ID.
+            enable_thinking (bool): Enable thinking mode.
+            temperature (float): Temperature parameter.
+            top_p (float): Top-p parameter.
+            max_tokens (int): Max tokens parameter.
+        
+        Returns:
+            bytes: Encoded chat completion payload.
+        """
+        return self.completion_templates.render(
+            model, chat_id, str(uuid.uuid4()), [{"role": "user", "content": message}], enable_thinking,
+            self._get_variables(), temperature, top_p, max_tokens
+        )
     
-    def _get_variables(self) -> Dict[str, str]:
+    def _get_variables(self) -> bytes:
         """
         Get template variables.
         
         Returns:
-            Dict[str, str]: Template variables dictionary.
+            bytes: Encoded template variables.
         """
-        return {
-            "{{USER_NAME}}": self.auth_data.get('name', 'Guest') if self.auth_data else 'Guest',
-            "{{USER_LOCATION}}": "Unknown",
-            "{{CURRENT_DATETIME}}": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "{{CURRENT_DATE}}": time.strftime("%Y-%m-%d"),
-            "{{CURRENT_TIME}}": time.strftime("%H:%M:%S"),
-            "{{CURRENT_WEEKDAY}}": time.strftime("%A"),
-            "{{CURRENT_TIMEZONE}}": "America/New_York",
-            "{{USER_LANGUAGE}}": "en-US"
-        }
+        user_name = self.auth_data.get('name', 'Guest') if self.auth_data else 'Guest'
+        return render_variables(user_name, "America/New_York")
     
-    def _parse_stream_response(self, stream_response) -> ChatCompletionResponse:
+    def _parse_stream_response(self, stream_response, deadline: Optional[Deadline] = None) -> ChatCompletionResponse:
         """
         Parse streaming response.
         
         Args:
             stream_response: Streaming response object.
+            deadline (Optional[Deadline]): Abort reading once it passes.
         
         Returns:
             ChatCompletionResponse: Parsed completion response.
         """
-        import json
-        
-        content = ""
-        thinking = ""
-        usage = {}
+        state = self._new_stream_state()
+        chunks = self.http_client.iter_stream(stream_response, deadline=deadline)
         
         try:
-            line_count = 0
-            for line in stream_response.iter_lines(decode_unicode=True, chunk_size=8192):
-                line_count += 1
-                if self.verbose and line_count <= 5:
-                    print(f"[DEBUG] Line {line_count}: {line[:200]}")
+            event_count = 0
+            for payload in SSEDecoder().iter_data(chunks):
+                event_count += 1
+                if self.verbose and event_count <= 5:
+                    print(f"[DEBUG] Event {event_count}: {payload[:200]}")
                 
-                if line and line.startswith("data: "):
-                    data_str = line[6:]
-                    if data_str.strip():
-                        try:
-                            data = json.loads(data_str)
-                            chunk_data = data.get("data", {})
-                            phase = chunk_data.get("phase", "")
-                            delta_content = chunk_data.get("delta_content", "")
-                            done = chunk_data.get("done", False)
-                            
-                            if delta_content:
-                                if phase == "thinking":
-                                    thinking += delta_content
-                                elif phase == "answer":
-                                    content += delta_content
-                            
-                            if phase == "done" or done:
-                                usage = chunk_data.get("usage", {})
-                                break
-                            
-                            if chunk_data.get("usage"):
-                                usage = chunk_data.get("usage", {})
-                                
-                        except json.JSONDecodeError as json_error:
-                            if self.verbose:
-                                print(f"[DEBUG] JSON decode error: {json_error}")
-                                print(f"[DEBUG] Failed to parse: {data_str[:200]}")
-                            continue
+                if self._consume_stream_data(payload, state):
+                    break
                             
         except Exception as stream_error:
-            if not content and not thinking:
-                raise ZAIError(f"Stream parsing failed: {stream_error}")
+            self._handle_stream_error(stream_error, state)
+        finally:
+            stream_response.close()
+        
+        return self._build_stream_result(state)
+    
+    def _new_stream_state(self) -> Dict:
+        """
+        Create the accumulator used while parsing a completion stream.
+        
+        Returns:
+            Dict: Empty stream state.
+        """
+        return {"content": "", "thinking": "", "usage": {}}
+    
+    def _consume_stream_data(self, payload: bytes, state: Dict) -> bool:
+        """
+        Apply one SSE data payload of a completion stream to the accumulator.
+        
+        Args:
+            payload (bytes): Payload of a data line, from SSEDecoder.
+            state (Dict): Stream state from _new_stream_state.
+        
+        Returns:
+            bool: True once the stream reported completion.
+        """
+        try:
+            data = loads(payload)
+        except ValueError as json_error:
             if self.verbose:
-                print(f"Stream parsing warning: {stream_error}, continuing with partial content")
+                print(f"[DEBUG] JSON decode error: {json_error}")
+                print(f"[DEBUG] Failed to parse: {payload[:200]}")
+            return False
+        
+        chunk_data = data.get("data", {})
+        phase = chunk_data.get("phase", "")
+        delta_content = chunk_data.get("delta_content", "")
+        done = chunk_data.get("done", False)
+        
+        if delta_content:
+            if phase == "thinking":
+                state["thinking"] += delta_content
+            elif phase == "answer":
+                state["content"] += delta_content
+        
+        if phase == "done" or done:
+            state["usage"] = chunk_data.get("usage", {})
+            return True
+        
+        if chunk_data.get("usage"):
+            state["usage"] = chunk_data.get("usage", {})
+        
+        return False
+    
+    def _handle_stream_error(self, stream_error: Exception, state: Dict):
+        """
+        Decide whether a mid-stream error loses the whole answer.
         
+        A passed deadline is always raised, even with partial content.
+        
+        Args:
+            stream_error (Exception): Error raised while reading the stream.
+            state (Dict): Stream state collected so far.
+        """
+        if isinstance(stream_error, DeadlineExceeded):
+            raise stream_error
+        if not state["content"] and not state["thinking"]:
+            raise ZAIError(f"Stream parsing failed: {stream_error}")
+        if self.verbose:
+            print(f"Stream parsing warning: {stream_error}, continuing with partial content")
+    
+    def _build_stream_result(self, state: Dict) -> ChatCompletionResponse:
+        """
+        Build the final response from a parsed stream.
+        
+        Args:
+            state (Dict): Stream state.
+        
+        Returns:
+            ChatCompletionResponse: Parsed completion response.
+        """
         return ChatCompletionResponse(
-            content=content.strip(),
-            thinking=thinking.strip(),
-            usage=usage,
+            content=state["content"].strip(),
+            thinking=state["thinking"].strip(),
+            usage=state["usage"],
             message_id="",
             done=True
         )
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""Pool of chats created ahead of time for simple_chat."""
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+
+@dataclass
+class PooledChat:
+    """A chat created in the background and not used yet."""
+    
+    chat_id: str
+    created_at: float
+
+
+class ChatPool:
+    """Keeps a few empty chats per model, title and thinking mode ready to complete in.
+    
+    simple_chat takes a chat from the pool instead of creating one, which
+    saves the POST /api/v1/chats/new round trip before the completion.
+    Every take, hit or miss, tops the pool for that key back up on a
+    background thread. Chats older than ``ttl`` seconds are dropped
+    unused, and an empty pool returns None so the caller creates the
+    chat itself.
+    
+    Pooled chats are created before the message is known, so unlike a
+    chat created inline their server history starts empty; the user
+    message reaches the server only in the completion request.
+    """
+    
+    def __init__(
+        self,
+        create: Callable[[str, str, bool], str],
+        size: int = 2,
+        ttl: Optional[float] = None
+    ):
+        """
+        Initialize chat pool.
+        
+        Args:
+            create (Callable[[str, str, bool], str]): Creates a chat for a model, title and thinking mode and returns its id.
+            size (int): Chats kept per model, title and thinking mode.
+            ttl (Optional[float]): Seconds a chat is handed out after creation (defaults to ZAI_CHAT_POOL_TTL or 300).
+        """
+        self.create = create
+        self.size = max(1, size)
+        self.ttl = ttl if ttl is not None else float(os.environ.get("ZAI_CHAT_POOL_TTL", 300))
+        self._chats: Dict[Tuple[str, str, bool], Deque[PooledChat]] = {}
+        self._lock = threading.Lock()
+        self._refillers: Dict[Tuple[str, str, bool], threading.Thread] = {}
+        self._counters = {"hits": 0, "misses": 0, "created": 0, "expired": 0, "create_errors": 0}
+    
+    def acquire(self, model: str, title: str, enable_thinking: bool) -> Optional[str]:
+        """
+        Take a ready chat.
+        
+        Args:
+            model (str): Model ID.
+            title (str): Chat title.
+            enable_thinking (bool): Thinking mode the chat was created with.
+        
+        Returns:
+            Optional[str]: Chat ID, or None if no unexpired chat is ready.
+        """
+        key = (model, title, bool(enable_thinking))
+        chat_id = None
+        with self._lock:
+            chats = self._chats.setdefault(key, deque())
+            self._drop_expired(chats)
+            if chats:
+                chat_id = chats.popleft().chat_id
+                self._counters["hits"] += 1
+            else:
+                self._counters["misses"] += 1
+        self.refill_async(*key)
+        return chat_id
+    
+    def _drop_expired(self, chats: Deque[PooledChat]):
+        """Remove chats past their ttl, oldest first; call with the lock held."""
+        cutoff = time.monotonic() - self.ttl
+        while chats and chats[0].created_at <= cutoff:
+            chats.popleft()
+            self._counters["expired"] += 1
+    
+    def fill(self, model: str, title: str, enable_thinking: bool) -> int:
+        """
+        Create chats until the pool for a model, title and thinking mode is full.
+        
+        Stops at the first failed creation.
+        
+        Args:
+            model (str): Model ID.
+            title (str): Chat title.
+            enable_thinking (bool): Thinking mode to create the chats with.
+        
+        Returns:
+            int: Chats ready afterwards.
+        """
+        key = (model, title, bool(enable_thinking))
+        while True:
+            with self._lock:
+                chats = self._chats.setdefault(key, deque())
+                self._drop_expired(chats)
+                if len(chats) >= self.size:
+                    return len(chats)
+            
+            try:
+                chat_id = self.create(*key)
+            except Exception:
+                with self._lock:
+                    self._counters["create_errors"] += 1
+                    return len(chats)
+            
+            with self._lock:
+                chats.append(PooledChat(chat_id, time.monotonic()))
+                self._counters["created"] += 1
+    
+    def refill_async(self, model: str, title: str, enable_thinking: bool):
+        """
+        Fill the pool for a model, title and thinking mode on a background thread, unless one is running.
+        
+        Args:
+            model (str): Model ID.
+            title (str): Chat title.
+            enable_thinking (bool): Thinking mode to create the chats with.
+        """
+        key = (model, title, bool(enable_thinking))
+        with self._lock:
+            refiller = self._refillers.get(key)
+            if refiller is not None and refiller.is_alive():
+                return
+            refiller = threading.Thread(
+                target=self.fill, args=key, name="zai-chat-prefetch", daemon=True
+            )
+            self._refillers[key] = refiller
+            refiller.start()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot the pool.
+        
+        Returns:
+            Dict[str, Any]: Size, ready chats per model, title and thinking mode, and counters.
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "ready": {
+                    f"{model}/{title}/{'thinking' if enable_thinking else 'plain'}": len(chats)
+                    for (model, title, enable_thinking), chats in self._chats.items()
+                },
+                **self._counters
+            }
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""Multi-turn conversations on one Z.AI chat."""
+
+import uuid
+from typing import Generator, List, Optional, Union
+
+from ..core.deadline import Deadline
+from ..models import Chat, ChatCompletionResponse, Message, StreamingChunk
+from ..utils.json_codec import dumps
+from .chat import FE_VERSION, ChatOperations
+
+
+class Conversation:
+    """A Z.AI chat carried across turns.
+    
+    The server chat is created with the first message and reused after
+    that. Every message is encoded once when it joins the conversation,
+    so a turn only encodes its own message and splices the rest into the
+    model's precompiled completion template. The local Chat keeps the
+    message tree, with each message a reply to the one before.
+    
+    A conversation is meant for one caller at a time.
+    """
+    
+    def __init__(
+        self,
+        chat_ops: ChatOperations,
+        model: str = "glm-4.5v",
+        enable_thinking: bool = True,
+        title: str = "Conversation",
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ):
+        """
+        Initialize conversation.
+        
+        Args:
+            chat_ops (ChatOperations): Chat operations of the client.
+            model (str): Model ID.
+            enable_thinking (bool): Enable thinking mode.
+            title (str): Chat title.
+            temperature (Optional[float]): Temperature, or None for the model default.
+            top_p (Optional[float]): Top-p, or None for the model default.
+            max_tokens (Optional[int]): Max tokens, or None for the model default.
+        """
+        self.chat_ops = chat_ops
+        self.model = model
+        self.enable_thinking = enable_thinking
+        self.temperature = temperature
+        self.top_p = top_p
+        self.max_tokens = max_tokens
+        self.chat = Chat(title=title, models=[model], enable_thinking=enable_thinking)
+        self.last_response: Optional[ChatCompletionResponse] = None
+        self._encoded: List[bytes] = []
+    
+    @property
+    def chat_id(self) -> Optional[str]:
+        """
+        Get the server chat ID.
+        
+        Returns:
+            Optional[str]: Chat ID, or None before the first turn.
+        """
+        return self.chat.id or None
+    
+    @property
+    def messages(self) -> List[Message]:
+        """
+        Get the messages so far.
+        
+        Returns:
+            List[Message]: Messages, oldest first.
+        """
+        return self.chat.messages
+    
+    def stream(
+        self,
+        message: str,
+        deadline: Union[Deadline, float, None] = None
+    ) -> Generator[StreamingChunk, None, None]:
+        """
+        Send a message and stream the reply.
+        
+        The answer joins the conversation once the stream is done. If the
+        stream fails or is closed early, the message is taken back out.
+        
+        Args:
+            message (str): User message.
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole turn.
+        
+        Yields:
+            StreamingChunk: StreamingChunk objects.
+        """
+        deadline = Deadline.coerce(deadline)
+        self._append(message, "user")
+        state = self.chat_ops._new_chunk_state()
+        
+        try:
+            if not self.chat.id:
+                self.chat.id = self.chat_ops._open_chat(
+                    message, self.model, self.chat.title, self.enable_thinking, deadline
+                )
+            
+            payload = self.chat_ops.completion_templates.render(
+                self.model, self.chat.id, str(uuid.uuid4()),
+                b"[" + b",".join(self._encoded) + b"]", self.enable_thinking,
+                self.chat_ops._get_variables(), self.temperature, self.top_p, self.max_tokens
+            )
+            headers = {
+                "x-fe-version": FE_VERSION,
+                "referer": f"{self.chat_ops.http_client.base_url}/c/{self.chat.id}"
+            }
+            for chunk in self.chat_ops.streaming_ops.stream_payload(payload, deadline, headers):
+                self.chat_ops._consume_chunk(chunk, state)
+                yield chunk
+        except BaseException:
+            self._pop()
+            raise
+        
+        self.last_response = self.chat_ops._build_chunk_result(state)
+        self._append(self.last_response.content, "assistant")
+    
+    def send(
+        self,
+        message: str,
+        deadline: Union[Deadline, float, None] = None
+    ) -> ChatCompletionResponse:
+        """
+        Send a message and wait for the whole reply.
+        
+        Args:
+            message (str): User message.
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole turn.
+        
+        Returns:
+            ChatCompletionResponse: ChatCompletionResponse with complete content.
+        """
+        for _ in self.stream(message, deadline):
+            pass
+        return self.last_response
+    
+    def _append(self, content: str, role: str):
+        """
+        Add a message to the chat and its encoded form to the payload list.
+        
+        Args:
+            content (str): Message content.
+            role (str): Role of the sender.
+        """
+        self.chat.add_message(content, role, [self.model])
+        self._encoded.append(dumps({"role": role, "content": content}))
+    
+    def _pop(self):
+        """Take the last message back out of the conversation."""
+        message = self.chat.messages.pop()
+        self._encoded.pop()
+        history = self.chat.history
+        del history.messages[message.id]
+        history.currentId = message.parentId
+        if message.parentId:
+            history.messages[message.parentId].childrenIds.remove(message.id)
\ No newline at end of file
@@ -1,32 +1,186 @@
 """Model operations for Z.AI API."""
 
+import threading
+from dataclasses import asdict
 from typing import Dict, List, Optional
 
+from ..core.deadline import Deadline
 from ..core.http_client import HTTPClient
 from ..models import Model
+from ..utils.json_codec import loads
+from .catalog import EXPIRED, FRESH, ModelCatalog, get_model_catalog
+
+
+MODEL_CONFIGS = {
+    "glm-4.5v": {
+        "name": "GLM-4.5V",
+        "temperature": 0.8,
+        "top_p": 0.6,
+        "max_tokens": 80000,
+        "description": "Advanced visual understanding and analysis",
+        "capabilities": {
+            "vision": True,
+            "citations": False,
+            "preview_mode": False,
+            "web_search": False,
+            "language_detection": False,
+            "restore_n_source": False,
+            "mcp": False,
+            "file_qa": False,
+            "returnFc": True,
+            "returnThink": True,
+            "think": True
+        }
+    },
+    "0727-360B-API": {
+        "name": "GLM-4.5",
+        "temperature": 0.6,
+        "top_p": 0.95,
+        "max_tokens": 80000,
+        "description": "Most advanced model, proficient in coding and tool use",
+        "capabilities": {
+            "vision": False,
+            "citations": False,
+            "preview_mode": False,
+            "web_search": False,
+            "language_detection": False,
+            "restore_n_source": False,
+            "mcp": True,
+            "file_qa": True,
+            "returnFc": True,
+            "returnThink": True,
+            "think": True
+        }
+    }
+}
+
+DEFAULT_MODEL_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.9,
+    "max_tokens": 4096,
+    "description": "Custom model configuration",
+    "capabilities": {
+        "vision": False,
+        "citations": False,
+        "preview_mode": False,
+        "web_search": False,
+        "language_detection": False,
+        "restore_n_source": False,
+        "mcp": False,
+        "file_qa": False,
+        "returnFc": True,
+        "returnThink": True,
+        "think": True
+    }
+}
 
 
 class ModelOperations:
     """Handles model-related operations."""
     
-    def __init__(self, http_client: HTTPClient):
+    def __init__(self, http_client: HTTPClient, catalog: Optional[ModelCatalog] = None):
         """
         Initialize model operations.
         
         Args:
             http_client (HTTPClient): HTTP client instance.
+            catalog (Optional[ModelCatalog]): Model cache (defaults to the shared one for the host).
         """
         self.http_client = http_client
+        self.catalog = catalog or get_model_catalog(http_client.base_url)
     
-    def get_models(self) -> List[Model]:
+    def get_models(self, deadline: Optional[Deadline] = None) -> List[Model]:
         """
         Get available models.
         
+        Args:
+            deadline (Optional[Deadline]): Deadline of the calling operation.
+        
         Returns:
             List[Model]: List of available Model objects.
         """
-        response = self.http_client.make_request("GET", "/api/v1/models")
-        data = response.json()
+        self._load_catalog(deadline)
+        return list(self.catalog.models)
+    
+    def refresh_models(self, deadline: Optional[Deadline] = None):
+        """
+        Revalidate the model catalog with the server.
+        
+        Args:
+            deadline (Optional[Deadline]): Deadline of the calling operation.
+        """
+        headers = {"if-none-match": self.catalog.etag} if self.catalog.etag else None
+        response = self.http_client.make_request(
+            "GET", "/api/v1/models", headers=headers, deadline=deadline, hedge=True
+        )
+        self._store_models(response)
+    
+    def _store_models(self, response):
+        """
+        Update the catalog from a /api/v1/models response.
+        
+        Args:
+            response: Response to a possibly conditional catalog request.
+        """
+        if response.status_code == 304:
+            self.catalog.touch()
+        else:
+            self.catalog.update(self._parse_models(loads(response.content)), response.headers.get("etag"))
+    
+    def _load_catalog(self, deadline: Optional[Deadline] = None):
+        """
+        Make sure the catalog can be served.
+        
+        A fresh catalog is served as is. A stale one is served while a
+        background thread revalidates it. Otherwise the caller refreshes
+        it, and concurrent callers wait for that refresh instead of
+        sending their own.
+        
+        Args:
+            deadline (Optional[Deadline]): Deadline for a blocking refresh.
+        """
+        catalog = self.catalog
+        state = catalog.state()
+        if state == FRESH:
+            catalog.record("hits")
+            return
+        if state != EXPIRED:
+            catalog.record("stale_hits")
+            if catalog.begin_refresh():
+                threading.Thread(target=self._refresh_in_background, name="zai-model-catalog", daemon=True).start()
+            return
+        
+        catalog.record("misses")
+        with catalog.refresh_lock:
+            if catalog.state() != EXPIRED:
+                return
+            try:
+                self.refresh_models(deadline)
+            except Exception:
+                catalog.record("refresh_errors")
+                if catalog.fetched_at is None:
+                    raise
+    
+    def _refresh_in_background(self):
+        """Revalidate a stale catalog, keeping it on failure."""
+        try:
+            with self.catalog.refresh_lock:
+                self.refresh_models()
+        except Exception:
+            self.catalog.record("refresh_errors")
+        finally:
+            self.catalog.end_refresh()
+    
+    def _parse_models(self, data: Dict) -> List[Model]:
+        """
+        Parse the /api/v1/models response body.
+        
+        Args:
+            data (Dict): Decoded response body.
+        
+        Returns:
+            List[Model]: List of Model objects.
+        """
         models = []
         
         for model_data in data.get("data", []):
@@ -34,23 +188,57 @@ class ModelOperations:
         
         return models
     
-    def get_model_by_id(self, model_id: str) -> Optional[Model]:
+    def get_model_by_id(self, model_id: str, deadline: Optional[Deadline] = None) -> Optional[Model]:
         """
         Get a specific model by ID.
         
         Args:
             model_id (str): The model ID to search for.
+            deadline (Optional[Deadline]): Deadline of the calling operation.
         
         Returns:
             Optional[Model]: Model object if found, None otherwise.
         """
-        models = self.get_models()
+        self._load_catalog(deadline)
+        return self.catalog.index.get(model_id)
+    
+    def model_config(self, model: str) -> Dict:
+        """
+        Get a model's display name, default sampling params and capabilities.
+        
+        Taken from the model's catalog entry when the catalog has one (from
+        the server or a generated snapshot), else from built-in settings.
+        Sampling params the entry leaves out keep their built-in values.
+        Params and capabilities this client does not know are skipped, and
+        an entry that cannot be parsed, e.g. because a field has another
+        type than expected, is ignored.
         
-        for model in models:
-            if model.id == model_id:
-                return model
+        Args:
+            model (str): Model ID.
         
-        return None
+        Returns:
+            Dict: name, temperature, top_p, max_tokens, description and capabilities.
+        """
+        config = MODEL_CONFIGS.get(model) or {"name": model.upper(), **DEFAULT_MODEL_CONFIG}
+        cached = self.catalog.index.get(model)
+        if cached is None:
+            return config
+        
+        try:
+            params = cached.info.params
+            meta = cached.info.meta
+            capabilities = asdict(meta.capabilities)
+        except (TypeError, KeyError, AttributeError, ValueError):
+            return config
+        
+        return {
+            "name": cached.name,
+            "temperature": params.temperature if params.temperature is not None else config["temperature"],
+            "top_p": params.top_p if params.top_p is not None else config["top_p"],
+            "max_tokens": params.max_tokens if params.max_tokens is not None else config["max_tokens"],
+            "description": meta.description,
+            "capabilities": capabilities
+        }
     
     def build_model_item(
         self,
@@ -62,6 +250,8 @@ class ModelOperations:
         """
         Build model_item configuration with custom parameters.
         
+        Defaults come from model_config.
+        
         Args:
             model (str): Model ID.
             temperature (float): Temperature value.
@@ -71,69 +261,7 @@ class ModelOperations:
         Returns:
             Dict: Model item configuration dictionary.
         """
-        model_configs = {
-            "glm-4.5v": {
-                "name": "GLM-4.5V",
-                "temperature": 0.8,
-                "top_p": 0.6,
-                "max_tokens": 80000,
-                "description": "Advanced visual understanding and analysis",
-                "capabilities": {
-                    "vision": True,
-                    "citations": False,
-                    "preview_mode": False,
-                    "web_search": False,
-                    "language_detection": False,
-                    "restore_n_source": False,
-                    "mcp": False,
-                    "file_qa": False,
-                    "returnFc": True,
-                    "returnThink": True,
-                    "think": True
-                }
-            },
-            "0727-360B-API": {
-                "name": "GLM-4.5",
-                "temperature": 0.6,
-                "top_p": 0.95,
-                "max_tokens": 80000,
-                "description": "Most advanced model, proficient in coding and tool use",
-                "capabilities": {
-                    "vision": False,
-                    "citations": False,
-                    "preview_mode": False,
-                    "web_search": False,
-                    "language_detection": False,
-                    "restore_n_source": False,
-                    "mcp": True,
-                    "file_qa": True,
-                    "returnFc": True,
-                    "returnThink": True,
-                    "think": True
-                }
-            }
-        }
-        
-        config = model_configs.get(model, {
-            "name": model.upper(),
-            "temperature": 0.7,
-            "top_p": 0.9,
-            "max_tokens": 4096,
-            "description": "Custom model configuration",
-            "capabilities": {
-                "vision": False,
-                "citations": False,
-                "preview_mode": False,
-                "web_search": False,
-                "language_detection": False,
-                "restore_n_source": False,
-                "mcp": False,
-                "file_qa": False,
-                "returnFc": True,
-                "returnThink": True,
-                "think": True
-            }
-        })
+        config = self.model_config(model)
         
         final_temperature = temperature if temperature is not None else config["temperature"]
         final_top_p = top_p if top_p is not None else config["top_p"]
@@ -166,7 +294,7 @@ class ModelOperations:
                 "meta": {
                     "profile_image_url": "/static/favicon.png",
                     "description": config["description"],
-                    "capabilities": config["capabilities"]
+                    "capabilities": dict(config["capabilities"])
                 }
             }
         }
\ No newline at end of file
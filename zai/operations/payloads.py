@@ -0,0 +1,287 @@
+"""Precompiled templates for Z.AI chat and completion request bodies."""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..models import Chat, Message, Model
+from ..utils.json_codec import dumps
+from ..utils.json_template import JSONTemplate, Slot
+
+
+DEFAULT_MCP_SERVERS = ("vibe-coding", "ppt-maker", "image-search")
+
+
+def default_features(enable_thinking: bool) -> Dict[str, Any]:
+    """
+    Get the features block the web app sends with completions.
+    
+    Args:
+        enable_thinking (bool): Enable thinking mode.
+    
+    Returns:
+        Dict[str, Any]: Features configuration.
+    """
+    return {
+        "image_generation": False,
+        "web_search": False,
+        "auto_web_search": False,
+        "preview_mode": True,
+        "flags": [],
+        "features": [{"type": "mcp", "server": server, "status": "hidden"} for server in DEFAULT_MCP_SERVERS],
+        "enable_thinking": enable_thinking
+    }
+
+
+FEATURES = {flag: dumps(default_features(flag)) for flag in (True, False)}
+
+VARIABLES = JSONTemplate({
+    "{{USER_NAME}}": Slot("user_name"),
+    "{{USER_LOCATION}}": "Unknown",
+    "{{CURRENT_DATETIME}}": Slot("datetime"),
+    "{{CURRENT_DATE}}": Slot("date"),
+    "{{CURRENT_TIME}}": Slot("time"),
+    "{{CURRENT_WEEKDAY}}": Slot("weekday"),
+    "{{CURRENT_TIMEZONE}}": Slot("timezone"),
+    "{{USER_LANGUAGE}}": "en-US"
+})
+
+STREAM_COMPLETION = JSONTemplate({
+    "stream": True,
+    "model": Slot("model"),
+    "messages": Slot("messages"),
+    "params": {},
+    "features": Slot("features"),
+    "variables": Slot("variables"),
+    "model_item": Slot("model_item"),
+    "chat_id": Slot("chat_id")
+})
+
+# Last encoded variables per (user name, timezone), with the second they were made for
+_variables: Dict[Tuple[str, str], Tuple[int, bytes]] = {}
+
+
+def render_variables(user_name: str = "Guest", timezone: str = "UTC") -> bytes:
+    """
+    Encode the prompt template variables for the current time.
+    
+    The clock fields have one-second resolution, so the encoded object
+    is reused by every request made within the same second.
+    
+    Args:
+        user_name (str): Value of {{USER_NAME}}.
+        timezone (str): Value of {{CURRENT_TIMEZONE}}.
+    
+    Returns:
+        bytes: Encoded variables object.
+    """
+    second = int(time.time())
+    cached = _variables.get((user_name, timezone))
+    if cached and cached[0] == second:
+        return cached[1]
+    
+    now = time.localtime(second)
+    current = time.strftime("%Y-%m-%d %H:%M:%S", now)
+    variables = VARIABLES.render({
+        "user_name": user_name,
+        "datetime": current,
+        "date": current[:10],
+        "time": current[11:],
+        "weekday": time.strftime("%A", now),
+        "timezone": timezone
+    })
+    _variables[(user_name, timezone)] = (second, variables)
+    return variables
+
+
+def message_dict(message: Message) -> Dict[str, Any]:
+    """
+    Convert a chat message to its payload form.
+    
+    Args:
+        message (Message): Chat message.
+    
+    Returns:
+        Dict[str, Any]: Message as sent in chat payloads.
+    """
+    return {
+        "id": message.id,
+        "parentId": message.parentId,
+        "childrenIds": message.childrenIds,
+        "role": message.role,
+        "content": message.content,
+        "timestamp": message.timestamp,
+        "models": message.models
+    }
+
+
+def render_chat(chat: Chat) -> bytes:
+    """
+    Encode a chat creation payload.
+    
+    Every field of it is per chat, so it is encoded in one pass rather
+    than templated. Each message dict is built once and shared by the
+    history map and the message list.
+    
+    Args:
+        chat (Chat): Chat object.
+    
+    Returns:
+        bytes: Encoded payload.
+    """
+    messages = [message_dict(message) for message in chat.messages]
+    return dumps({
+        "chat": {
+            "id": chat.id,
+            "title": chat.title,
+            "models": chat.models,
+            "params": chat.params,
+            "history": {
+                "messages": {message["id"]: message for message in messages},
+                "currentId": chat.history.currentId
+            },
+            "messages": messages,
+            "tags": chat.tags,
+            "flags": chat.flags,
+            "features": [
+                {"type": feature.type, "server": feature.server, "status": feature.status}
+                for feature in chat.features
+            ],
+            "mcp_servers": chat.mcp_servers,
+            "enable_thinking": chat.enable_thinking,
+            "timestamp": chat.timestamp
+        }
+    })
+
+
+def render_simple_chat(
+    message_id: Optional[str],
+    message: Optional[str],
+    model: str,
+    title: str,
+    enable_thinking: bool,
+    timestamp: int
+) -> bytes:
+    """
+    Encode the chat creation payload of a one-shot chat.
+    
+    Args:
+        message_id (Optional[str]): Message ID, or None for a chat created empty.
+        message (Optional[str]): User message, or None for a chat created empty.
+        model (str): Model ID.
+        title (str): Chat title.
+        enable_thinking (bool): Enable thinking mode.
+        timestamp (int): Timestamp in seconds.
+    
+    Returns:
+        bytes: Encoded payload.
+    """
+    messages = []
+    if message_id is not None:
+        messages.append(message_dict(Message(id=message_id, content=message, timestamp=timestamp, models=[model])))
+    return dumps({
+        "chat": {
+            "id": "",
+            "title": title,
+            "models": [model],
+            "params": {},
+            "history": {
+                "messages": {entry["id"]: entry for entry in messages},
+                "currentId": message_id
+            },
+            "messages": messages,
+            "tags": [],
+            "flags": [],
+            "mcp_servers": [],
+            "enable_thinking": enable_thinking,
+            "timestamp": timestamp * 1000
+        }
+    })
+
+
+class CompletionTemplates:
+    """One-shot completion payloads compiled once per model.
+    
+    Everything but the ids, messages, variables and sampling params is
+    encoded when a model is first used. A template is rebuilt when the
+    model's catalog entry changes, since model_item is derived from it.
+    """
+    
+    def __init__(self, model_ops: Any):
+        """
+        Initialize templates.
+        
+        Args:
+            model_ops (Any): Model operations providing build_model_item and the catalog.
+        """
+        self.model_ops = model_ops
+        self._templates: Dict[str, Tuple[Optional[Model], JSONTemplate, Dict]] = {}
+    
+    def get(self, model: str) -> Tuple[JSONTemplate, Dict]:
+        """
+        Get the compiled template of a model.
+        
+        Args:
+            model (str): Model ID.
+        
+        Returns:
+            Tuple[JSONTemplate, Dict]: Template and the model's default config.
+        """
+        entry = self.model_ops.catalog.index.get(model)
+        cached = self._templates.get(model)
+        if cached is None or cached[0] is not entry:
+            template = JSONTemplate({
+                "stream": True,
+                "model": model,
+                "messages": Slot("messages"),
+                "params": {},
+                "features": Slot("features"),
+                "variables": Slot("variables"),
+                "model_item": self.model_ops.build_model_item(
+                    model, Slot("temperature"), Slot("top_p"), Slot("max_tokens")
+                ),
+                "chat_id": Slot("chat_id"),
+                "id": Slot("id")
+            })
+            cached = self._templates[model] = (entry, template, self.model_ops.model_config(model))
+        return cached[1], cached[2]
+    
+    def render(
+        self,
+        model: str,
+        chat_id: str,
+        request_id: str,
+        messages: Union[List[Dict[str, str]], bytes],
+        enable_thinking: bool,
+        variables: bytes,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> bytes:
+        """
+        Encode a completion payload.
+        
+        Args:
+            model (str): Model ID.
+            chat_id (str): Chat ID.
+            request_id (str): Completion request ID.
+            messages (Union[List[Dict[str, str]], bytes]): Messages in OpenAI format, or the encoded list.
+            enable_thinking (bool): Enable thinking mode.
+            variables (bytes): Encoded template variables.
+            temperature (Optional[float]): Temperature, or None for the model default.
+            top_p (Optional[float]): Top-p, or None for the model default.
+            max_tokens (Optional[int]): Max tokens, or None for the model default.
+        
+        Returns:
+            bytes: Encoded payload.
+        """
+        template, config = self.get(model)
+        return template.render({
+            "messages": messages,
+            "features": FEATURES[bool(enable_thinking)],
+            "variables": variables,
+            "temperature": temperature if temperature is not None else config["temperature"],
+            "top_p": top_p if top_p is not None else config["top_p"],
+            "max_tokens": max_tokens if max_tokens is not None else config["max_tokens"],
+            "chat_id": chat_id,
+            "id": request_id
+        })
\ No newline at end of file
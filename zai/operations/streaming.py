@@ -2,11 +2,20 @@
 
 import json
 import time
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Union
 
+import requests
+
+from ..core.deadline import Deadline
+from ..core.exceptions import ZAIError
 from ..core.http_client import HTTPClient
 from ..models import StreamingChunk
-from ..utils.sse_parser import SSEParser
+from ..utils.sse_parser import SSEEventParser, SSEParser
+from .payloads import FEATURES, STREAM_COMPLETION, render_variables
+
+MAX_RESUMES = 3
+DEFAULT_RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 10.0
 
 
 class StreamingOperations:
@@ -30,11 +39,19 @@ class StreamingOperations:
         enable_thinking: bool = True,
         features: Optional[Dict[str, Any]] = None,
         variables: Optional[Dict[str, str]] = None,
-        model_ops: Optional[Any] = None
+        model_ops: Optional[Any] = None,
+        deadline: Union[Deadline, float, None] = None
     ) -> Generator[StreamingChunk, None, None]:
         """
         Stream chat completion.
         
+        If the connection drops mid-stream after the upstream sent event
+        ids, the stream is resumed with a Last-Event-ID request instead of
+        regenerating the answer. Without event ids the error is raised,
+        and so is ZAIError if the upstream answers the resume request with
+        a new stream instead of the rest of the old one. Once the deadline
+        passes the stream is closed and DeadlineExceeded is raised.
+        
         Args:
             chat_id (str): Chat ID.
             messages (List[Dict[str, str]]): List of messages in OpenAI format.
@@ -43,46 +60,182 @@ class StreamingOperations:
             features (Optional[Dict[str, Any]]): Features configuration.
             variables (Optional[Dict[str, str]]): Template variables.
             model_ops (Optional[Any]): Model operations instance.
+            deadline (Union[Deadline, float, None]): Deadline, or seconds for the whole stream.
         
         Yields:
             StreamingChunk: StreamingChunk objects.
         """
+        deadline = Deadline.coerce(deadline)
+        
         if features is None:
             features = self._get_default_features(enable_thinking)
         
         if variables is None:
             variables = self._get_default_variables()
         
-        model_item = self._get_model_item(model, model_ops)
+        model_item = self._get_model_item(model, model_ops, deadline)
+        payload = self._build_payload(chat_id, messages, model, features, variables, model_item)
         
-        payload = {
-            "stream": True,
-            "model": model,
-            "messages": messages,
-            "params": {},
-            "features": features,
-            "variables": variables,
-            "model_item": model_item,
-            "chat_id": chat_id
-        }
+        yield from self.stream_payload(payload, deadline)
+    
+    def stream_payload(
+        self,
+        payload: bytes,
+        deadline: Optional[Deadline] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Generator[StreamingChunk, None, None]:
+        """
+        Stream a chat completion from an encoded payload.
         
+        Resumes dropped streams and honours the deadline like
+        stream_completion.
+        
+        Args:
+            payload (bytes): Encoded chat completion payload.
+            deadline (Optional[Deadline]): Deadline for the whole stream.
+            headers (Optional[Dict[str, str]]): Extra headers for every request of the stream.
+        
+        Yields:
+            StreamingChunk: StreamingChunk objects.
+        """
         response = self.http_client.make_request(
             "POST",
             "/api/chat/completions",
             payload,
-            stream=True
+            stream=True,
+            retry=True,
+            headers=headers,
+            deadline=deadline
         )
         
-        for line in response.iter_lines(decode_unicode=True):
-            if line:
-                data = self.sse_parser.parse_line(line)
-                if data:
-                    chunk = self._create_streaming_chunk(data)
-                    yield chunk
-                    if chunk.done:
-                        break
+        event_parser = SSEEventParser()
+        first_id: Optional[str] = None
+        dropped: Optional[Exception] = None
+        resumed_after = ""
+        resumes = 0
+        
+        try:
+            while True:
+                try:
+                    for event in event_parser.iter_events(self.http_client.iter_stream(response, deadline=deadline)):
+                        if dropped is not None:
+                            if not self._is_resumed(event.id, first_id, resumed_after):
+                                break
+                            dropped = None
+                        first_id = first_id or event.id
+                        
+                        data = self.sse_parser.parse_data(event.data)
+                        if data:
+                            chunk = self._create_streaming_chunk(data, event.id)
+                            yield chunk
+                            if chunk.done:
+                                return
+                    if dropped is None:
+                        return
+                
+                except (requests.exceptions.ConnectionError,
+                        requests.exceptions.ChunkedEncodingError,
+                        requests.exceptions.Timeout) as e:
+                    if not event_parser.last_event_id or resumes >= MAX_RESUMES:
+                        raise
+                    
+                    dropped = e
+                    resumed_after = event_parser.last_event_id
+                    resumes += 1
+                    response.close()
+                    delay = self._get_reconnect_delay(event_parser.retry)
+                    if deadline and delay >= deadline.remaining():
+                        raise
+                    time.sleep(delay)
+                    
+                    event_parser.reset()
+                    response = self.http_client.make_request(
+                        "POST",
+                        "/api/chat/completions",
+                        payload,
+                        stream=True,
+                        retry=True,
+                        headers={**(headers or {}), "Last-Event-ID": event_parser.last_event_id},
+                        deadline=deadline
+                    )
+                    continue
+                
+                raise ZAIError(f"Upstream did not resume the dropped stream after event {resumed_after}: {dropped}") from dropped
+        finally:
+            response.close()
+    
+    def _is_resumed(self, event_id: Optional[str], first_id: Optional[str], resumed_after: str) -> bool:
+        """
+        Check whether the first event of a resume request continues the dropped stream.
+        
+        An upstream that ignores Last-Event-ID starts the answer over,
+        which shows as an event without an id, the id the old stream
+        started with, or one that is not past the id resumed after.
+        
+        Args:
+            event_id (Optional[str]): Id of the first event of the new response.
+            first_id (Optional[str]): Id of the first event of the dropped stream.
+            resumed_after (str): Last event id sent in Last-Event-ID.
+        
+        Returns:
+            bool: True if the upstream resumed the stream.
+        """
+        if not event_id or event_id in (first_id, resumed_after):
+            return False
+        if event_id.isdigit() and resumed_after.isdigit():
+            return int(event_id) > int(resumed_after)
+        return True
+    
+    def _get_reconnect_delay(self, retry_ms: Optional[int]) -> float:
+        """
+        Get the wait before resuming a dropped stream.
+        
+        Args:
+            retry_ms (Optional[int]): Reconnection time sent by the server.
+        
+        Returns:
+            float: Seconds to wait.
+        """
+        if retry_ms is None:
+            return DEFAULT_RECONNECT_DELAY
+        return min(MAX_RECONNECT_DELAY, retry_ms / 1000)
+    
+    def _build_payload(
+        self,
+        chat_id: str,
+        messages: List[Dict[str, str]],
+        model: str,
+        features: Union[Dict[str, Any], bytes],
+        variables: Union[Dict[str, str], bytes],
+        model_item: Dict
+    ) -> bytes:
+        """
+        Build chat completion payload.
+        
+        The payload is encoded once here, so resumed requests resend the
+        same bytes.
+        
+        Args:
+            chat_id (str): Chat ID.
+            messages (List[Dict[str, str]]): List of messages in OpenAI format.
+            model (str): Model ID to use.
+            features (Union[Dict[str, Any], bytes]): Features configuration.
+            variables (Union[Dict[str, str], bytes]): Template variables.
+            model_item (Dict): Model item configuration.
+        
+        Returns:
+            bytes: Encoded chat completion payload.
+        """
+        return STREAM_COMPLETION.render({
+            "model": model,
+            "messages": messages,
+            "features": features,
+            "variables": variables,
+            "model_item": model_item,
+            "chat_id": chat_id
+        })
     
-    def _get_default_features(self, enable_thinking: bool) -> Dict[str, Any]:
+    def _get_default_features(self, enable_thinking: bool) -> bytes:
         """
         Get default features configuration.
         
@@ -90,60 +243,57 @@ class StreamingOperations:
             enable_thinking (bool): Enable thinking mode.
         
         Returns:
-            Dict[str, Any]: Default features configuration.
-        """
-        return {
-            "image_generation": False,
-            "web_search": False,
-            "auto_web_search": False,
-            "preview_mode": True,
-            "flags": [],
-            "features": [
-                {"type": "mcp", "server": "vibe-coding", "status": "hidden"},
-                {"type": "mcp", "server": "ppt-maker", "status": "hidden"},
-                {"type": "mcp", "server": "image-search", "status": "hidden"}
-            ],
-            "enable_thinking": enable_thinking
-        }
+            bytes: Precompiled default features configuration.
+        """
+        return FEATURES[bool(enable_thinking)]
     
-    def _get_default_variables(self) -> Dict[str, str]:
+    def _get_default_variables(self) -> bytes:
         """
         Get default template variables.
         
         Returns:
-            Dict[str, str]: Default template variables.
-        """
-        return {
-            "{{USER_NAME}}": "Guest",
-            "{{USER_LOCATION}}": "Unknown",
-            "{{CURRENT_DATETIME}}": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "{{CURRENT_DATE}}": time.strftime("%Y-%m-%d"),
-            "{{CURRENT_TIME}}": time.strftime("%H:%M:%S"),
-            "{{CURRENT_WEEKDAY}}": time.strftime("%A"),
-            "{{CURRENT_TIMEZONE}}": "UTC",
-            "{{USER_LANGUAGE}}": "en-US"
-        }
+            bytes: Encoded default template variables.
+        """
+        return render_variables("Guest", "UTC")
     
-    def _get_model_item(self, model: str, model_ops: Optional[Any]) -> Dict:
+    def _get_model_item(self, model: str, model_ops: Optional[Any], deadline: Optional[Deadline] = None) -> Dict:
         """
         Get model item configuration.
         
         Args:
             model (str): Model ID.
             model_ops (Optional[Any]): Model operations instance.
+            deadline (Optional[Deadline]): Deadline for the model catalog request.
         
         Returns:
             Dict: Model item configuration.
         """
         if model_ops:
-            model_obj = model_ops.get_model_by_id(model)
-            model_item = {
-                "id": model,
-                "name": model_obj.name if model_obj else model
-            }
-            
-            if model_obj:
-                model_item.update({
+            return self._model_item_from_model(model, model_ops.get_model_by_id(model, deadline=deadline))
+        
+        return {"id": model, "name": model}
+    
+    def _model_item_from_model(self, model: str, model_obj: Optional[Any]) -> Dict:
+        """
+        Build model item configuration from a catalog entry.
+        
+        An entry that cannot be parsed is left out, as for an unknown model.
+        
+        Args:
+            model (str): Model ID.
+            model_obj (Optional[Any]): Model object, or None if unknown.
+        
+        Returns:
+            Dict: Model item configuration.
+        """
+        model_item = {
+            "id": model,
+            "name": model_obj.name if model_obj else model
+        }
+        
+        if model_obj:
+            try:
+                details = {
                     "owned_by": model_obj.owned_by,
                     "openai": model_obj.openai,
                     "urlIdx": model_obj.urlIdx,
@@ -151,23 +301,27 @@ class StreamingOperations:
                         "id": model_obj.info.id,
                         "name": model_obj.info.name,
                         "params": {
-                            "temperature": model_obj.info.params.temperature,
-                            "top_p": model_obj.info.params.top_p,
-                            "max_tokens": model_obj.info.params.max_tokens
+                            key: value for key, value in (
+                                ("temperature", model_obj.info.params.temperature),
+                                ("top_p", model_obj.info.params.top_p),
+                                ("max_tokens", model_obj.info.params.max_tokens)
+                            ) if value is not None
                         }
                     }
-                })
-            
-            return model_item
+                }
+            except (TypeError, KeyError, AttributeError, ValueError):
+                return {"id": model, "name": model}
+            model_item.update(details)
         
-        return {"id": model, "name": model}
+        return model_item
     
-    def _create_streaming_chunk(self, data: Dict[str, Any]) -> StreamingChunk:
+    def _create_streaming_chunk(self, data: Dict[str, Any], event_id: Optional[str] = None) -> StreamingChunk:
         """
         Create StreamingChunk from parsed data.
         
         Args:
             data (Dict[str, Any]): Parsed SSE data.
+            event_id (Optional[str]): SSE event id, if the upstream sent one.
         
         Returns:
             StreamingChunk: Created streaming chunk.
@@ -183,5 +337,6 @@ class StreamingOperations:
             edit_index=chunk_data.get("edit_index"),
             edit_content=chunk_data.get("edit_content"),
             role=chunk_data.get("role"),
-            message_id=chunk_data.get("message_id")
+            message_id=chunk_data.get("message_id"),
+            event_id=event_id
         )
\ No newline at end of file
@@ -1,7 +1,19 @@
 """Z.AI Utilities Module."""
 
-from .sse_parser import SSEParser
+from .json_codec import JSONCodec, get_codec, set_codec
+from .json_template import JSONTemplate, Slot
+from .sse_parser import SSEDecoder, SSEEvent, SSEEventParser, SSEParser, aiter_sse_data, iter_sse_data
 
 __all__ = [
-    "SSEParser"
+    "SSEParser",
+    "SSEDecoder",
+    "SSEEvent",
+    "SSEEventParser",
+    "iter_sse_data",
+    "aiter_sse_data",
+    "JSONCodec",
+    "get_codec",
+    "set_codec",
+    "JSONTemplate",
+    "Slot"
 ]
@@ -0,0 +1,56 @@
+"""Flask JSON provider backed by the SDK JSON codec (requires flask)."""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+from .json_codec import dumps, loads
+
+
+class CodecJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with the SDK JSON codec.
+    
+    ``jsonify`` bodies are built as bytes straight from the codec instead
+    of going through a str; types the codec cannot encode fall back to
+    Flask's default handling (dates, decimals, UUIDs, dataclasses).
+    """
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON text.
+        
+        Args:
+            obj (Any): Value to encode.
+            **kwargs: Ignored, kept for provider compatibility.
+        
+        Returns:
+            str: JSON text.
+        """
+        return dumps(obj, self.default).decode("utf-8")
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """
+        Deserialize JSON request data.
+        
+        Args:
+            s (Any): JSON text or bytes.
+            **kwargs: Ignored, kept for provider compatibility.
+        
+        Returns:
+            Any: Decoded value.
+        """
+        return loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        """
+        Build a JSON response without an intermediate str.
+        
+        Args:
+            *args: A single value, or several values to send as a list.
+            **kwargs: Values to send as an object.
+        
+        Returns:
+            flask.Response: Response with an application/json body.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj, self.default) + b"\n", mimetype=self.mimetype)
\ No newline at end of file
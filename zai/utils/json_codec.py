@@ -0,0 +1,142 @@
+"""JSON codec with an optional fast backend."""
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """JSON encoder/decoder backed by orjson when installed, stdlib json otherwise.
+    
+    Encoding always returns compact UTF-8 bytes so request bodies go to
+    the transport without an extra str round trip, and decoding accepts
+    bytes as read from the wire.
+    """
+    
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize codec.
+        
+        Args:
+            backend (Optional[str]): "orjson" or "json"; defaults to ZAI_JSON_BACKEND,
+                then to orjson if installed.
+        """
+        backend = backend or os.environ.get("ZAI_JSON_BACKEND") or ("orjson" if orjson else "json")
+        
+        if backend == "orjson":
+            if orjson is None:
+                raise ValueError("JSON backend 'orjson' requires the 'orjson' package: pip install orjson")
+            self.dumps = self._orjson_dumps
+            self.loads = orjson.loads
+        elif backend == "json":
+            self.dumps = self._json_dumps
+            self.loads = self._json_loads
+        else:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        
+        self.backend = backend
+    
+    @staticmethod
+    def _orjson_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """
+        Encode with orjson.
+        
+        Args:
+            obj (Any): Value to encode.
+            default (Optional[Callable]): Fallback for unsupported types.
+        
+        Returns:
+            bytes: Compact UTF-8 JSON.
+        """
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    
+    @staticmethod
+    def _json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """
+        Encode with the standard library.
+        
+        Args:
+            obj (Any): Value to encode.
+            default (Optional[Callable]): Fallback for unsupported types.
+        
+        Returns:
+            bytes: Compact JSON (ASCII, the fastest stdlib encoder path).
+        """
+        return json.dumps(obj, default=default, separators=(",", ":")).encode("ascii")
+    
+    @staticmethod
+    def _json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Decode with the standard library.
+        
+        Args:
+            data (Union[bytes, bytearray, memoryview, str]): JSON document.
+        
+        Returns:
+            Any: Decoded value.
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        if not isinstance(data, str):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+
+_codec = JSONCodec()
+
+
+def get_codec() -> JSONCodec:
+    """
+    Get the process-wide codec.
+    
+    Returns:
+        JSONCodec: Codec used by the SDK.
+    """
+    return _codec
+
+
+def set_codec(codec: JSONCodec):
+    """
+    Replace the process-wide codec.
+    
+    Args:
+        codec (JSONCodec): Codec to use from now on.
+    """
+    global _codec
+    _codec = codec
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Encode a value with the process-wide codec.
+    
+    Args:
+        obj (Any): Value to encode.
+        default (Optional[Callable]): Fallback for unsupported types.
+    
+    Returns:
+        bytes: Compact UTF-8 JSON.
+    """
+    return _codec.dumps(obj, default)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Decode a document with the process-wide codec.
+    
+    Args:
+        data (Union[bytes, bytearray, memoryview, str]): JSON document.
+    
+    Returns:
+        Any: Decoded value.
+    
+    Raises:
+        ValueError: If the document is not valid JSON (a json.JSONDecodeError
+            for both backends).
+    """
+    return _codec.loads(data)
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""JSON documents serialized once with named holes for per-request values."""
+
+import re
+import uuid
+from typing import Any, Dict, List
+
+from .json_codec import dumps
+
+
+class Slot:
+    """Placeholder for a value filled in when a template is rendered."""
+    
+    __slots__ = ("name",)
+    
+    def __init__(self, name: str):
+        """
+        Initialize slot.
+        
+        Args:
+            name (str): Name of the value to fill in.
+        """
+        self.name = name
+    
+    def __repr__(self) -> str:
+        return f"Slot({self.name!r})"
+
+
+def encode(value: Any) -> bytes:
+    """
+    Encode a value for splicing into JSON.
+    
+    Args:
+        value (Any): Value to encode; bytes are taken as encoded JSON and pass through.
+    
+    Returns:
+        bytes: Compact JSON.
+    """
+    if isinstance(value, bytes):
+        return value
+    return dumps(value)
+
+
+class JSONTemplate:
+    """A JSON document whose constant parts are encoded only once.
+    
+    Every Slot in the document becomes a hole. The rest is serialized
+    when the template is built and kept as byte fragments, so rendering
+    only encodes the slot values and joins the pieces.
+    """
+    
+    def __init__(self, document: Any):
+        """
+        Compile a template.
+        
+        Args:
+            document (Any): JSON-compatible value containing Slot placeholders.
+        """
+        token = uuid.uuid4().hex
+        names: List[str] = []
+        
+        def mark(value: Any) -> Any:
+            if isinstance(value, Slot):
+                names.append(value.name)
+                return f"{token}:{len(names) - 1}"
+            if isinstance(value, dict):
+                return {key: mark(item) for key, item in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [mark(item) for item in value]
+            return value
+        
+        pieces = re.split(b'"' + token.encode() + b':(\\d+)"', dumps(mark(document)))
+        self.fragments: List[bytes] = pieces[0::2]
+        self.slots: List[str] = [names[int(index)] for index in pieces[1::2]]
+    
+    def render(self, values: Dict[str, Any]) -> bytes:
+        """
+        Fill in the slots.
+        
+        Args:
+            values (Dict[str, Any]): Value for every slot name.
+        
+        Returns:
+            bytes: Encoded document.
+        """
+        fragments = self.fragments
+        parts = [fragments[0]]
+        for index, name in enumerate(self.slots):
+            parts.append(encode(values[name]))
+            parts.append(fragments[index + 1])
+        return b"".join(parts)
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Server-Sent Events parser."""
 
-import json
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
+
+from .json_codec import loads
 
 
 class SSEParser:
@@ -27,8 +29,332 @@ class SSEParser:
             
             if data_str.strip():
                 try:
-                    return json.loads(data_str)
-                except json.JSONDecodeError:
+                    return loads(data_str)
+                except ValueError:
                     return None
         
-        return None
\ No newline at end of file
+        return None
+    
+    def parse_data(self, payload: Union[bytes, str]) -> Optional[Dict[str, Any]]:
+        """
+        Parse the payload of an SSE data line.
+        
+        Args:
+            payload (Union[bytes, str]): Data payload from SSEDecoder.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Parsed data dictionary or None.
+        """
+        try:
+            return loads(payload)
+        except ValueError:
+            return None
+
+
+class SSEDecoder:
+    """Incremental byte-level decoder for Server-Sent Events data lines.
+    
+    Works on raw body chunks instead of decoded lines: complete lines are
+    split in one ``bytes.splitlines`` call, only ``data:`` lines are sliced
+    down to their payload and nothing is decoded to str, so the payload
+    goes to the JSON decoder untouched. Comment, keep-alive and other field
+    lines are dropped. A line split across chunks is kept in a reusable
+    buffer until its terminator arrives.
+    """
+    
+    def __init__(self):
+        """Initialize decoder with an empty buffer."""
+        self._buffer = bytearray()
+    
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Decode one body chunk.
+        
+        Args:
+            chunk (bytes): Raw body bytes.
+        
+        Returns:
+            List[bytes]: Data payloads of the lines completed by this chunk.
+        """
+        buffer = self._buffer
+        if buffer:
+            buffer += chunk
+            if b"\n" not in chunk:
+                return []
+            data = bytes(buffer)
+            buffer.clear()
+        else:
+            data = chunk
+        
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            buffer += memoryview(data)[end:]
+            if not end:
+                return []
+            data = data[:end]
+        
+        payloads = []
+        for line in data.splitlines():
+            if line[:5] == b"data:":
+                payload = line[6:] if line[5:6] == b" " else line[5:]
+                if payload:
+                    payloads.append(payload)
+        return payloads
+    
+    def flush(self) -> List[bytes]:
+        """
+        Decode whatever is left once the body ended without a final newline.
+        
+        Returns:
+            List[bytes]: Data payload of the trailing line, if any.
+        """
+        if not self._buffer:
+            return []
+        
+        data = bytes(self._buffer) + b"\n"
+        self._buffer.clear()
+        return self.feed(data)
+    
+    def iter_data(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decode a stream of body chunks.
+        
+        Args:
+            chunks (Iterable[bytes]): Raw body chunks.
+        
+        Yields:
+            bytes: Data payloads in order.
+        """
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.flush()
+    
+    async def aiter_data(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """
+        Decode an async stream of body chunks.
+        
+        Args:
+            chunks (AsyncIterable[bytes]): Raw body chunks.
+        
+        Yields:
+            bytes: Data payloads in order.
+        """
+        async for chunk in chunks:
+            for payload in self.feed(chunk):
+                yield payload
+        for payload in self.flush():
+            yield payload
+
+
+@dataclass
+class SSEEvent:
+    """Server-Sent Event."""
+    
+    data: bytes
+    event: str = "message"
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class SSEEventParser:
+    """Incremental Server-Sent Events parser following the event stream format.
+    
+    Handles ``event:``, ``id:``, ``retry:`` and multi-line ``data:`` fields,
+    comments, fields without a colon, CR, LF and CRLF line endings and a
+    leading BOM. Fields are parsed in bytes and event data stays bytes, so
+    it goes to the JSON decoder untouched like SSEDecoder payloads. Only
+    the bytes after the last line terminator are kept between chunks. The
+    last event id and the reconnection time outlive a single response so
+    a dropped stream can be resumed with Last-Event-ID.
+    """
+    
+    def __init__(self, last_event_id: Optional[str] = None):
+        """
+        Initialize parser.
+        
+        Args:
+            last_event_id (Optional[str]): Last event id of a previous connection.
+        """
+        self.last_event_id = last_event_id
+        self.retry: Optional[int] = None
+        self._id = last_event_id
+        self._buffer = bytearray()
+        self._started = False
+        self._skip_lf = False
+        self._event_type = ""
+        self._data: List[bytes] = []
+    
+    def reset(self):
+        """Drop partial input before reading a new connection, keeping last_event_id and retry."""
+        self._buffer.clear()
+        self._started = False
+        self._skip_lf = False
+        self._event_type = ""
+        self._data = []
+    
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """
+        Parse one body chunk.
+        
+        Args:
+            chunk (bytes): Raw body bytes.
+        
+        Returns:
+            List[SSEEvent]: Events completed by this chunk.
+        """
+        # A CR ending the previous chunk already ended its line; an LF
+        # right after it is the second half of that CRLF
+        if self._skip_lf and chunk:
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        
+        buffer = self._buffer
+        buffer += chunk
+        
+        if not self._started:
+            if len(buffer) < 3 and b"\xef\xbb\xbf".startswith(buffer):
+                return []
+            self._started = True
+            if buffer.startswith(b"\xef\xbb\xbf"):
+                del buffer[:3]
+            chunk = buffer
+        
+        if b"\n" not in chunk and b"\r" not in chunk:
+            return []
+        
+        end = max(buffer.rfind(b"\n"), buffer.rfind(b"\r")) + 1
+        data = bytes(buffer[:end])
+        del buffer[:end]
+        self._skip_lf = data[-1:] == b"\r"
+        
+        events = []
+        for line in data.splitlines():
+            event = self._process_line(line)
+            if event:
+                events.append(event)
+        return events
+    
+    def flush(self) -> List[SSEEvent]:
+        """
+        Finish the stream once the body ended.
+        
+        A trailing line without a terminator is applied, and an event
+        still missing its blank line is dispatched, so the last event of
+        a stream that was cut short is not lost.
+        
+        Returns:
+            List[SSEEvent]: The last event, if one was pending.
+        """
+        events = []
+        if self._buffer:
+            line = bytes(self._buffer)
+            self._buffer.clear()
+            if not self._started and line.startswith(b"\xef\xbb\xbf"):
+                line = line[3:]
+            event = self._process_line(line)
+            if event:
+                events.append(event)
+        
+        event = self._dispatch() if self._data else None
+        if event:
+            events.append(event)
+        return events
+    
+    def iter_events(self, chunks: Iterable[bytes]) -> Iterator[SSEEvent]:
+        """
+        Parse a stream of body chunks.
+        
+        Args:
+            chunks (Iterable[bytes]): Raw body chunks.
+        
+        Yields:
+            SSEEvent: Events in order, the last one flushed when the body ends.
+        """
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.flush()
+    
+    def _process_line(self, line: bytes) -> Optional[SSEEvent]:
+        """
+        Apply one line to the pending event.
+        
+        Args:
+            line (bytes): Line without its terminator.
+        
+        Returns:
+            Optional[SSEEvent]: The event dispatched by a blank line, if any.
+        """
+        if not line:
+            return self._dispatch()
+        
+        if line[:1] == b":":
+            return None
+        
+        field, _, value = line.partition(b":")
+        if value[:1] == b" ":
+            value = value[1:]
+        
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event_type = value.decode("utf-8", "replace")
+        elif field == b"id":
+            if b"\0" not in value:
+                self._id = value.decode("utf-8", "replace")
+        elif field == b"retry":
+            if value.isdigit():
+                self.retry = int(value)
+        
+        return None
+    
+    def _dispatch(self) -> Optional[SSEEvent]:
+        """
+        Finish the pending event at a blank line.
+        
+        Returns:
+            Optional[SSEEvent]: The event, or None when it carried no data.
+        """
+        self.last_event_id = self._id
+        
+        if not self._data:
+            self._event_type = ""
+            return None
+        
+        event = SSEEvent(
+            data=b"\n".join(self._data),
+            event=self._event_type or "message",
+            id=self._id,
+            retry=self.retry
+        )
+        self._event_type = ""
+        self._data = []
+        return event
+
+
+def iter_sse_data(response, chunk_size: int = 8192) -> Iterator[bytes]:
+    """
+    Iterate over the data payloads of a streaming response.
+    
+    Args:
+        response: Streaming requests.Response or HTTP2Response.
+        chunk_size (int): Size of the raw reads.
+    
+    Yields:
+        bytes: Data payloads, ready for a JSON decoder.
+    """
+    return SSEDecoder().iter_data(response.iter_content(chunk_size))
+
+
+async def aiter_sse_data(response) -> AsyncIterator[bytes]:
+    """
+    Iterate over the data payloads of a streaming httpx response.
+    
+    Args:
+        response (httpx.Response): Open streaming response.
+    
+    Yields:
+        bytes: Data payloads, ready for a JSON decoder.
+    """
+    async for payload in SSEDecoder().aiter_data(response.aiter_bytes()):
+        yield payload
\ No newline at end of file